@@ -1,8 +1,36 @@
 """AI-powered analysis and remediation suggestions."""
 
-from .summarizer import Summarizer
-from .fixer import Fixer
-from .triage import TriageEngine
-from .provider import create_provider, detect_provider, AIProvider
+from importlib import import_module
 
-__all__ = ["Summarizer", "Fixer", "TriageEngine", "create_provider", "detect_provider", "AIProvider"]
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing yavs.ai does not pull in provider, asyncio or SDK machinery
+# for commands that never use AI features.
+_LAZY_ATTRS = {
+    "Summarizer": ".summarizer",
+    "Fixer": ".fixer",
+    "TriageEngine": ".triage",
+    "create_provider": ".provider",
+    "detect_provider": ".provider",
+    "AIProvider": ".provider",
+    "LLMCache": ".cache",
+    "create_cache": ".cache",
+}
+
+__all__ = [
+    "Summarizer", "Fixer", "TriageEngine", "create_provider", "detect_provider", "AIProvider",
+    "LLMCache", "create_cache",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,153 @@
+"""Persistent response cache for deterministic AI completions."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..utils.logging import LoggerMixin
+
+DEFAULT_CACHE_PATH = Path.home() / ".yavs" / "cache" / "ai-responses.sqlite3"
+DEFAULT_TTL = 86400  # 24 hours
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class LLMCache(LoggerMixin):
+    """
+    Content-addressed cache of AI completions backed by SQLite.
+
+    Only deterministic (temperature=0) calls should be cached: identical
+    prompts then produce identical responses, so repeat scans can skip the
+    API round-trip entirely. Cache errors are logged and treated as misses.
+
+    Expired entries, and the entries closest to expiry beyond max_entries,
+    are pruned when the database is opened. Deleting the file clears the
+    cache.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: int = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite database file (default: ~/.yavs/cache/ai-responses.sqlite3)
+            ttl: Default time-to-live for entries in seconds
+            max_entries: Entries kept when the database is opened
+        """
+        self.path = Path(path).expanduser() if path else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.max_entries = max(0, max_entries)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, max_tokens: int) -> str:
+        """
+        Build the cache key for a completion request.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            prompt: Prompt text
+            max_tokens: Maximum tokens for response
+
+        Returns:
+            SHA-256 hex digest identifying the request
+        """
+        payload = json.dumps(
+            {"provider": provider, "model": model, "prompt": prompt, "max_tokens": max_tokens},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, pruning expired and excess entries."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.debug("AI cache read failed: %s", e)
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response text
+            ttl: Time-to-live in seconds (default: cache ttl)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            self.logger.debug("AI cache write failed: %s", e)
+
+
+def create_cache(cache_config: Optional[Dict[str, Any]] = None) -> Optional[LLMCache]:
+    """
+    Create an AI response cache from the ai.cache config section.
+
+    Args:
+        cache_config: Dict with 'enabled', 'path', 'ttl' and 'max_entries' keys
+
+    Returns:
+        LLMCache instance, or None when caching is disabled
+    """
+    cache_config = cache_config or {}
+    if not cache_config.get("enabled", True):
+        return None
+
+    return LLMCache(
+        path=cache_config.get("path"),
+        ttl=cache_config.get("ttl", DEFAULT_TTL),
+        max_entries=cache_config.get("max_entries", DEFAULT_MAX_ENTRIES)
+    )
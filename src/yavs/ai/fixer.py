@@ -1,14 +1,176 @@
 """AI-powered fix suggestion generator with multi-provider support."""
 
-import os
 import time
+import json
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from contextlib import asynccontextmanager
+from itertools import islice
 from typing import List, Dict, Any, Optional
 
 from .provider import create_provider, AIProvider
+from .cache import LLMCache
 from ..utils.logging import LoggerMixin
 
+# Severities that receive AI fix suggestions
+FIX_SEVERITIES = frozenset(("CRITICAL", "HIGH"))
+
+# Upper bound on a batched response's max_tokens (the smallest output limit
+# among the supported default models); fuller batches are split on truncation
+BATCH_MAX_TOKENS = 16384
+
+# Per-finding details shared by the single and batched fix prompts
+FIX_FINDING_TEMPLATE = """**Finding:** %(severity)s - %(message)s
+**File:** %(file_path)s
+**Rule:** %(rule_id)s
+**Context:** %(context)s"""
+
+FIX_FORMAT_INSTRUCTIONS = """### Fix
+One sentence explaining what to do.
+
+### Implementation
+ALL code/commands MUST be in markdown code blocks with language tags.
+
+Example format:
+```python
+# Your code here
+```
+
+Or for shell:
+```bash
+command here
+```
+
+### Verification
+One sentence on how to verify."""
+
+# Static fix prompt; only the %-placeholders change per finding
+FIX_PROMPT_TEMPLATE = """You are a security engineer. Provide a BRIEF remediation guide in markdown.
+
+""" + FIX_FINDING_TEMPLATE + """
+
+Format your response EXACTLY like this:
+
+""" + FIX_FORMAT_INSTRUCTIONS + """
+
+CRITICAL REQUIREMENTS:
+- ALL code MUST be in ```language code blocks
+- Maximum 100 words total
+- NO emojis
+- NO prose before/after code blocks"""
+
+# Several findings in one request; the model answers with a JSON array keyed by finding number
+BATCH_FIX_PROMPT_TEMPLATE = """You are a security engineer. Provide a BRIEF remediation guide in markdown for EACH of the %(count)d findings below.
+
+%(findings)s
+
+Respond with ONLY a JSON array containing one object per finding, no prose before or after:
+[{"id": 1, "fix": "<markdown remediation guide>"}, {"id": 2, "fix": "..."}]
+
+Format each "fix" value EXACTLY like this:
+
+""" + FIX_FORMAT_INSTRUCTIONS + """
+
+CRITICAL REQUIREMENTS:
+- ALL code MUST be in ```language code blocks
+- Maximum 100 words per fix
+- NO emojis
+- The response MUST be valid JSON (escape newlines and quotes inside "fix")"""
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Roughly estimate the token count of text (~4 characters per token).
+
+    Only used to pace requests against the TPM budget, so a character
+    heuristic is precise enough. Unlike a real tokenizer it needs no extra
+    dependency and holds no shared encoder state, so concurrent requests
+    never serialize on it.
+    """
+    return len(text) // 4 + 1
+
+
+def _parse_batch_response(text: str, count: int) -> Dict[int, str]:
+    """
+    Parse a batched fix response into fixes keyed by finding number.
+
+    Tolerates a surrounding markdown code fence or stray prose around the
+    array. Entries with an unknown id or a non-string fix are dropped, and a
+    malformed or truncated response yields an empty dict.
+
+    Args:
+        text: Raw model response
+        count: Number of findings in the batch
+
+    Returns:
+        Mapping of 1-based finding number to fix text
+    """
+    start = text.find("[")
+    end = text.rfind("]")
+    if start == -1 or end < start:
+        return {}
+
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    fixes = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        finding_id = item.get("id")
+        fix = item.get("fix")
+        if isinstance(finding_id, int) and 1 <= finding_id <= count and isinstance(fix, str) and fix:
+            fixes[finding_id] = fix
+    return fixes
+
+
+class _TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Acquiring never blocks: the cost is reserved immediately (the balance may
+    go negative) and the caller is told how long to wait before using it, so
+    concurrent callers are spaced out instead of all sleeping at once.
+    A rate of 0 or None disables the limit.
+    """
+
+    def __init__(self, per_minute: Optional[float]):
+        self.capacity = float(per_minute or 0)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """
+        Reserve tokens from the bucket.
+
+        Args:
+            cost: Number of tokens to take
+
+        Returns:
+            Seconds to wait before the reserved tokens are available
+        """
+        if self.capacity <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate
+            )
+            self.last_refill = now
+            self.tokens -= cost
+
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_rate
+
 
 class Fixer(LoggerMixin):
     """
@@ -33,7 +195,9 @@ class Fixer(LoggerMixin):
         temperature: float = 0.0,
         parallel_requests: int = 5,
         rate_limit_rpm: int = 50,
-        rate_limit_tpm: int = 40000
+        rate_limit_tpm: int = 40000,
+        cache: Optional[LLMCache] = None,
+        batch_size: int = 1
     ):
         """
         Initialize fixer.
@@ -45,19 +209,22 @@ class Fixer(LoggerMixin):
             max_tokens: Maximum tokens for response
             temperature: Sampling temperature
             parallel_requests: Number of parallel requests (1-10)
-            rate_limit_rpm: Requests per minute limit
-            rate_limit_tpm: Tokens per minute limit
+            rate_limit_rpm: Requests per minute limit (0 or None for no limit)
+            rate_limit_tpm: Tokens per minute limit (0 or None for no limit)
+            cache: Response cache for deterministic (temperature=0) requests
+            batch_size: Findings answered per request (default 1, no batching)
         """
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.parallel_requests = min(max(1, parallel_requests), 10)  # Clamp to 1-10
         self.rate_limit_rpm = rate_limit_rpm
         self.rate_limit_tpm = rate_limit_tpm
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
 
         # Rate limiting tracking
-        self.request_times = []
-        self.token_count = 0
-        self.last_token_reset = time.time()
+        self._request_bucket = _TokenBucket(self.rate_limit_rpm)
+        self._token_bucket = _TokenBucket(self.rate_limit_tpm)
 
         # Create provider
         self.provider: AIProvider = create_provider(
@@ -86,69 +253,258 @@ class Fixer(LoggerMixin):
         Returns:
             Fix suggestion text
         """
-        self.logger.debug(f"Generating fix for: {finding.get('message')}")
+        self.logger.debug("Generating fix for: %s", finding.get("message"))
 
         prompt = self._build_fix_prompt(finding)
 
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             fix_text = self.provider.create_completion(
                 prompt=prompt,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
-            return fix_text
 
         except Exception as e:
-            self.logger.error(f"Failed to generate fix: {str(e)}")
+            self.logger.error("Failed to generate fix: %s", e)
             return f"Unable to generate fix: {str(e)}"
 
-    def _wait_for_rate_limit(self):
-        """Wait if necessary to respect rate limits."""
-        current_time = time.time()
+        if cache_key:
+            self.cache.set(cache_key, fix_text)
+        return fix_text
+
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """Get the response cache key for a prompt, or None if caching does not apply."""
+        if self.cache is None or self.temperature != 0:
+            return None
+        return LLMCache.make_key(
+            self.provider.provider_name,
+            self.provider.model_name,
+            prompt,
+            self.max_tokens
+        )
 
-        # Clean up old request times (older than 1 minute)
-        self.request_times = [t for t in self.request_times if current_time - t < 60]
+    async def agenerate_fix(self, finding: Dict[str, Any]) -> str:
+        """
+        Generate a fix suggestion for a single finding without blocking.
 
-        # Check if we're at the rate limit
-        if len(self.request_times) >= self.rate_limit_rpm:
-            # Wait until the oldest request is more than 1 minute old
-            oldest_time = self.request_times[0]
-            wait_time = 60 - (current_time - oldest_time)
-            if wait_time > 0:
-                self.logger.debug(f"Rate limit reached, waiting {wait_time:.1f}s")
-                time.sleep(wait_time)
+        Args:
+            finding: Normalized finding dictionary
+
+        Returns:
+            Fix suggestion text
+        """
+        self.logger.debug("Generating fix for: %s", finding.get("message"))
+
+        return await self._acomplete(self._build_fix_prompt(finding))
+
+    async def _acomplete(self, prompt: str) -> str:
+        """Send a fix prompt to the provider, returning an error message on failure."""
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            fix_text = await self.provider.acreate_completion(
+                prompt=prompt,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            )
+
+        except Exception as e:
+            self.logger.error("Failed to generate fix: %s", e)
+            return f"Unable to generate fix: {str(e)}"
 
-        # Record this request
-        self.request_times.append(time.time())
+        if cache_key:
+            self.cache.set(cache_key, fix_text)
+        return fix_text
 
-    def _generate_fix_with_rate_limit(self, finding: Dict[str, Any]) -> Dict[str, Any]:
+    async def _wait_for_rate_limit(self, estimated_tokens: int):
         """
-        Generate fix for a single finding with rate limiting.
+        Wait if necessary to respect rate limits.
 
         Args:
-            finding: Finding dictionary
+            estimated_tokens: Prompt plus completion tokens this request may use
+        """
+        wait_time = max(
+            self._request_bucket.reserve(),
+            self._token_bucket.reserve(estimated_tokens)
+        )
+        if wait_time > 0:
+            self.logger.debug("Rate limit reached, waiting %.1fs", wait_time)
+            await asyncio.sleep(wait_time)
 
-        Returns:
-            Finding with ai_fix added
+    @asynccontextmanager
+    async def _throttle(self, semaphore: asyncio.Semaphore, estimated_tokens: int):
         """
-        self._wait_for_rate_limit()
+        Hold a concurrency slot and wait for rate-limit budget for one request.
+
+        Rate-limit budget is reserved per request *inside* the slot, so each
+        call is paced individually rather than reserving for requests that are
+        still queued behind the concurrency limit.
 
-        severity = finding.get("severity", "").upper()
-        if severity in ["CRITICAL", "HIGH"]:
-            fix = self.generate_fix(finding)
+        Args:
+            semaphore: Bounds the number of in-flight requests
+            estimated_tokens: Prompt plus completion tokens this request may use
+        """
+        async with semaphore:
+            await self._wait_for_rate_limit(estimated_tokens)
+            yield
+
+    async def _generate_fix_with_rate_limit(
+        self,
+        prompt: str,
+        group: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Generate one fix with rate limiting and apply it to every finding sharing the prompt.
+
+        The finding dicts are updated in place with the ai_fix fields.
+
+        Args:
+            prompt: Fix prompt shared by all findings in the group
+            group: Findings that produce this prompt
+            semaphore: Bounds the number of in-flight requests
+        """
+        self.logger.debug("Generating fix for: %s", group[0].get("message"))
+
+        async with self._throttle(semaphore, _estimate_tokens(prompt) + self.max_tokens):
+            fix = await self._acomplete(prompt)
+
+        self._apply_fix(group, fix)
+
+    def _apply_fix(self, group: List[Dict[str, Any]], fix: str) -> None:
+        """Set the ai_fix fields on every finding in a prompt group."""
+        for finding in group:
             finding["ai_fix"] = fix
             finding["ai_provider"] = self.provider.provider_name
             finding["ai_model"] = self.provider.model_name
 
-        return finding
+    async def _generate_fix_batch(
+        self,
+        prompts: List[str],
+        groups: Dict[str, List[Dict[str, Any]]],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Generate fixes for several prompt groups with a single request.
 
-    def generate_fixes_batch(
+        The response may use max_tokens for each finding in the batch. Findings
+        it does not cover (malformed JSON, output truncated) are retried in
+        batches of half the size, down to the single-finding prompt. A failed
+        request is not split: provider errors are already retried by the
+        provider, and smaller batches would only repeat a rejected request.
+
+        Args:
+            prompts: Fix prompts to answer in this batch
+            groups: Findings keyed by prompt (updated in place)
+            semaphore: Bounds the number of in-flight requests
+        """
+        if len(prompts) == 1:
+            await self._generate_fix_with_rate_limit(prompts[0], groups[prompts[0]], semaphore)
+            return
+
+        batch_prompt = self._build_batch_fix_prompt([groups[prompt][0] for prompt in prompts])
+        self.logger.debug("Generating fixes for a batch of %d findings", len(prompts))
+
+        max_tokens = min(self.max_tokens * len(prompts), BATCH_MAX_TOKENS)
+        async with self._throttle(semaphore, _estimate_tokens(batch_prompt) + max_tokens):
+            try:
+                response = await self.provider.acreate_completion(
+                    prompt=batch_prompt,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature
+                )
+            except Exception as e:
+                self.logger.warning("Failed to generate fixes for a batch of %d findings: %s", len(prompts), e)
+                for prompt in prompts:
+                    self._apply_fix(groups[prompt], f"Unable to generate fix: {str(e)}")
+                return
+
+        fixes = _parse_batch_response(response, len(prompts))
+        missing = []
+        for number, prompt in enumerate(prompts, 1):
+            fix = fixes.get(number)
+            if fix is None:
+                missing.append(prompt)
+                continue
+
+            self._apply_fix(groups[prompt], fix)
+            # Cache under the single-finding key so either path can reuse it
+            cache_key = self._cache_key(prompt)
+            if cache_key:
+                self.cache.set(cache_key, fix)
+
+        if missing:
+            self.logger.debug(
+                "Batch response covered %d/%d findings, retrying %d in smaller batches",
+                len(prompts) - len(missing), len(prompts), len(missing)
+            )
+            size = max(1, len(prompts) // 2)
+            await asyncio.gather(
+                *(
+                    self._generate_fix_batch(missing[i:i + size], groups, semaphore)
+                    for i in range(0, len(missing), size)
+                )
+            )
+
+    async def _agather(self, groups: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Run fix generation for all prompt groups concurrently.
+
+        Prompt groups already in the response cache are filled in directly;
+        the rest are sent in batches of batch_size findings per request.
+
+        Args:
+            groups: Findings to generate fixes for (updated in place), keyed by prompt
+        """
+        pending = []
+        for prompt, group in groups.items():
+            cache_key = self._cache_key(prompt)
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                self._apply_fix(group, cached)
+            else:
+                pending.append(prompt)
+
+        if not pending:
+            return
+
+        semaphore = asyncio.Semaphore(self.parallel_requests)
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._generate_fix_batch(pending[i:i + self.batch_size], groups, semaphore)
+                    for i in range(0, len(pending), self.batch_size)
+                ),
+                return_exceptions=True
+            )
+        finally:
+            await self.provider.aclose()
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Failed to generate fix for finding: %s", result)
+
+    async def agenerate_fixes_batch(
         self,
         findings: List[Dict[str, Any]],
         limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Generate fixes for multiple findings using parallel processing.
+        Generate fixes for multiple findings using concurrent async requests.
+
+        Findings are updated in place; the same list is returned. Findings
+        that produce an identical prompt share one fix, and up to batch_size
+        distinct findings are answered by a single request.
 
         Args:
             findings: List of findings
@@ -157,58 +513,65 @@ class Fixer(LoggerMixin):
         Returns:
             List of findings with added 'ai_fix' field
         """
-        findings_to_fix = findings[:limit] if limit else findings
-
-        # Filter to high/critical severity
+        # Filter to high/critical severity within the limit (no intermediate slice)
         critical_findings = [
-            f for f in findings_to_fix
-            if f.get("severity", "").upper() in ["CRITICAL", "HIGH"]
+            f for f in islice(findings, limit or None)
+            if f.get("severity", "").upper() in FIX_SEVERITIES
         ]
 
-        self.logger.info(f"Generating fixes for {len(critical_findings)} critical/high findings")
+        self.logger.info("Generating fixes for %d critical/high findings", len(critical_findings))
 
         if not critical_findings:
             return findings
 
-        # Create a mapping to track which findings need fixes
-        findings_needing_fixes = set(id(f) for f in critical_findings)
-
-        # Use ThreadPoolExecutor for parallel processing
-        enhanced_critical = []
-        with ThreadPoolExecutor(max_workers=self.parallel_requests) as executor:
-            # Submit all critical findings for processing
-            future_to_finding = {
-                executor.submit(self._generate_fix_with_rate_limit, finding): finding
-                for finding in critical_findings
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_finding):
-                try:
-                    enhanced_finding = future.result()
-                    enhanced_critical.append(enhanced_finding)
-                except Exception as e:
-                    finding = future_to_finding[future]
-                    self.logger.error(f"Failed to generate fix for finding: {str(e)}")
-                    enhanced_critical.append(finding)  # Add without fix
-
-        # Build final list with all findings
-        enhanced_findings = []
-        for finding in findings:
-            if id(finding) in findings_needing_fixes:
-                # Find the enhanced version
-                enhanced = next(
-                    (f for f in enhanced_critical if id(f) == id(finding)),
-                    finding
-                )
-                enhanced_findings.append(enhanced)
-            else:
-                enhanced_findings.append(finding)
+        # Group duplicates (e.g. the same issue reported by several scanners) by prompt
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for finding in critical_findings:
+            groups.setdefault(self._build_fix_prompt(finding), []).append(finding)
+
+        if len(groups) < len(critical_findings):
+            self.logger.debug(
+                "Deduplicated %d findings into %d fix requests", len(critical_findings), len(groups)
+            )
+
+        await self._agather(groups)
+
+        return findings
+
+    def generate_fixes_batch(
+        self,
+        findings: List[Dict[str, Any]],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate fixes for multiple findings using parallel processing.
+
+        Args:
+            findings: List of findings
+            limit: Maximum number of fixes to generate (None for all)
 
-        return enhanced_findings
+        Returns:
+            List of findings with added 'ai_fix' field
+        """
+        return asyncio.run(self.agenerate_fixes_batch(findings, limit=limit))
 
     def _build_fix_prompt(self, finding: Dict[str, Any]) -> str:
         """Build prompt for fix generation."""
+        return FIX_PROMPT_TEMPLATE % self._fix_prompt_fields(finding)
+
+    def _build_batch_fix_prompt(self, findings: List[Dict[str, Any]]) -> str:
+        """Build one prompt asking for fixes to several findings, numbered 1..N."""
+        sections = [
+            f"## Finding {number}\n" + FIX_FINDING_TEMPLATE % self._fix_prompt_fields(finding)
+            for number, finding in enumerate(findings, 1)
+        ]
+        return BATCH_FIX_PROMPT_TEMPLATE % {
+            "count": len(findings),
+            "findings": "\n\n".join(sections),
+        }
+
+    def _fix_prompt_fields(self, finding: Dict[str, Any]) -> Dict[str, str]:
+        """Extract the prompt placeholder values for a finding."""
         category = finding.get("category", "unknown")
         severity = finding.get("severity", "UNKNOWN")
         message = finding.get("message", "Security issue")
@@ -238,41 +601,13 @@ class Fixer(LoggerMixin):
 
         context = "\n".join(context_parts) if context_parts else "No additional context"
 
-        prompt = f"""You are a security engineer. Provide a BRIEF remediation guide in markdown.
-
-**Finding:** {severity} - {message}
-**File:** {file_path}
-**Rule:** {rule_id}
-**Context:** {context}
-
-Format your response EXACTLY like this:
-
-### Fix
-One sentence explaining what to do.
-
-### Implementation
-ALL code/commands MUST be in markdown code blocks with language tags.
-
-Example format:
-```python
-# Your code here
-```
-
-Or for shell:
-```bash
-command here
-```
-
-### Verification
-One sentence on how to verify.
-
-CRITICAL REQUIREMENTS:
-- ALL code MUST be in ```language code blocks
-- Maximum 100 words total
-- NO emojis
-- NO prose before/after code blocks"""
-
-        return prompt
+        return {
+            "severity": severity,
+            "message": message,
+            "file_path": file_path,
+            "rule_id": rule_id,
+            "context": context,
+        }
 
     def get_provider_info(self) -> Dict[str, str]:
         """Get provider information for metadata."""
@@ -1,13 +1,150 @@
 """AI provider abstraction for multi-model support."""
 
+import asyncio
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Connection pool shared by every provider SDK client in the process
+HTTP_POOL_LIMITS = {"max_keepalive_connections": 20, "max_connections": 40}
+HTTP_TIMEOUT_SECONDS = 600.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# Retry policy for transient API failures (rate limits, overload, 5xx).
+# Same budget as the SDKs' built-in default: two retries with computed
+# backoff of at most 8s, while a server-sent Retry-After of up to 60s is
+# honoured as-is. Fix generation already fans out over parallel requests,
+# so a longer per-request budget multiplies into minutes of waiting.
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8.0
+RETRY_AFTER_MAX_SECONDS = 60.0
+
+_http_client = None
+_async_http_client = None
+_async_http_loop = None
+_http_client_lock = threading.Lock()
+
+# Provider instances reused across Fixer, TriageEngine and Summarizer
+_provider_instances: Dict[Tuple, "AIProvider"] = {}
+_provider_instances_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the optional h2 package)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_shared_http_client():
+    """
+    Get the process-wide HTTP client used by synchronous SDK clients.
+
+    Sharing one pool lets the fixer, triage engine and summarizer reuse
+    TLS connections instead of each opening their own.
+
+    Returns:
+        httpx.Client instance
+    """
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                limits=httpx.Limits(**HTTP_POOL_LIMITS),
+                timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+                follow_redirects=True,
+                http2=_http2_available()
+            )
+        return _http_client
+
+
+def get_shared_async_http_client():
+    """
+    Get the HTTP client used by async SDK clients on the running event loop.
+
+    Async connections are bound to the loop that opened them, so a new
+    client is created whenever a different loop asks for one.
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    global _async_http_client, _async_http_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_http_client is None or _async_http_loop is not loop:
+        import httpx
+
+        # With HTTP/2, concurrent fix requests multiplex over one connection
+        # instead of each opening its own TLS session
+        _async_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(**HTTP_POOL_LIMITS),
+            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+            follow_redirects=True,
+            http2=_http2_available()
+        )
+        _async_http_loop = loop
+    return _async_http_client
+
+
+async def close_shared_async_http_client() -> None:
+    """Close the async HTTP client before its event loop shuts down."""
+    global _async_http_client, _async_http_loop
+
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+        _async_http_loop = None
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    """
+    Read the server-requested retry delay from response headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping from the SDK)
+
+    Returns:
+        Delay in seconds, or None if no usable header was sent
+    """
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
@@ -17,6 +154,75 @@ class AIProvider(ABC):
         """Create a text completion."""
         pass
 
+    async def acreate_completion(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """
+        Create a text completion without blocking the event loop.
+
+        Providers without a native async client fall back to running
+        create_completion in a worker thread.
+        """
+        return await asyncio.to_thread(self.create_completion, prompt, max_tokens, temperature)
+
+    async def aclose(self) -> None:
+        """Release async resources bound to the running event loop."""
+        pass
+
+    # Connection-level SDK errors worth retrying; set by concrete providers
+    retryable_errors: Tuple[type, ...] = ()
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Check whether an API error is transient."""
+        if isinstance(error, self.retryable_errors):
+            return True
+        return getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying.
+
+        Honors retry-after-ms or Retry-After (seconds or an HTTP date) when
+        the server asks for a wait of up to RETRY_AFTER_MAX_SECONDS, like the
+        SDKs do; otherwise uses exponential backoff with full jitter.
+
+        Args:
+            error: The error that triggered the retry
+            attempt: Zero-based attempt number that failed
+
+        Returns:
+            Delay in seconds
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        retry_after = _parse_retry_after(headers)
+        if retry_after is not None and 0 <= retry_after <= RETRY_AFTER_MAX_SECONDS:
+            return retry_after
+
+        backoff = min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * (2 ** attempt))
+        return random.uniform(0, backoff)  # nosec B311 - jitter, not security-sensitive
+
+    def _call_with_retry(self, func, *args, **kwargs):
+        """Call func, retrying transient API errors with backoff."""
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt == RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.debug("%s request failed (%s), retrying in %.1fs", self.provider_name, e, delay)
+                time.sleep(delay)
+
+    async def _acall_with_retry(self, func, *args, **kwargs):
+        """Await func, retrying transient API errors with backoff."""
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if attempt == RETRY_MAX_ATTEMPTS - 1 or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.debug("%s request failed (%s), retrying in %.1fs", self.provider_name, e, delay)
+                await asyncio.sleep(delay)
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -34,7 +240,7 @@ class AnthropicProvider(AIProvider):
     """Anthropic Claude provider."""
 
     def __init__(self, model: str = "claude-sonnet-4-5-20250929", api_key: Optional[str] = None):
-        from anthropic import Anthropic
+        from anthropic import Anthropic, APIConnectionError
 
         self.model = model
         api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
@@ -44,18 +250,59 @@ class AnthropicProvider(AIProvider):
                 "Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable."
             )
 
-        self.client = Anthropic(api_key=api_key)
-        logger.info(f"Initialized Anthropic provider with model: {model}")
+        # Retries are handled by _call_with_retry, so disable the SDK's own
+        self.client = Anthropic(
+            api_key=api_key,
+            http_client=get_shared_http_client(),
+            max_retries=0
+        )
+        self.retryable_errors = (APIConnectionError,)
+        self._api_key = api_key
+        self._async_client = None
+        logger.info("Initialized Anthropic provider with model: %s", model)
 
     def create_completion(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Create completion using Claude."""
-        response = self.client.messages.create(
+        return self._call_with_retry(
+            self._stream_text,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+    def _stream_text(self, **kwargs) -> str:
+        """Stream a message and return its text once complete."""
+        with self.client.messages.stream(**kwargs) as stream:
+            return stream.get_final_text()
+
+    async def acreate_completion(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Create completion using Claude's async client."""
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(
+                api_key=self._api_key,
+                http_client=get_shared_async_http_client(),
+                max_retries=0
+            )
+
+        return await self._acall_with_retry(
+            self._astream_text,
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
             messages=[{"role": "user", "content": prompt}]
         )
-        return response.content[0].text
+
+    async def _astream_text(self, **kwargs) -> str:
+        """Stream a message with the async client and return its text once complete."""
+        async with self._async_client.messages.stream(**kwargs) as stream:
+            return await stream.get_final_text()
+
+    async def aclose(self) -> None:
+        """Release the async client (its connections are bound to the current event loop)."""
+        self._async_client = None
+        await close_shared_async_http_client()
 
     @property
     def provider_name(self) -> str:
@@ -70,7 +317,7 @@ class OpenAIProvider(AIProvider):
     """OpenAI provider."""
 
     def __init__(self, model: str = "gpt-4o", api_key: Optional[str] = None):
-        from openai import OpenAI
+        from openai import APIConnectionError, OpenAI
 
         self.model = model
         api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -80,18 +327,67 @@ class OpenAIProvider(AIProvider):
                 "OpenAI API key not found. Set OPENAI_API_KEY environment variable."
             )
 
-        self.client = OpenAI(api_key=api_key)
-        logger.info(f"Initialized OpenAI provider with model: {model}")
+        # Retries are handled by _call_with_retry, so disable the SDK's own
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=get_shared_http_client(),
+            max_retries=0
+        )
+        self.retryable_errors = (APIConnectionError,)
+        self._api_key = api_key
+        self._async_client = None
+        logger.info("Initialized OpenAI provider with model: %s", model)
 
     def create_completion(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Create completion using OpenAI."""
-        response = self.client.chat.completions.create(
+        return self._call_with_retry(
+            self._stream_text,
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
             messages=[{"role": "user", "content": prompt}]
         )
-        return response.choices[0].message.content
+
+    def _stream_text(self, **kwargs) -> str:
+        """Stream a chat completion and return the accumulated text."""
+        parts = []
+        with self.client.chat.completions.create(stream=True, **kwargs) as stream:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    async def acreate_completion(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Create completion using OpenAI's async client."""
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(
+                api_key=self._api_key,
+                http_client=get_shared_async_http_client(),
+                max_retries=0
+            )
+
+        return await self._acall_with_retry(
+            self._astream_text,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+    async def _astream_text(self, **kwargs) -> str:
+        """Stream a chat completion with the async client and return the accumulated text."""
+        parts = []
+        async with await self._async_client.chat.completions.create(stream=True, **kwargs) as stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    async def aclose(self) -> None:
+        """Release the async client (its connections are bound to the current event loop)."""
+        self._async_client = None
+        await close_shared_async_http_client()
 
     @property
     def provider_name(self) -> str:
@@ -142,7 +438,7 @@ def detect_provider(
                 raise ValueError("ANTHROPIC_API_KEY not set")
 
             model = config_model or DEFAULT_ANTHROPIC_MODEL
-            logger.info(f"Using configured provider: Anthropic Claude ({model})")
+            logger.info("Using configured provider: Anthropic Claude (%s)", model)
             return "anthropic", model
 
         elif config_provider == "openai":
@@ -154,18 +450,18 @@ def detect_provider(
                 raise ValueError("OPENAI_API_KEY not set")
 
             model = config_model or DEFAULT_OPENAI_MODEL
-            logger.info(f"Using configured provider: OpenAI ({model})")
+            logger.info("Using configured provider: OpenAI (%s)", model)
             return "openai", model
 
     # Auto-detect: prefer Anthropic if both available
     if anthropic_key:
         model = config_model or DEFAULT_ANTHROPIC_MODEL
-        logger.info(f"Auto-detected provider: Anthropic Claude ({model})")
+        logger.info("Auto-detected provider: Anthropic Claude (%s)", model)
         return "anthropic", model
 
     if openai_key:
         model = config_model or DEFAULT_OPENAI_MODEL
-        logger.info(f"Auto-detected provider: OpenAI ({model})")
+        logger.info("Auto-detected provider: OpenAI (%s)", model)
         return "openai", model
 
     raise ValueError(
@@ -181,6 +477,10 @@ def create_provider(
     """
     Create an AI provider instance based on configuration.
 
+    Instances are cached per process, so every AI feature in a run shares
+    one SDK client. The cache key includes the API keys from the environment,
+    so changing them selects (or creates) a different instance.
+
     Args:
         config_provider: Provider from config ('anthropic' or 'openai')
         config_model: Model from config
@@ -189,11 +489,27 @@ def create_provider(
     Returns:
         AIProvider instance
     """
-    provider_type, model = detect_provider(config_provider, config_model)
-
-    if provider_type == "anthropic":
-        return AnthropicProvider(model=model, api_key=api_key)
-    elif provider_type == "openai":
-        return OpenAIProvider(model=model, api_key=api_key)
-    else:
-        raise ValueError(f"Unknown provider type: {provider_type}")
+    cache_key = (
+        config_provider,
+        config_model,
+        api_key,
+        os.getenv("ANTHROPIC_API_KEY"),
+        os.getenv("OPENAI_API_KEY"),
+    )
+
+    with _provider_instances_lock:
+        provider = _provider_instances.get(cache_key)
+        if provider is not None:
+            return provider
+
+        provider_type, model = detect_provider(config_provider, config_model)
+
+        if provider_type == "anthropic":
+            provider = AnthropicProvider(model=model, api_key=api_key)
+        elif provider_type == "openai":
+            provider = OpenAIProvider(model=model, api_key=api_key)
+        else:
+            raise ValueError(f"Unknown provider type: {provider_type}")
+
+        _provider_instances[cache_key] = provider
+        return provider
@@ -1,6 +1,5 @@
 """AI-powered vulnerability summarization with multi-provider support."""
 
-import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -70,7 +69,7 @@ class Summarizer(LoggerMixin):
         if not findings:
             return "No vulnerabilities found."
 
-        self.logger.info(f"Generating AI summary for {len(findings)} findings")
+        self.logger.info("Generating AI summary for %d findings", len(findings))
 
         # Build statistics
         stats = self._get_statistics(findings)
@@ -1,12 +1,51 @@
 """AI-powered triage and clustering engine with multi-provider support."""
 
-import os
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+import heapq
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
 
 from .provider import create_provider, AIProvider
+from .cache import LLMCache
 from ..utils.logging import LoggerMixin
 
+# Priority scoring weights
+SEVERITY_SCORES = {
+    "CRITICAL": 100,
+    "HIGH": 50,
+    "MEDIUM": 25,
+    "LOW": 10,
+    "INFO": 1,
+    "UNKNOWN": 5
+}
+CATEGORY_BOOSTS = {
+    "secret": 1.5,
+    "sast": 1.2
+}
+
+# Cluster ordering for the triage prompt (most severe, then largest, first)
+SEVERITY_RANKS = {
+    "CRITICAL": 4,
+    "HIGH": 3,
+    "MEDIUM": 2,
+    "LOW": 1
+}
+TRIAGE_PROMPT_CLUSTERS = 20
+
+
+def _priority_score(finding: Dict[str, Any]) -> float:
+    """Score a finding by severity, boosted for high-impact categories."""
+    score = SEVERITY_SCORES.get(finding.get("severity", "UNKNOWN"), 0)
+    return score * CATEGORY_BOOSTS.get(finding.get("category"), 1)
+
+
+def _cluster_rank(item: Tuple[str, List[Dict[str, Any]]]) -> Tuple[int, int]:
+    """Rank a (key, findings) cluster by the severity of its first finding, then its size."""
+    cluster_findings = item[1]
+    return (
+        SEVERITY_RANKS.get(cluster_findings[0].get("severity", "UNKNOWN"), 0),
+        len(cluster_findings)
+    )
+
 
 class TriageEngine(LoggerMixin):
     """
@@ -25,7 +64,8 @@ class TriageEngine(LoggerMixin):
         provider: Optional[str] = None,
         api_key: Optional[str] = None,
         max_tokens: int = 4096,
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        cache: Optional[LLMCache] = None
     ):
         """
         Initialize triage engine.
@@ -36,9 +76,11 @@ class TriageEngine(LoggerMixin):
             api_key: API key (or from environment)
             max_tokens: Maximum tokens for response
             temperature: Sampling temperature
+            cache: Response cache for deterministic (temperature=0) requests
         """
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.cache = cache
 
         # Create provider
         self.provider: AIProvider = create_provider(
@@ -72,7 +114,7 @@ class TriageEngine(LoggerMixin):
                 "ai_model": None
             }
 
-        self.logger.info(f"Triaging {len(findings)} findings")
+        self.logger.info("Triaging %d findings", len(findings))
 
         # First, do basic clustering by similarity
         basic_clusters = self._basic_clustering(findings)
@@ -96,14 +138,18 @@ class TriageEngine(LoggerMixin):
         Returns:
             Dictionary mapping cluster keys to finding lists
         """
-        clusters = defaultdict(list)
+        clusters: Dict[str, List[Dict[str, Any]]] = {}
 
         for finding in findings:
             # Cluster by rule_id primarily
-            rule_id = finding.get("rule_id") or finding.get("message", "unknown")
-            clusters[rule_id].append(finding)
+            key = finding.get("rule_id") or finding.get("message") or "unknown"
+            cluster = clusters.get(key)
+            if cluster is None:
+                clusters[key] = [finding]
+            else:
+                cluster.append(finding)
 
-        return dict(clusters)
+        return clusters
 
     def _ai_triage(
         self,
@@ -122,13 +168,26 @@ class TriageEngine(LoggerMixin):
         """
         prompt = self._build_triage_prompt(findings, basic_clusters)
 
-        try:
-            analysis = self.provider.create_completion(
-                prompt=prompt,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
+        cache_key = None
+        if self.cache is not None and self.temperature == 0:
+            cache_key = LLMCache.make_key(
+                self.provider.provider_name,
+                self.provider.model_name,
+                prompt,
+                self.max_tokens
             )
 
+        try:
+            analysis = self.cache.get(cache_key) if cache_key else None
+            if analysis is None:
+                analysis = self.provider.create_completion(
+                    prompt=prompt,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature
+                )
+                if cache_key:
+                    self.cache.set(cache_key, analysis)
+
             # Return structured results
             return {
                 "clusters": basic_clusters,
@@ -138,7 +197,7 @@ class TriageEngine(LoggerMixin):
             }
 
         except Exception as e:
-            self.logger.error(f"AI triage failed: {str(e)}")
+            self.logger.error("AI triage failed: %s", e)
             return {
                 "clusters": basic_clusters,
                 "cluster_count": len(basic_clusters),
@@ -154,7 +213,8 @@ class TriageEngine(LoggerMixin):
         """Build prompt for AI triage."""
         # Prepare cluster summary
         cluster_summaries = []
-        for cluster_key, cluster_findings in list(clusters.items())[:20]:  # Limit to top 20
+        top_clusters = heapq.nlargest(TRIAGE_PROMPT_CLUSTERS, clusters.items(), key=_cluster_rank)
+        for cluster_key, cluster_findings in top_clusters:
             count = len(cluster_findings)
             severity = cluster_findings[0].get("severity", "UNKNOWN")
             category = cluster_findings[0].get("category", "unknown")
@@ -166,9 +226,7 @@ class TriageEngine(LoggerMixin):
         cluster_text = "\n".join(cluster_summaries)
 
         # Get severity distribution
-        severity_counts = defaultdict(int)
-        for f in findings:
-            severity_counts[f.get("severity", "UNKNOWN")] += 1
+        severity_counts = Counter(f.get("severity", "UNKNOWN") for f in findings)
 
         prompt = f"""You are a security analyst performing triage on vulnerability scan results. Analyze the findings and provide prioritized remediation guidance.
 
@@ -209,33 +267,8 @@ Be concise and actionable. Format in clear markdown."""
         Returns:
             Sorted list of top priority findings
         """
-        # Score each finding
-        severity_scores = {
-            "CRITICAL": 100,
-            "HIGH": 50,
-            "MEDIUM": 25,
-            "LOW": 10,
-            "INFO": 1,
-            "UNKNOWN": 5
-        }
-
-        scored_findings = []
-        for finding in findings:
-            score = severity_scores.get(finding.get("severity", "UNKNOWN"), 0)
-
-            # Boost score for certain categories
-            if finding.get("category") == "secret":
-                score *= 1.5
-            elif finding.get("category") == "sast":
-                score *= 1.2
-
-            scored_findings.append((score, finding))
-
-        # Sort by score descending
-        scored_findings.sort(key=lambda x: x[0], reverse=True)
-
-        # Return top N
-        return [f[1] for f in scored_findings[:limit]]
+        # Partial sort: only the top `limit` findings are ordered
+        return heapq.nlargest(limit, findings, key=_priority_score)
 
     def get_provider_info(self) -> Dict[str, str]:
         """Get provider information for metadata."""
@@ -3,31 +3,32 @@
 import os
 import sys
 import re
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import AbstractSet, Optional, List, Dict, Any, Tuple, Iterable, Iterator, Callable
+from collections import Counter, deque
 from datetime import datetime
-import yaml
-
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.align import Align
 from rich.text import Text
 
 from . import __version__
 from .scanners import TrivyScanner, SemgrepScanner, CheckovScanner, BanditScanner, BinSkimScanner, TerrascanScanner, TemplateAnalyzerScanner
-from .scanners.base import BaseScanner
+from .scanners.base import BaseScanner, ScannerError
 from .scanners.sbom import SBOMGenerator
 from .reporting import Aggregator, SARIFConverter
 from .reporting.structured_output import StructuredOutputFormatter
 from .exporters import export_to_csv, export_to_tsv
-from .ai import Summarizer, Fixer, TriageEngine
 from .utils.logging import get_logger, console, configure_logging
 from .utils.schema_validator import validate_sarif
 from .utils.metadata import extract_project_metadata
+from .utils.subprocess_runner import terminate_running_commands
+from .utils.json_io import read_json, write_json
 
 # Create Typer app
 app = typer.Typer(
@@ -51,17 +52,23 @@ def main_callback(ctx: typer.Context):
         print_banner(f"v{__version__} - Yet Another Vulnerability Scanner")
         # Typer will automatically show help after this
 
+# ASCII art lines for the YAVS banner
+BANNER_LINES = (
+    "██╗   ██╗ █████╗ ██╗   ██╗███████╗",
+    "╚██╗ ██╔╝██╔══██╗██║   ██║██╔════╝",
+    " ╚████╔╝ ███████║██║   ██║███████╗",
+    "  ╚██╔╝  ██╔══██║╚██╗ ██╔╝╚════██║",
+    "   ██║   ██║  ██║ ╚████╔╝ ███████║",
+    "   ╚═╝   ╚═╝  ╚═╝  ╚═══╝  ╚══════╝"
+)
+
+# Centered banner renderables, built once and reused by every print_banner call
+_BANNER_PARTS = tuple(Align.center(Text(line, style="bold cyan")) for line in BANNER_LINES)
+
+
 def build_banner_lines():
-    # Create ASCII art lines
-    lines = [
-        "██╗   ██╗ █████╗ ██╗   ██╗███████╗",
-        "╚██╗ ██╔╝██╔══██╗██║   ██║██╔════╝",
-        " ╚████╔╝ ███████║██║   ██║███████╗",
-        "  ╚██╔╝  ██╔══██║╚██╗ ██╔╝╚════██║",
-        "   ██║   ██║  ██║ ╚████╔╝ ███████║",
-        "   ╚═╝   ╚═╝  ╚═╝  ╚═══╝  ╚══════╝"
-    ]
-    return lines    
+    return list(BANNER_LINES)
+
 
 def print_banner(subtitle: Optional[str] = None):
     """
@@ -70,28 +77,122 @@ def print_banner(subtitle: Optional[str] = None):
     Args:
         subtitle: Optional subtitle to display below the banner
     """
-    # load ASCII art lines
-    lines = build_banner_lines()
-
-    # Build banner with proper centering
-    banner_parts = []
-    for line in lines:
-        text = Text(line, style="bold cyan")
-        banner_parts.append(Align.center(text))
-
     # Add subtitle if provided
+    subtitle_parts = []
     if subtitle:
-        banner_parts.append(Text(""))  # Empty line
-        subtitle_text = Text(subtitle, style="bold white")
-        banner_parts.append(Align.center(subtitle_text))
+        subtitle_parts.append(Text(""))  # Empty line
+        subtitle_parts.append(Align.center(Text(subtitle, style="bold white")))
 
-    # Create a group of centered elements
-    from rich.console import Group
-    banner_group = Group(*banner_parts)
+    banner_group = Group(*_BANNER_PARTS, *subtitle_parts)
 
     console.print(Panel(banner_group, border_style="bold cyan", padding=(1, 2)))
 
 
+@lru_cache(maxsize=64)
+def _compile_ignore_filter(patterns: tuple) -> tuple:
+    """
+    Fuse the valid ignore patterns into a single alternation regex.
+
+    One search per finding replaces a Python-level loop over every pattern.
+    Invalid patterns are skipped and reported together in one warning; the
+    result is memoized, so each pattern set is validated once per process.
+    If the patterns cannot be combined (e.g. inline flags that are only
+    allowed at the start of a pattern), they are returned individually.
+
+    Args:
+        patterns: Ignore patterns as a hashable tuple
+
+    Returns:
+        Tuple of compiled patterns to search (usually just one)
+    """
+    valid = []
+    invalid = []
+    for pattern in patterns:
+        try:
+            valid.append(re.compile(pattern))
+        except re.error as e:
+            invalid.append(f"'{pattern}' ({e})")
+
+    if invalid:
+        logger.warning(f"Skipping invalid ignore pattern(s): {', '.join(invalid)}")
+
+    if len(valid) <= 1:
+        return tuple(valid)
+
+    try:
+        return (re.compile("|".join(f"(?:{compiled.pattern})" for compiled in valid)),)
+    except re.error:
+        return tuple(valid)
+
+
+def _ignore_matcher(ignore_patterns: List[str]) -> Optional[Callable[[str], Any]]:
+    """
+    Build a single callable that tests a file path against the ignore patterns.
+
+    Patterns without regex metacharacters (``node_modules/``, ``vendor/``)
+    are plain substring tests, which are checked first and are much cheaper
+    than running the regex engine. The remaining patterns are fused into one
+    regex whose bound search method is called once per finding.
+
+    Args:
+        ignore_patterns: List of regex patterns to match against file paths
+
+    Returns:
+        Callable returning a truthy value for ignored paths, or None if no
+        valid patterns are configured
+    """
+    if not ignore_patterns:
+        return None
+
+    # re.search on a pattern with nothing to escape is a substring test
+    literals = tuple(pattern for pattern in ignore_patterns if re.escape(pattern) == pattern)
+    regex_patterns = tuple(pattern for pattern in ignore_patterns if re.escape(pattern) != pattern)
+    compiled_patterns = _compile_ignore_filter(regex_patterns) if regex_patterns else ()
+
+    if not literals:
+        if not compiled_patterns:
+            return None
+        if len(compiled_patterns) == 1:
+            return compiled_patterns[0].search
+        return lambda file_path: any(pattern.search(file_path) for pattern in compiled_patterns)
+
+    def is_ignored(file_path: str) -> bool:
+        for literal in literals:
+            if literal in file_path:
+                return True
+        for pattern in compiled_patterns:
+            if pattern.search(file_path):
+                return True
+        return False
+
+    return is_ignored
+
+
+def iter_unignored_findings(
+    findings: Iterable[Dict[str, Any]],
+    ignore_patterns: List[str]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield the findings whose file path matches no ignore pattern.
+
+    Args:
+        findings: Iterable of finding dictionaries
+        ignore_patterns: List of regex patterns to match against file paths
+
+    Yields:
+        Findings that are not ignored
+    """
+    # Compile regex patterns (cached, so repeat calls per scanner are free)
+    is_ignored = _ignore_matcher(ignore_patterns)
+
+    if is_ignored is None:
+        yield from findings
+    else:
+        for finding in findings:
+            if not is_ignored(finding.get("file", "")):
+                yield finding
+
+
 def filter_findings_by_ignore_patterns(
     findings: List[Dict[str, Any]],
     ignore_patterns: List[str]
@@ -109,38 +210,251 @@ def filter_findings_by_ignore_patterns(
     if not ignore_patterns:
         return findings
 
-    # Compile regex patterns
-    compiled_patterns = []
-    for pattern in ignore_patterns:
-        try:
-            compiled_patterns.append(re.compile(pattern))
-        except re.error as e:
-            logger.warning(f"Invalid ignore pattern '{pattern}': {e}")
+    filtered_findings = list(iter_unignored_findings(findings, ignore_patterns))
 
-    if not compiled_patterns:
-        return findings
+    ignored_count = len(findings) - len(filtered_findings)
 
-    filtered_findings = []
-    ignored_count = 0
+    if ignored_count > 0:
+        logger.debug(f"Filtered out {ignored_count} findings matching ignore patterns")
 
-    for finding in findings:
-        file_path = finding.get("file", "")
+    return filtered_findings
 
-        # Check if file path matches any ignore pattern
-        should_ignore = False
-        for pattern in compiled_patterns:
-            if pattern.search(file_path):
-                should_ignore = True
-                ignored_count += 1
-                break
 
-        if not should_ignore:
-            filtered_findings.append(finding)
+def run_scanner_job(
+    scanner_class: type,
+    target: Path,
+    scanner_kwargs: Dict[str, Any],
+    ignore_patterns: List[str]
+) -> Tuple[List[Dict[str, Any]], Counter]:
+    """
+    Run one scanner against a directory and post-process its findings.
 
-    if ignored_count > 0:
-        logger.debug(f"Filtered out {ignored_count} findings matching ignore patterns")
+    Source tagging, ignore filtering and category counting happen in a
+    single pass that compacts the scanner's own result list in place, so
+    no second list of findings is allocated. Only touches the findings it
+    creates, so it is safe to run several jobs in worker threads at once.
 
-    return filtered_findings
+    Args:
+        scanner_class: Scanner class to instantiate
+        target: Directory to scan
+        scanner_kwargs: Keyword arguments for the scanner constructor
+        ignore_patterns: List of regex patterns to match against file paths
+
+    Returns:
+        Tuple of (findings tagged with their filesystem source, minus ignored
+        paths; count of those findings per category)
+    """
+    results = scanner_class(target, **scanner_kwargs).run()
+
+    is_ignored = _ignore_matcher(ignore_patterns)
+    source = f"filesystem:{target}"
+    kept = 0
+    category_counts = Counter()
+
+    for finding in results:
+        # Filter findings based on ignore patterns
+        if is_ignored is not None and is_ignored(finding.get("file", "")):
+            continue
+
+        # Tag findings with filesystem source
+        finding["source"] = source
+        finding["source_type"] = "filesystem"
+        category_counts[finding.get("category")] += 1
+        results[kept] = finding
+        kept += 1
+
+    if kept < len(results):
+        logger.debug(f"Filtered out {len(results) - kept} findings matching ignore patterns")
+        del results[kept:]
+
+    return results, category_counts
+
+
+def find_unavailable_scanners(
+    active_scanners: List[Tuple[str, type, str, Dict[str, Any]]],
+    target: Path
+) -> Dict[str, str]:
+    """
+    Check each active scanner once, before any scan job is submitted.
+
+    Trivy's availability check can ask for consent and download the
+    binary. Running it here on the main thread, before any progress
+    display starts, means the prompt is shown once and only one download
+    runs; the worker threads then find the installed binary.
+
+    Args:
+        active_scanners: (name, scanner class, category, constructor kwargs) tuples
+        target: Any directory being scanned, used to construct the scanners
+
+    Returns:
+        Dictionary mapping the name of each unavailable scanner to its error message
+    """
+    unavailable = {}
+    for name, scanner_class, _, scanner_kwargs in active_scanners:
+        scanner = scanner_class(target, **scanner_kwargs)
+        if not scanner.check_available():
+            unavailable[name] = f"{scanner.tool_name} is not installed or not in PATH. Please install it first."
+    return unavailable
+
+
+def stop_scan_jobs(executor: Any, futures: Iterable[Any]) -> None:
+    """
+    Cancel queued scan jobs and kill the scanner commands of running ones.
+
+    The interpreter joins executor worker threads before it exits, so a job
+    left running would keep an aborted scan alive until its scanner finished.
+    Commands are killed until every job has returned, which also catches a
+    job that starts its command just after the first kill.
+
+    Args:
+        executor: ThreadPoolExecutor running the jobs
+        futures: Futures of the submitted jobs
+    """
+    from concurrent.futures import wait
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    pending = [future for future in futures if not future.done()]
+    while pending:
+        terminate_running_commands()
+        _, pending = wait(pending, timeout=0.1)
+
+
+def run_image_job(image: str, scanner_kwargs: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Counter]:
+    """
+    Run a Trivy image scan and tag its findings with the image source.
+
+    Only touches the findings it creates, so several images can be
+    scanned in worker threads at once.
+
+    Args:
+        image: Image reference (e.g. nginx:latest)
+        scanner_kwargs: Keyword arguments for the TrivyScanner constructor
+
+    Returns:
+        Tuple of (findings tagged with their image source; count of those
+        findings per category)
+    """
+    results = TrivyScanner(Path(image), scan_type="image", **scanner_kwargs).run()  # Image name as Path
+
+    # Tag all findings with image source, counting categories in the same pass
+    source = f"image:{image}"
+    category_counts = Counter()
+    for finding in results:
+        finding["source"] = source
+        finding["source_type"] = "image"
+        category_counts[finding.get("category")] += 1
+
+    return results, category_counts
+
+
+def register_scanner_results(
+    aggregator: Aggregator,
+    job: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    category_counts: Counter
+) -> None:
+    """
+    Register a completed scanner job with the aggregator (even if 0 findings).
+
+    Trivy covers several categories in one run and is registered once per
+    category it checked; other scanners register under their job category.
+
+    Args:
+        aggregator: Aggregator collecting the scan results
+        job: Scanner job (name, category, kwargs, ...)
+        results: Findings the job produced
+        category_counts: Count of those findings per category
+    """
+    name = job["name"]
+    if name != "Trivy":
+        aggregator.register_scanner(name, job["category"], len(results))
+        return
+
+    security_checks = job["kwargs"]["security_checks"]
+    if "vuln" in security_checks or "secret" in security_checks or "license" in security_checks:
+        aggregator.register_scanner("Trivy", "dependency", category_counts["dependency"])
+        if category_counts["secret"]:
+            aggregator.register_scanner("Trivy", "secret", category_counts["secret"])
+        if category_counts["license"]:
+            aggregator.register_scanner("Trivy", "license", category_counts["license"])
+
+    if "config" in security_checks:
+        aggregator.register_scanner("Trivy", "config", category_counts["config"])
+
+
+def format_scanner_summary(
+    job: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    category_counts: Counter
+) -> List[str]:
+    """
+    Build the console lines reporting a completed scanner job.
+
+    Args:
+        job: Scanner job (name, category, kwargs, ...)
+        results: Findings the job produced
+        category_counts: Count of those findings per category
+
+    Returns:
+        Lines to print
+    """
+    name = job["name"]
+    if name != "Trivy":
+        return [f"✓ {name}: {len(results)} finding(s)"]
+
+    lines = []
+    dep_count = category_counts["dependency"]
+    secret_count = category_counts["secret"]
+    license_count = category_counts["license"]
+    if dep_count or secret_count or license_count:
+        lines.append(f"✓ Trivy: {dep_count} vuln, {secret_count} secret, {license_count} license")
+    if category_counts["config"]:
+        lines.append(f"✓ Trivy (Config): {category_counts['config']} finding(s)")
+    return lines
+
+
+def collapse_scan_targets(paths: List[Path]) -> List[Path]:
+    """
+    Drop duplicate scan targets and targets nested inside another target.
+
+    Args:
+        paths: Resolved scan targets, in command-line or config order
+
+    Returns:
+        Targets that are not covered by another target, in original order
+    """
+    unique = list(dict.fromkeys(paths))
+    collapsed = [
+        path for path in unique
+        if not any(other != path and path.is_relative_to(other) for other in unique)
+    ]
+
+    if len(collapsed) < len(paths):
+        logger.debug(f"Skipping {len(paths) - len(collapsed)} duplicate or nested scan target(s)")
+
+    return collapsed
+
+
+# Severity hierarchy for --fail-on and --fail-fast (higher rank = higher severity)
+_SEVERITY_RANK = {"INFO": 0, "LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+
+# Display order and colour of each severity in 'yavs stats' tables
+_SEVERITY_COLORS = (
+    ("CRITICAL", "red"),
+    ("HIGH", "orange1"),
+    ("MEDIUM", "yellow"),
+    ("LOW", "blue"),
+    ("INFO", "dim"),
+    ("UNKNOWN", "dim"),
+)
+
+
+# Hardcoded scanner selection per mode when the config defines no list (backward compatibility)
+_DEFAULT_MODE_SCANNERS = {
+    "sbom": frozenset({"trivy"}),
+    "sast": frozenset({"semgrep", "bandit"}),
+    "compliance": frozenset({"checkov", "trivy"}),
+}
 
 
 def get_mode_config(config: dict, mode: str, scanner: str = None) -> dict:
@@ -179,29 +493,55 @@ def should_run_scanner_in_mode(config: dict, mode: str, scanner_name: str) -> bo
     if not config["scanners"].get(scanner_name, {}).get("enabled", False):
         return False
 
+    return _mode_allows_scanner(mode, get_mode_config(config, mode), scanner_name)
+
+
+def _mode_allows_scanner(mode: str, mode_config: dict, scanner_name: str) -> bool:
+    """
+    Check a scanner against a mode's scanner list, ignoring its enabled flag.
+
+    Args:
+        mode: Mode name (sbom, sast, compliance, all)
+        mode_config: Configuration of that mode from get_mode_config()
+        scanner_name: Scanner name (trivy, semgrep, bandit, checkov)
+
+    Returns:
+        True if the mode selects this scanner
+    """
     # Get mode-specific scanner list
-    mode_config = get_mode_config(config, mode)
     scanner_list = mode_config.get("scanners")
 
+    if scanner_list is not None:
+        return scanner_name in scanner_list
+
+    # In all mode without an explicit list, inherit runs every enabled scanner
+    if mode == "all":
+        return bool(mode_config.get("inherit", True))
+
     # If no mode config, fall back to hardcoded defaults
-    if scanner_list is None:
-        # Hardcoded defaults (backward compatibility)
-        if mode == "sbom":
-            return scanner_name == "trivy"
-        elif mode == "sast":
-            return scanner_name in ["semgrep", "bandit"]
-        elif mode == "compliance":
-            return scanner_name in ["checkov", "trivy"]
-        elif mode == "all":
-            # In all mode, check if inherit is true or scanner list is defined
-            if mode_config.get("inherit", True):
-                # Run all enabled scanners
-                return True
-            else:
-                # Use explicit scanner list if defined
-                return scanner_name in mode_config.get("scanners", [])
+    return scanner_name in _DEFAULT_MODE_SCANNERS.get(mode, ())
+
+
+def resolve_active_scanners(config: dict, mode: str) -> frozenset:
+    """
+    Resolve the set of scanners that are enabled and selected by a mode.
 
-    return scanner_name in scanner_list
+    Equivalent to calling should_run_scanner_in_mode() for every configured
+    scanner, but walks the mode configuration only once.
+
+    Args:
+        config: Full YAVS configuration
+        mode: Mode name (sbom, sast, compliance, all)
+
+    Returns:
+        Names of the scanners that should run
+    """
+    mode_config = get_mode_config(config, mode)
+    return frozenset(
+        scanner_name
+        for scanner_name, scanner_config in config["scanners"].items()
+        if scanner_config.get("enabled", False) and _mode_allows_scanner(mode, mode_config, scanner_name)
+    )
 
 
 def get_trivy_security_checks(config: dict, sbom: bool, sast: bool, compliance: bool) -> list:
@@ -217,131 +557,229 @@ def get_trivy_security_checks(config: dict, sbom: bool, sast: bool, compliance:
     Returns:
         List of security check strings
     """
-    trivy_checks = []
+    candidates = []
 
     # Determine active mode(s)
     if sbom:
         mode_config = get_mode_config(config, "sbom", "trivy")
-        checks = mode_config.get("security_checks")
-        if checks:
-            trivy_checks.extend(checks)
-        else:
-            # Fallback to defaults
-            trivy_checks.extend(["vuln", "secret", "license"])
+        # Fallback to defaults
+        candidates.extend(mode_config.get("security_checks") or ["vuln", "secret", "license"])
 
     if compliance:
         mode_config = get_mode_config(config, "compliance", "trivy")
-        checks = mode_config.get("security_checks")
-        if checks:
-            trivy_checks.extend(checks)
-        else:
-            # Fallback to defaults
-            trivy_checks.append("config")
+        # Fallback to defaults
+        candidates.extend(mode_config.get("security_checks") or ["config"])
 
     # Remove duplicates while preserving order
-    trivy_checks = list(dict.fromkeys(trivy_checks))
+    trivy_checks = []
+    seen = set()
+    for check in candidates:
+        if check not in seen:
+            seen.add(check)
+            trivy_checks.append(check)
 
     return trivy_checks
 
 
+# Built-in configuration used when no config file is found
+_DEFAULT_CONFIG = {
+    "scan": {
+        "directories": ["."],
+        "ignore_paths": [
+            "node_modules/", "vendor/", "\\.venv/", "venv/",
+            "__pycache__/", "\\.git/", "dist/", "build/", "target/",
+            "\\.egg-info/", ".*\\.min\\.js$", ".*\\.min\\.css$"
+        ]
+    },
+    "metadata": {
+        "project": None,
+        "branch": None,
+        "commit_hash": None
+    },
+    "scanners": {
+        "trivy": {"enabled": True, "timeout": 300, "flags": ""},
+        "semgrep": {"enabled": True, "timeout": 300, "flags": ""},
+        "bandit": {"enabled": True, "timeout": 300, "flags": ""},
+        "binskim": {"enabled": True, "timeout": 300, "flags": ""},
+        "checkov": {"enabled": True, "timeout": 300, "flags": ""}
+    },
+    "modes": {
+        "sbom": {
+            "scanners": ["trivy"],
+            "trivy": {
+                "security_checks": ["vuln", "secret", "license"]
+            }
+        },
+        "sast": {
+            "scanners": ["semgrep", "bandit"]
+        },
+        "compliance": {
+            "scanners": ["checkov", "trivy"],
+            "trivy": {
+                "security_checks": ["config"]
+            }
+        },
+        "all": {
+            "inherit": True
+        }
+    },
+    "output": {
+        "directory": ".",
+        "json": "yavs-results.json",
+        "sarif": "yavs-results.sarif"
+    },
+    "ai": {
+        "enabled": True,
+        "provider": None,
+        "model": None,
+        "max_tokens": 4096,
+        "temperature": 0.0,
+        "features": {
+            "fix_suggestions": True,
+            "summarize": True,
+            "triage": True
+        },
+        "cache": {
+            "enabled": True,
+            "path": None,
+            "ttl": 86400,
+            "max_entries": 10000
+        }
+    },
+    "severity_mapping": {
+        "ERROR": "HIGH",
+        "WARNING": "MEDIUM",
+        "error": "HIGH",
+        "warning": "MEDIUM",
+        "note": "LOW",
+        "none": "INFO",
+        "CRITICAL": "CRITICAL",
+        "HIGH": "HIGH",
+        "MEDIUM": "MEDIUM",
+        "LOW": "LOW",
+        "INFO": "INFO",
+        "UNKNOWN": "LOW"
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "rich",
+        "file": {
+            "enabled": False,
+            "path": "yavs.log",
+            "max_bytes": 10485760,
+            "backup_count": 3
+        }
+    }
+}
+
+# Serialized once at import; json.loads() returns a fresh copy several
+# times faster than copy.deepcopy() on the dict above
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG)
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_file(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML file, memoized by path and modification time.
+
+    Args:
+        path: Absolute file path
+        mtime_ns: File modification time; a new value forces a re-parse
+
+    Returns:
+        Parsed YAML document
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # libyaml detects the encoding itself, so skip the text-mode wrapper
+    return yaml.load(Path(path).read_bytes(), Loader=loader)
+
+
+def load_baseline_suppressions(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load the suppression entries from a baseline file.
+
+    JSON baselines go through the C json parser; YAML baselines use the
+    libyaml-backed loader when PyYAML was built with it.
+
+    Args:
+        path: Baseline file (.yaml, .yml or .json)
+
+    Returns:
+        List of suppression entries (empty if the baseline has none)
+    """
+    data = path.read_bytes()
+    if path.suffix.lower() == ".json":
+        baseline_data = json.loads(data)
+    else:
+        import yaml
+
+        baseline_data = yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    return (baseline_data or {}).get('suppressions') or []
+
+
+def filter_findings_by_severity_and_baseline(
+    findings: List[Dict[str, Any]],
+    allowed_severities: Optional[AbstractSet[str]],
+    suppressed_ids: Optional[AbstractSet[str]]
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    Apply the severity filter and suppression baseline in a single pass.
+
+    A finding's suppression ID is its rule_id, vulnerability_id or id,
+    falling back to "package:severity".
+
+    Args:
+        findings: List of finding dictionaries
+        allowed_severities: Upper-case severities to keep, or None for all
+        suppressed_ids: IDs of active suppressions, or None for no baseline
+
+    Returns:
+        Tuple of (kept findings; count dropped by severity; count suppressed)
+    """
+    kept = []
+    severity_filtered = 0
+    suppressed = 0
+    for finding in findings:
+        get = finding.get
+        if allowed_severities is not None and get('severity', 'UNKNOWN').upper() not in allowed_severities:
+            severity_filtered += 1
+            continue
+        if suppressed_ids is not None:
+            finding_id = get('rule_id') or get('vulnerability_id') or get('id')
+            if not finding_id:
+                finding_id = f"{get('package', '')}:{get('severity', '')}"
+            if finding_id in suppressed_ids:
+                suppressed += 1
+                continue
+        kept.append(finding)
+    return kept, severity_filtered, suppressed
+
+
 def load_config(config_path: Optional[Path] = None) -> dict:
     """Load configuration from YAML file."""
+    # Try config.yaml in the current directory, then the package directory.
+    # A single stat per candidate both checks existence and supplies the
+    # mtime used as the parse-cache key.
     if config_path is None:
-        # Try to find config.yaml in current directory or package directory
-        config_path = Path("config.yaml")
-        if not config_path.exists():
-            # Use default config from package
-            package_dir = Path(__file__).parent.parent.parent
-            config_path = package_dir / "config.yaml"
-
-    if config_path.exists():
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        candidates = ("config.yaml", os.path.join(os.path.dirname(__file__), "..", "..", "config.yaml"))
     else:
-        # Return default config
-        return {
-            "scan": {
-                "directories": ["."],
-                "ignore_paths": [
-                    "node_modules/", "vendor/", "\\.venv/", "venv/",
-                    "__pycache__/", "\\.git/", "dist/", "build/", "target/",
-                    "\\.egg-info/", ".*\\.min\\.js$", ".*\\.min\\.css$"
-                ]
-            },
-            "metadata": {
-                "project": None,
-                "branch": None,
-                "commit_hash": None
-            },
-            "scanners": {
-                "trivy": {"enabled": True, "timeout": 300, "flags": ""},
-                "semgrep": {"enabled": True, "timeout": 300, "flags": ""},
-                "bandit": {"enabled": True, "timeout": 300, "flags": ""},
-                "binskim": {"enabled": True, "timeout": 300, "flags": ""},
-                "checkov": {"enabled": True, "timeout": 300, "flags": ""}
-            },
-            "modes": {
-                "sbom": {
-                    "scanners": ["trivy"],
-                    "trivy": {
-                        "security_checks": ["vuln", "secret", "license"]
-                    }
-                },
-                "sast": {
-                    "scanners": ["semgrep", "bandit"]
-                },
-                "compliance": {
-                    "scanners": ["checkov", "trivy"],
-                    "trivy": {
-                        "security_checks": ["config"]
-                    }
-                },
-                "all": {
-                    "inherit": True
-                }
-            },
-            "output": {
-                "directory": ".",
-                "json": "yavs-results.json",
-                "sarif": "yavs-results.sarif"
-            },
-            "ai": {
-                "enabled": True,
-                "provider": None,
-                "model": None,
-                "max_tokens": 4096,
-                "temperature": 0.0,
-                "features": {
-                    "fix_suggestions": True,
-                    "summarize": True,
-                    "triage": True
-                }
-            },
-            "severity_mapping": {
-                "ERROR": "HIGH",
-                "WARNING": "MEDIUM",
-                "error": "HIGH",
-                "warning": "MEDIUM",
-                "note": "LOW",
-                "none": "INFO",
-                "CRITICAL": "CRITICAL",
-                "HIGH": "HIGH",
-                "MEDIUM": "MEDIUM",
-                "LOW": "LOW",
-                "INFO": "INFO",
-                "UNKNOWN": "LOW"
-            },
-            "logging": {
-                "level": "INFO",
-                "format": "rich",
-                "file": {
-                    "enabled": False,
-                    "path": "yavs.log",
-                    "max_bytes": 10485760,
-                    "backup_count": 3
-                }
-            }
-        }
+        candidates = (os.fspath(config_path),)
+
+    for candidate in candidates:
+        try:
+            stat = os.stat(candidate)
+        except OSError:
+            continue
+        # Copy so callers can't mutate the cached parse
+        return copy.deepcopy(_load_yaml_file(os.path.abspath(candidate), stat.st_mtime_ns))
+
+    # Return default config
+    return json.loads(_DEFAULT_CONFIG_JSON)
 
 
 def should_fail_fast(findings: List[Dict], fail_on_severity: str) -> bool:
@@ -355,23 +793,19 @@ def should_fail_fast(findings: List[Dict], fail_on_severity: str) -> bool:
     Returns:
         True if a finding at or above threshold is found
     """
-    severity_order = ["INFO", "LOW", "MEDIUM", "HIGH", "CRITICAL"]
-
-    # Get threshold index
+    # Get threshold rank
     try:
-        threshold_index = severity_order.index(fail_on_severity.upper())
-    except (ValueError, AttributeError):
+        threshold_rank = _SEVERITY_RANK.get(fail_on_severity.upper())
+    except AttributeError:
+        return False
+    if threshold_rank is None:
         return False
 
-    # Check if any finding meets or exceeds threshold
+    # Check if any finding meets or exceeds threshold (unknown severities never do)
     for finding in findings:
-        finding_severity = finding.get('severity', 'INFO').upper()
-        try:
-            finding_index = severity_order.index(finding_severity)
-            if finding_index >= threshold_index:
-                return True
-        except ValueError:
-            continue
+        finding_rank = _SEVERITY_RANK.get(finding.get('severity', 'INFO').upper(), -1)
+        if finding_rank >= threshold_rank:
+            return True
 
     return False
 
@@ -392,6 +826,7 @@ def scan(
     auto: bool = typer.Option(False, "--auto", help="Auto-detect project type and select appropriate scanners"),
     images: Optional[List[str]] = typer.Option(None, "--images", help="Docker image(s) to scan (e.g., nginx:latest python:3.11)"),
     images_file: Optional[Path] = typer.Option(None, "--images-file", help="File containing list of images (one per line)"),
+    image_parallel: Optional[int] = typer.Option(None, "--image-parallel", help="Number of Docker images to scan concurrently (default: scanners.trivy.parallel or 4)"),
     ignore: Optional[List[str]] = typer.Option(None, "--ignore", help="Path patterns to ignore (regex, can be specified multiple times)"),
     output_dir: Optional[Path] = typer.Option(None, "--output-dir", "-o", help="Output directory for results"),
     json_path: Optional[Path] = typer.Option(None, "--json", help="Path to JSON output file"),
@@ -460,7 +895,7 @@ def scan(
 
     # Initialize logging from config
     if "logging" in config:
-        configure_logging(config["logging"])
+        configure_logging(config["logging"], quiet=quiet)
 
     # Set severity mapping for all scanners
     if "severity_mapping" in config:
@@ -497,6 +932,9 @@ def scan(
         config_dirs = config.get("scan", {}).get("directories", ["."])
         directories_to_scan = [Path(d).resolve() for d in config_dirs]
 
+    # Don't run every scanner twice over the same tree
+    directories_to_scan = collapse_scan_targets(directories_to_scan)
+
     # Auto-detect scanners if requested
     if auto:
         from .utils.auto_detect import detect_project_type, get_scanner_categories
@@ -552,8 +990,8 @@ def scan(
     if ignore_patterns:
         logger.info(f"Using {len(ignore_patterns)} ignore pattern(s)")
 
-    # Initialize aggregator
-    aggregator = Aggregator()
+    # Initialize aggregator (duplicates across scanners and targets are dropped as they arrive)
+    aggregator = Aggregator(deduplicate_on_add=True)
 
     # Display what we're scanning
     if not quiet:
@@ -572,338 +1010,137 @@ def scan(
     try:
         with timeout_handler(timeout, f"Scan timeout after {timeout} seconds" if timeout else ""):
             # Run scanners on each directory
+            from concurrent.futures import ThreadPoolExecutor
             from contextlib import nullcontext
-            scanner_status = console.status("[bold green]Running scanners...") if not quiet else nullcontext()
-            with scanner_status as status:
-                for target in directories_to_scan:
-                    if len(directories_to_scan) > 1:
-                        console.print(f"\n[bold cyan]Directory: {target}[/bold cyan]")
 
-                    # Trivy: Run once with all needed security checks
-                    # Determine active mode for scanner selection
-                    active_mode = "all" if (sbom and sast and compliance) else ("sbom" if sbom else ("compliance" if compliance else "sast"))
-
-                    if (sbom or compliance) and should_run_scanner_in_mode(config, active_mode, "trivy"):
-                        # Get Trivy security checks from mode configuration
-                        trivy_checks = get_trivy_security_checks(config, sbom, sast, compliance)
-                        security_checks = ",".join(trivy_checks)
+            from rich.progress import (
+                BarColumn,
+                MofNCompleteColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+            )
 
-                        try:
-                            if not quiet:
-                                status.update(f"[bold green]Running Trivy ({security_checks})...")
-                            scanner = TrivyScanner(
-                                target,
-                                timeout=config["scanners"].get("trivy", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("trivy", {}).get("flags", ""),
-                                security_checks=security_checks,
-                                native_config=config["scanners"].get("trivy", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner and add findings (even if 0 findings)
-                            if "vuln" in security_checks or "secret" in security_checks or "license" in security_checks:
-                                dep_findings = [f for f in results if f.get("category") == "dependency"]
-                                secret_findings = [f for f in results if f.get("category") == "secret"]
-                                license_findings = [f for f in results if f.get("category") == "license"]
-
-                                aggregator.register_scanner("Trivy", "dependency", len(dep_findings))
-                                if secret_findings:
-                                    aggregator.register_scanner("Trivy", "secret", len(secret_findings))
-                                if license_findings:
-                                    aggregator.register_scanner("Trivy", "license", len(license_findings))
-
-                            if "config" in security_checks:
-                                config_findings = [f for f in results if f.get("category") == "config"]
-                                aggregator.register_scanner("Trivy", "config", len(config_findings))
-
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast after adding findings
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            # Count findings by category for display
-                            dep_count = sum(1 for f in results if f.get("category") == "dependency")
-                            secret_count = sum(1 for f in results if f.get("category") == "secret")
-                            license_count = sum(1 for f in results if f.get("category") == "license")
-                            config_count = sum(1 for f in results if f.get("category") == "config")
-
-                            # Display counts
-                            if not quiet:
-                                if dep_count or secret_count or license_count:
-                                    console.print(f"✓ Trivy: {dep_count} vuln, {secret_count} secret, {license_count} license")
-                                if config_count:
-                                    console.print(f"✓ Trivy (Config): {config_count} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("Trivy", "dependency", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ Trivy failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+            # Per-scanner config sections, looked up once for the whole scan
+            scanner_configs = config.get("scanners", {})
 
-                    # Semgrep (SAST)
-                    if sast and should_run_scanner_in_mode(config, active_mode, "semgrep"):
-                        try:
-                            if not quiet:
-                                status.update("[bold green]Running Semgrep (SAST)...")
-                            scanner = SemgrepScanner(
-                                target,
-                                timeout=config["scanners"].get("semgrep", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("semgrep", {}).get("flags", ""),
-                                native_config=config["scanners"].get("semgrep", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("Semgrep", "sast", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ Semgrep: {len(results)} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("Semgrep", "sast", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ Semgrep failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+            # Determine active mode for scanner selection
+            active_mode = "all" if (sbom and sast and compliance) else ("sbom" if sbom else ("compliance" if compliance else "sast"))
 
-                    # Bandit (Python SAST)
-                    if sast and should_run_scanner_in_mode(config, active_mode, "bandit"):
-                        try:
-                            if not quiet:
-                                status.update("[bold green]Running Bandit (Python SAST)...")
-                            scanner = BanditScanner(
-                                target,
-                                timeout=config["scanners"].get("bandit", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("bandit", {}).get("flags", ""),
-                                native_config=config["scanners"].get("bandit", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("Bandit", "sast", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ Bandit: {len(results)} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("Bandit", "sast", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ Bandit failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+            # (display name, config key, scanner class, category, requested by scan flags)
+            scanner_table = [
+                ("Trivy", "trivy", TrivyScanner, "dependency", sbom or compliance),
+                ("Semgrep", "semgrep", SemgrepScanner, "sast", sast),
+                ("Bandit", "bandit", BanditScanner, "sast", sast),
+                ("BinSkim", "binskim", BinSkimScanner, "sast", sast),
+                ("Checkov", "checkov", CheckovScanner, "compliance", compliance),
+                ("Terrascan", "terrascan", TerrascanScanner, "compliance", compliance),
+                ("TemplateAnalyzer", "template-analyzer", TemplateAnalyzerScanner, "iac", compliance),
+            ]
 
-                    # BinSkim (Binary Analysis)
-                    if sast and should_run_scanner_in_mode(config, active_mode, "binskim"):
-                        try:
-                            if not quiet:
-                                status.update("[bold green]Running BinSkim (Binary Analysis)...")
-                            scanner = BinSkimScanner(
-                                target,
-                                timeout=config["scanners"].get("binskim", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("binskim", {}).get("flags", ""),
-                                native_config=config["scanners"].get("binskim", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("BinSkim", "sast", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ BinSkim: {len(results)} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("BinSkim", "sast", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ BinSkim failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+            active_scanner_set = resolve_active_scanners(config, active_mode)
 
-                    # Checkov (IaC Compliance)
-                    if compliance and should_run_scanner_in_mode(config, active_mode, "checkov"):
-                        try:
-                            if not quiet:
-                                status.update("[bold green]Running Checkov (IaC Compliance)...")
-                            scanner = CheckovScanner(
-                                target,
-                                timeout=config["scanners"].get("checkov", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("checkov", {}).get("flags", ""),
-                                native_config=config["scanners"].get("checkov", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("Checkov", "compliance", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ Checkov: {len(results)} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("Checkov", "compliance", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ Checkov failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+            active_scanners = []
+            for name, config_key, scanner_class, category, requested in scanner_table:
+                if not requested or config_key not in active_scanner_set:
+                    continue
 
-                    # Terrascan (IaC Compliance)
-                    if compliance and should_run_scanner_in_mode(config, active_mode, "terrascan"):
-                        try:
-                            if not quiet:
-                                status.update("[bold green]Running Terrascan (IaC)...")
-                            scanner = TerrascanScanner(
-                                target,
-                                timeout=config["scanners"].get("terrascan", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("terrascan", {}).get("flags", ""),
-                                native_config=config["scanners"].get("terrascan", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("Terrascan", "compliance", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ Terrascan: {len(results)} finding(s)")
-                        except Exception as e:
-                            # Register as failed
-                            aggregator.register_scanner("Terrascan", "compliance", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ Terrascan failed: {str(e)}[/red]")
-                            if not continue_on_error:
-                                console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
-                                raise typer.Exit(2)
+                scanner_config = scanner_configs.get(config_key, {})
+                scanner_kwargs = {
+                    "timeout": scanner_config.get("timeout", 300),
+                    "extra_flags": scanner_config.get("flags", ""),
+                    "native_config": scanner_config.get("native_config")
+                }
+                if name == "Trivy":
+                    # Trivy: Run once with all needed security checks from the mode configuration
+                    scanner_kwargs["security_checks"] = ",".join(
+                        get_trivy_security_checks(config, sbom, sast, compliance)
+                    )
+                active_scanners.append((name, scanner_class, category, scanner_kwargs))
+
+            # Resolve (and, for Trivy, install) each scanner once before fanning out
+            unavailable_scanners = find_unavailable_scanners(active_scanners, directories_to_scan[0]) if active_scanners else {}
+
+            # Collect one job per (directory, scanner) so independent scanners can run concurrently
+            jobs = [
+                {
+                    "name": name,
+                    "category": category,
+                    "target": target,
+                    "scanner_class": scanner_class,
+                    "kwargs": scanner_kwargs
+                }
+                for target in directories_to_scan
+                for name, scanner_class, category, scanner_kwargs in active_scanners
+            ]
+
+            scan_jobs = [job for job in jobs if job["name"] not in unavailable_scanners]
+
+            # Scanners are external processes, so threads overlap them without GIL contention
+            max_workers = config.get("scan", {}).get("max_workers") or min(len(scan_jobs), os.cpu_count() or 1)
+            executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+            scanner_progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[bold green]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=console,
+                transient=True
+            ) if not quiet else nullcontext()
+
+            futures = {}
+            try:
+                with scanner_progress as progress:
+                    task_id = progress.add_task("Running scanners...", total=len(scan_jobs)) if not quiet else None
+
+                    for job in scan_jobs:
+                        future = executor.submit(
+                            run_scanner_job, job["scanner_class"], job["target"], job["kwargs"], ignore_patterns
+                        )
+                        if not quiet:
+                            future.add_done_callback(lambda _: progress.advance(task_id))
+                        futures[(job["target"], job["name"])] = future
+
+                    # Aggregate on the main thread in job order, so output does not depend on timing
+                    current_target = None
+                    for job in jobs:
+                        name = job["name"]
+                        target = job["target"]
+                        if len(directories_to_scan) > 1 and target != current_target:
+                            current_target = target
+                            console.print(f"\n[bold cyan]Directory: {current_target}[/bold cyan]")
 
-                    # TemplateAnalyzer (Azure ARM/Bicep)
-                    if compliance and should_run_scanner_in_mode(config, active_mode, "template-analyzer"):
                         try:
-                            if not quiet:
-                                status.update("[bold green]Running TemplateAnalyzer (ARM/Bicep)...")
-                            scanner = TemplateAnalyzerScanner(
-                                target,
-                                timeout=config["scanners"].get("template-analyzer", {}).get("timeout", 300),
-                                extra_flags=config["scanners"].get("template-analyzer", {}).get("flags", ""),
-                                native_config=config["scanners"].get("template-analyzer", {}).get("native_config")
-                            )
-                            results = scanner.run()
-
-                            # Tag findings with filesystem source
-                            for finding in results:
-                                finding["source"] = f"filesystem:{target}"
-                                finding["source_type"] = "filesystem"
-
-                            # Filter findings based on ignore patterns
-                            results = filter_findings_by_ignore_patterns(results, ignore_patterns)
-
-                            # Register scanner (even if 0 findings)
-                            aggregator.register_scanner("TemplateAnalyzer", "iac", len(results))
-                            aggregator.add_findings(results)
-
-                            # Check for fail-fast
-                            if fail_fast and fail_on and results:
-                                if should_fail_fast(aggregator.findings, fail_on):
-                                    console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                                    console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                                    raise typer.Exit(1)
-
-                            if not quiet:
-                                console.print(f"✓ TemplateAnalyzer: {len(results)} finding(s)")
+                            if name in unavailable_scanners:
+                                raise ScannerError(unavailable_scanners[name])
+                            results, category_counts = futures[(target, name)].result()
                         except Exception as e:
                             # Register as failed
-                            aggregator.register_scanner("TemplateAnalyzer", "iac", 0, status="failed", error=str(e))
-                            console.print(f"[red]✗ TemplateAnalyzer failed: {str(e)}[/red]")
+                            aggregator.register_scanner(name, job["category"], 0, status="failed", error=str(e))
+                            console.print(f"[red]✗ {name} failed: {str(e)}[/red]")
                             if not continue_on_error:
                                 console.print("[red]Scan failed. Use --continue-on-error to continue despite scanner failures.[/red]")
                                 raise typer.Exit(2)
+                            continue
+
+                        # Register scanner and add findings (even if 0 findings)
+                        register_scanner_results(aggregator, job, results, category_counts)
+                        aggregator.add_findings(results)
+
+                        # Check for fail-fast after adding findings
+                        if fail_fast and fail_on and results:
+                            if should_fail_fast(aggregator.findings, fail_on):
+                                console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
+                                console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
+                                raise typer.Exit(1)
+
+                        if not quiet:
+                            for line in format_scanner_summary(job, results, category_counts):
+                                console.print(line)
+            finally:
+                # Don't start queued scanners after an early exit (fail-fast, failure or timeout)
+                stop_scan_jobs(executor, futures.values())
 
         # Docker Image Scanning (if --images or --images-file provided)
         images_to_scan = []
@@ -917,95 +1154,104 @@ def scan(
             if not images_file.exists():
                 console.print(f"[red]✗ Images file not found: {images_file}[/red]")
             else:
-                with open(images_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):  # Skip empty lines and comments
-                            images_to_scan.append(line)
+                # One read for the whole file; skip empty lines and comments
+                images_to_scan.extend(
+                    line for raw in images_file.read_text(encoding='utf-8', errors='replace').splitlines()
+                    if (line := raw.strip()) and not line.startswith('#')
+                )
+
+        # The same image reference always scans to the same findings
+        images_to_scan = list(dict.fromkeys(images_to_scan))
 
         # Scan Docker images
         if images_to_scan and (sbom or compliance):
             if not quiet:
                 console.print(f"\n[bold]Scanning {len(images_to_scan)} Docker image(s)[/bold]")
 
-            for image in images_to_scan:
-                try:
-                    if not quiet:
-                        status.update(f"[bold green]Scanning image: {image}...")
-
-                    # Determine which security checks we need (same as filesystem)
-                    trivy_checks = []
-                    if sbom:
-                        trivy_checks.extend(["vuln", "secret", "license"])
-                    if compliance:
-                        trivy_checks.append("config")
-                    trivy_checks = list(dict.fromkeys(trivy_checks))
-                    security_checks = ",".join(trivy_checks)
-
-                    # Trivy image scan
-                    scanner = TrivyScanner(
-                        Path(image),  # Image name as Path
-                        timeout=config["scanners"].get("trivy", {}).get("timeout", 300),
-                        extra_flags=config["scanners"].get("trivy", {}).get("flags", ""),
-                        security_checks=security_checks,
-                        scan_type="image"
-                    )
-                    results = scanner.run()
-
-                    # Tag all findings with image source
-                    for finding in results:
-                        finding["source"] = f"image:{image}"
-                        finding["source_type"] = "image"
-
-                    aggregator.add_findings(results)
+            trivy_config = config.get("scanners", {}).get("trivy", {})
+            image_timeout = trivy_config.get("timeout", 300)
+            image_flags = trivy_config.get("flags", "")
+
+            # Determine which security checks we need (same as filesystem defaults)
+            image_checks = []
+            if sbom:
+                image_checks.extend(["vuln", "secret", "license"])
+            if compliance:
+                image_checks.append("config")
+            security_checks = ",".join(image_checks)
+
+            image_kwargs = {
+                "timeout": image_timeout,
+                "extra_flags": image_flags,
+                "security_checks": security_checks
+            }
 
-                    # Check for fail-fast
-                    if fail_fast and fail_on and results:
-                        if should_fail_fast(aggregator.findings, fail_on):
-                            console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
-                            console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
-                            raise typer.Exit(1)
+            # Resolve (and if needed install) Trivy once, before the image scans fan out
+            trivy_error = find_unavailable_scanners(
+                [("Trivy", TrivyScanner, "dependency", {**image_kwargs, "scan_type": "image"})],
+                Path(images_to_scan[0])
+            ).get("Trivy")
 
-                    # Count findings
-                    dep_count = sum(1 for f in results if f.get("category") == "dependency")
-                    secret_count = sum(1 for f in results if f.get("category") == "secret")
-                    license_count = sum(1 for f in results if f.get("category") == "license")
-                    config_count = sum(1 for f in results if f.get("category") == "config")
+            # Each image is a separate Trivy process; concurrent Trivy runs
+            # share one cache, so very high values can hit cache lock waits
+            image_workers = image_parallel or trivy_config.get("parallel", 4)
+            image_executor = ThreadPoolExecutor(max_workers=max(1, min(image_workers, len(images_to_scan))))
 
-                    if not quiet:
-                        console.print(f"✓ {image}: {dep_count} vuln, {secret_count} secret, {license_count} license, {config_count} config")
+            image_status = console.status(f"[bold green]Scanning {len(images_to_scan)} image(s)...") if not quiet else nullcontext()
+            image_futures = {}
+            try:
+                with image_status:
+                    if trivy_error is None:
+                        for image in images_to_scan:
+                            image_futures[image] = image_executor.submit(run_image_job, image, image_kwargs)
 
-                except Exception as e:
-                    console.print(f"[red]✗ {image} failed: {str(e)}[/red]")
+                    # Aggregate on the main thread in input order, so output does not depend on timing
+                    for image in images_to_scan:
+                        try:
+                            if trivy_error is not None:
+                                raise ScannerError(trivy_error)
+                            results, category_counts = image_futures[image].result()
+                        except Exception as e:
+                            console.print(f"[red]✗ {image} failed: {str(e)}[/red]")
+                            continue
+
+                        aggregator.add_findings(results)
+
+                        # Check for fail-fast
+                        if fail_fast and fail_on and results:
+                            if should_fail_fast(aggregator.findings, fail_on):
+                                console.print(f"\n[red]✗ {fail_on.upper()}+ finding detected - failing fast[/red]")
+                                console.print(f"[yellow]Found {len(aggregator.findings)} total finding(s) before early exit[/yellow]")
+                                raise typer.Exit(1)
+
+                        # Count findings
+                        dep_count = category_counts["dependency"]
+                        secret_count = category_counts["secret"]
+                        license_count = category_counts["license"]
+                        config_count = category_counts["config"]
+
+                        if not quiet:
+                            console.print(f"✓ {image}: {dep_count} vuln, {secret_count} secret, {license_count} license, {config_count} config")
+            finally:
+                # Don't start queued image scans after an early exit, and kill running ones
+                stop_scan_jobs(image_executor, image_futures.values())
 
         # Process findings
         aggregator.deduplicate()
         aggregator.sort_by_severity()
         findings = aggregator.get_findings()
 
-        # Apply severity filtering if specified
-        if severity:
-            allowed_severities = [s.strip().upper() for s in severity.split(',')]
-            original_count = len(findings)
-            findings = [f for f in findings if f.get('severity', 'UNKNOWN').upper() in allowed_severities]
-            filtered_count = original_count - len(findings)
-            if filtered_count > 0 and not quiet:
-                logger.info(f"Filtered out {filtered_count} findings not matching severity filter: {severity}")
-            # Update aggregator with filtered findings for statistics
-            aggregator.findings = findings
-
-        # Apply suppression baseline filtering if specified
+        # Load the suppression baseline up front so both filters run in one pass
+        suppressed_ids = None
+        expired_suppressions = []
         if baseline:
             try:
-                with open(baseline, 'r') as f:
-                    baseline_data = yaml.safe_load(f)
-                    suppressions = baseline_data.get('suppressions', [])
+                suppressions = load_baseline_suppressions(baseline)
 
                 if suppressions:
                     # Filter out expired suppressions
                     today = datetime.now().date()
                     active_suppressions = []
-                    expired_suppressions = []
 
                     for s in suppressions:
                         if 'expires' in s and s['expires']:
@@ -1019,38 +1265,37 @@ def scan(
                                 pass
                         active_suppressions.append(s)
 
-                    suppressed_ids = {s['id'] for s in active_suppressions}
-                    original_count = len(findings)
-
-                    # Filter findings by suppressed IDs
-                    def is_suppressed(finding):
-                        finding_id = (finding.get('rule_id') or
-                                    finding.get('vulnerability_id') or
-                                    finding.get('id') or
-                                    finding.get('package', '') + ':' + finding.get('severity', ''))
-                        return finding_id in suppressed_ids
-
-                    findings = [f for f in findings if not is_suppressed(f)]
-                    filtered_count = original_count - len(findings)
-
-                    if not quiet:
-                        console.print(f"\n[bold cyan]Suppression Baseline:[/bold cyan]")
-                        console.print(f"  Baseline: {baseline}")
-                        console.print(f"  Suppressions: {len(suppressed_ids)} active")
-                        if expired_suppressions:
-                            console.print(f"  [yellow]Expired: {len(expired_suppressions)} (now active)[/yellow]")
-                            for exp in expired_suppressions:
-                                console.print(f"    - {exp['id']} (expired: {exp.get('expires')})")
-                        console.print(f"  Total findings: {original_count}")
-                        console.print(f"  After filtering: {len(findings)}")
-                        console.print(f"  Suppressed: {filtered_count}")
-
-                    # Update aggregator with filtered findings
-                    aggregator.findings = findings
+                    suppressed_ids = frozenset(s['id'] for s in active_suppressions)
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to load baseline: {str(e)}[/yellow]")
                 console.print("[yellow]Continuing with all findings...[/yellow]")
 
+        # Apply severity and suppression baseline filtering if specified
+        if severity or suppressed_ids is not None:
+            allowed_severities = frozenset(s.strip().upper() for s in severity.split(',')) if severity else None
+            findings, severity_filtered, suppressed_count = filter_findings_by_severity_and_baseline(
+                findings, allowed_severities, suppressed_ids
+            )
+            # Update aggregator with filtered findings for statistics
+            aggregator.findings = findings
+
+            if severity_filtered > 0 and not quiet:
+                logger.info(f"Filtered out {severity_filtered} findings not matching severity filter: {severity}")
+
+            if suppressed_ids is not None and not quiet:
+                # Rich buffers prints inside `with console` and writes them once on exit
+                with console:
+                    console.print(f"\n[bold cyan]Suppression Baseline:[/bold cyan]")
+                    console.print(f"  Baseline: {baseline}")
+                    console.print(f"  Suppressions: {len(suppressed_ids)} active")
+                    if expired_suppressions:
+                        console.print(f"  [yellow]Expired: {len(expired_suppressions)} (now active)[/yellow]")
+                        for exp in expired_suppressions:
+                            console.print(f"    - {exp['id']} (expired: {exp.get('expires')})")
+                    console.print(f"  Total findings: {len(findings) + suppressed_count}")
+                    console.print(f"  After filtering: {len(findings)}")
+                    console.print(f"  Suppressed: {suppressed_count}")
+
         # Enrich findings with git blame if requested
         if blame:
             from .utils.git_blame import enrich_findings_with_blame, get_git_root
@@ -1087,11 +1332,18 @@ def scan(
                 findings = engine.evaluate(findings)
                 aggregator.findings = findings
 
-                # Count policy actions
-                suppressed = sum(1 for f in findings if f.get("suppressed_by_policy"))
-                violations = [f for f in findings if f.get("policy_violation")]
-                warnings = sum(1 for f in findings if f.get("policy_warning"))
-                tagged = sum(1 for f in findings if f.get("policy_tags"))
+                # Count policy actions in one pass over the findings
+                suppressed = warnings = tagged = 0
+                violations = []
+                for f in findings:
+                    if f.get("suppressed_by_policy"):
+                        suppressed += 1
+                    if f.get("policy_violation"):
+                        violations.append(f)
+                    if f.get("policy_warning"):
+                        warnings += 1
+                    if f.get("policy_tags"):
+                        tagged += 1
 
                 if not quiet:
                     if suppressed > 0:
@@ -1134,31 +1386,36 @@ def scan(
         out_dir = Path(output_dir or config["output"].get("directory", "."))
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        # AI Enhancement
-        ai_features = config["ai"].get("features", {})
+        # AI Enhancement (AI section looked up once for every setting below)
+        ai_config = config["ai"]
+        ai_features = ai_config.get("features", {})
         ai_summary_text = None
 
-        if not no_ai and config["ai"]["enabled"] and findings:
+        if not no_ai and ai_config["enabled"] and findings:
+            from .ai import Fixer, Summarizer, create_cache
+
             if not quiet:
                 console.print("\n[bold cyan]Generating AI insights...[/bold cyan]")
 
             # Get rate limits for the detected/configured provider
-            provider_name = config["ai"].get("provider", "anthropic") or "anthropic"
-            rate_limits = config["ai"].get("rate_limits", {}).get(provider_name, {})
+            provider_name = ai_config.get("provider", "anthropic") or "anthropic"
+            rate_limits = ai_config.get("rate_limits", {}).get(provider_name, {})
 
             try:
                 # Generate fix suggestions for high/critical findings
                 if ai_features.get("fix_suggestions", True):
                     fixer = Fixer(
-                        provider=config["ai"].get("provider"),
-                        model=config["ai"].get("model"),
-                        max_tokens=config["ai"].get("max_tokens", 4096),
-                        temperature=config["ai"].get("temperature", 0.0),
-                        parallel_requests=config["ai"].get("parallel_requests", 5),
+                        provider=ai_config.get("provider"),
+                        model=ai_config.get("model"),
+                        max_tokens=ai_config.get("max_tokens", 4096),
+                        temperature=ai_config.get("temperature", 0.0),
+                        parallel_requests=ai_config.get("parallel_requests", 5),
+                        batch_size=ai_config.get("fix_batch_size", 1),
                         rate_limit_rpm=rate_limits.get("requests_per_minute", 50),
-                        rate_limit_tpm=rate_limits.get("tokens_per_minute", 40000)
+                        rate_limit_tpm=rate_limits.get("tokens_per_minute", 40000),
+                        cache=create_cache(ai_config.get("cache"))
                     )
-                    max_fixes = config["ai"].get("max_fixes_per_scan", 50)
+                    max_fixes = ai_config.get("max_fixes_per_scan", 50)
                     findings = fixer.generate_fixes_batch(findings, limit=max_fixes)
                     if not quiet:
                         console.print("✓ AI fix suggestions generated")
@@ -1168,10 +1425,10 @@ def scan(
                     if not quiet:
                         console.print("\n[bold cyan]Generating executive summary...[/bold cyan]")
                     summarizer = Summarizer(
-                        provider=config["ai"].get("provider"),
-                        model=config["ai"].get("model"),
-                        max_tokens=config["ai"].get("max_tokens", 4096),
-                        temperature=config["ai"].get("temperature", 0.0)
+                        provider=ai_config.get("provider"),
+                        model=ai_config.get("model"),
+                        max_tokens=ai_config.get("max_tokens", 4096),
+                        temperature=ai_config.get("temperature", 0.0)
                     )
                     ai_summary_text = summarizer.summarize(findings)
                     if not quiet:
@@ -1217,18 +1474,20 @@ def scan(
         if not quiet:
             console.print(f"\n[bold]Writing outputs...[/bold]")
 
+        # Project metadata is the same for every output format, so extract it once
+        # Use first directory for metadata extraction
+        # Precedence: CLI args > config > auto-detect
+        config_metadata = config.get("metadata", {})
+        metadata = extract_project_metadata(
+            directories_to_scan[0],
+            project_name=project or config_metadata.get("project"),
+            branch=branch or config_metadata.get("branch"),
+            commit_hash=commit_hash or config_metadata.get("commit_hash")
+        )
+
         # Choose output format
         if use_structured:
             # Structured output format
-            # Use first directory for metadata extraction
-            # Precedence: CLI args > config > auto-detect
-            config_metadata = config.get("metadata", {})
-            metadata = extract_project_metadata(
-                directories_to_scan[0],
-                project_name=project or config_metadata.get("project"),
-                branch=branch or config_metadata.get("branch"),
-                commit_hash=commit_hash or config_metadata.get("commit_hash")
-            )
             formatter = StructuredOutputFormatter()
             executed_scanners = aggregator.get_executed_scanners()
             structured_output = formatter.format(findings, metadata, sbom_info, ai_summary_text, executed_scanners)
@@ -1237,16 +1496,6 @@ def scan(
                 console.print(f"✓ Structured JSON: {json_output}")
         else:
             # Flat array output with metadata
-            # Use first directory for metadata extraction
-            # Precedence: CLI args > config > auto-detect
-            config_metadata = config.get("metadata", {})
-            metadata = extract_project_metadata(
-                directories_to_scan[0],
-                project_name=project or config_metadata.get("project"),
-                branch=branch or config_metadata.get("branch"),
-                commit_hash=commit_hash or config_metadata.get("commit_hash")
-            )
-
             executed_scanners = aggregator.get_executed_scanners()
             flat_output = {
                 "build_cycle": datetime.utcnow().isoformat() + "Z",
@@ -1258,9 +1507,7 @@ def scan(
                 "data": findings
             }
 
-            import json
-            with open(json_output, 'w') as f:
-                json.dump(flat_output, f, indent=2)
+            write_json(flat_output, json_output)
 
             if not quiet:
                 console.print(f"✓ Flat JSON: {json_output}")
@@ -1275,16 +1522,22 @@ def scan(
                     findings_by_tool[tool] = []
                 findings_by_tool[tool].append(finding)
 
-            # Write individual tool files
-            for tool_name, tool_findings in findings_by_tool.items():
-                tool_filename = f"{tool_name.lower()}.json"
-                tool_output = out_dir / tool_filename
-
-                with open(tool_output, 'w') as f:
-                    json.dump(tool_findings, f, indent=2)
+            # Write individual tool files concurrently; the files are independent,
+            # so serialization and write syscalls overlap across threads
+            tool_outputs = {
+                tool_name: out_dir / f"{tool_name.lower()}.json"
+                for tool_name in findings_by_tool
+            }
+            with ThreadPoolExecutor(max_workers=min(8, len(findings_by_tool))) as tool_executor:
+                list(tool_executor.map(
+                    write_json, findings_by_tool.values(), tool_outputs.values()
+                ))
 
-                if not quiet:
-                    console.print(f"✓ {tool_name.capitalize()}: {tool_output} ({len(tool_findings)} findings)")
+            # Report on the main thread once all files are written
+            if not quiet:
+                with console:
+                    for tool_name, tool_findings in findings_by_tool.items():
+                        console.print(f"✓ {tool_name.capitalize()}: {tool_outputs[tool_name]} ({len(tool_findings)} findings)")
 
         # SARIF output
         # Use first directory as base path for relative file paths
@@ -1327,31 +1580,35 @@ def scan(
 
         # Summary
         if not quiet:
-            console.print(f"\n[bold green]Scan completed![/bold green]")
-            console.print(f"Found {stats['total']} total finding(s)")
+            with console:
+                console.print(f"\n[bold green]Scan completed![/bold green]")
+                console.print(f"Found {stats['total']} total finding(s)")
         else:
             console.print(f"Results: {json_output}")
 
         # Determine exit code based on --fail-on threshold
         exit_code = 0
         if fail_on and fail_on.upper() != "NONE":
-            # Define severity hierarchy (higher index = higher severity)
-            severity_levels = ["INFO", "LOW", "MEDIUM", "HIGH", "CRITICAL"]
             fail_threshold = fail_on.upper()
+            threshold_rank = _SEVERITY_RANK.get(fail_threshold)
 
-            if fail_threshold not in severity_levels:
+            if threshold_rank is None:
                 console.print(f"[yellow]Warning: Invalid --fail-on value '{fail_on}'. Valid values: CRITICAL, HIGH, MEDIUM, LOW, NONE[/yellow]")
             else:
-                threshold_index = severity_levels.index(fail_threshold)
-                # Check if any findings meet or exceed the threshold
-                for severity_name, count in stats['by_severity'].items():
-                    if count > 0 and severity_name in severity_levels:
-                        severity_index = severity_levels.index(severity_name)
-                        if severity_index >= threshold_index:
-                            exit_code = 1
-                            if not quiet:
-                                console.print(f"[yellow]Failing due to {count} {severity_name} finding(s) (threshold: {fail_threshold})[/yellow]")
-                            break
+                # First severity with findings at or above the threshold, if any
+                offender = next(
+                    (
+                        (severity_name, count)
+                        for severity_name, count in stats['by_severity'].items()
+                        if count > 0 and _SEVERITY_RANK.get(severity_name, -1) >= threshold_rank
+                    ),
+                    None
+                )
+                if offender:
+                    exit_code = 1
+                    if not quiet:
+                        severity_name, count = offender
+                        console.print(f"[yellow]Failing due to {count} {severity_name} finding(s) (threshold: {fail_threshold})[/yellow]")
 
         if exit_code != 0:
             raise typer.Exit(exit_code)
@@ -1409,6 +1666,8 @@ def summarize(
 
         yavs summarize yavs-results.json --enrich
     """
+    from rich.markdown import Markdown
+
     print_banner("AI-Powered Summary Generator")
 
     # Load configuration
@@ -1425,6 +1684,8 @@ def summarize(
 
     console.print(f"\nAnalyzing {len(findings)} findings with AI...\n")
 
+    from .ai import Summarizer, TriageEngine, create_cache
+
     # Use CLI args if provided, otherwise use config
     ai_provider = provider or config["ai"].get("provider")
     ai_model = model or config["ai"].get("model")
@@ -1433,8 +1694,6 @@ def summarize(
     ai_features = config["ai"].get("features", {})
 
     # Storage for summary data
-    import json
-    from datetime import datetime
     summary_data = {
         "build_cycle": datetime.utcnow().isoformat() + "Z",
         "findings_count": len(findings),
@@ -1475,7 +1734,8 @@ def summarize(
                 provider=ai_provider,
                 model=ai_model,
                 max_tokens=ai_max_tokens,
-                temperature=ai_temperature
+                temperature=ai_temperature,
+                cache=create_cache(config["ai"].get("cache"))
             )
             triage_results = triage_engine.triage(findings)
             summary_data["triage"] = triage_results
@@ -1502,18 +1762,14 @@ def summarize(
             console.print("[yellow]⚠ Warning: --output-dir is ignored when using --enrich.[/yellow]")
             console.print("[yellow]  The scan results file will be modified in place.[/yellow]")
 
-        # Read the original scan results file and add summary data
+        # Add summary data to the scan results document parsed when loading findings
         console.print("\n[bold]Enriching scan results file with summary...[/bold]")
         try:
-            with open(results_file, 'r') as f:
-                scan_results = json.load(f)
-
-            # Add summary data to scan results
+            scan_results = aggregator.raw_document
             scan_results["ai_summary"] = summary_data
 
-            # Write back to the same file
-            with open(results_file, 'w') as f:
-                json.dump(scan_results, f, indent=2)
+            # Write back to the same file (atomically, so a crash can't corrupt it)
+            write_json(scan_results, results_file)
 
             console.print(f"[green]✓ Enriched scan results saved to:[/green] {results_file}")
         except Exception as e:
@@ -1536,8 +1792,7 @@ def summarize(
 
         console.print(f"\n[bold]Saving summary to:[/bold] {summary_output_path}")
         try:
-            with open(summary_output_path, 'w') as f:
-                json.dump(summary_data, f, indent=2)
+            write_json(summary_data, summary_output_path)
 
             console.print(f"[green]✓ Summary saved to:[/green] {summary_output_path}")
         except Exception as e:
@@ -1612,25 +1867,151 @@ def report(
             summary=summary_file
         )
 
-        console.print(f"\n[green]✓ HTML report generated successfully![/green]")
-        console.print(f"[green]  Open:[/green] file://{output_path.absolute()}")
+        console.print(f"\n[green]✓ HTML report generated successfully![/green]")
+        console.print(f"[green]  Open:[/green] file://{output_path.absolute()}")
+
+    except FileNotFoundError as e:
+        console.print(f"[red]✗ File not found: {e}[/red]")
+        raise typer.Exit(1)
+    except json.JSONDecodeError as e:
+        console.print(f"[red]✗ Invalid JSON in results file: {e}[/red]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]✗ Failed to generate report: {str(e)}[/red]")
+        import traceback
+        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+        raise typer.Exit(1)
+
+
+# Create tools subcommand group
+tools_app = typer.Typer(help="Manage scanner tools (install, check, upgrade, pin versions)")
+app.add_typer(tools_app, name="tools")
+
+# Skip pip's PyPI self-version check and never block on a prompt; prefer
+# wheels so scanner installs don't fall back to slow source builds
+_PIP_INSTALL_FLAGS = ("--disable-pip-version-check", "--no-input", "--prefer-binary")
+
+
+def _run_pip_install(*args: str, timeout: float) -> Tuple[int, str]:
+    """
+    Run pip install in the current interpreter, keeping only the tail of its log.
+
+    pip's log for packages with many dependencies (checkov) runs to
+    megabytes; stdout and stderr are streamed together through a small
+    ring buffer, so memory stays flat however verbose the install is.
+    On timeout the buffered tail is attached to the exception's output.
+
+    Args:
+        *args: Arguments after 'pip install' (package specs, --upgrade)
+        timeout: Seconds before pip is killed regardless of progress
+
+    Returns:
+        Tuple of (return code, last lines of pip's output)
+
+    Raises:
+        subprocess.TimeoutExpired: If pip did not finish within timeout
+    """
+    import signal
+    import subprocess  # nosec B404 - Safe: fixed pip invocation
+    import threading
+    import time
+
+    cmd = [sys.executable, "-m", "pip", "install", *_PIP_INSTALL_FLAGS, *args]
+    output_tail = deque(maxlen=20)
+    timed_out = threading.Event()
+    finished = threading.Event()
+    deadline = time.monotonic() + timeout
+    # Own process group on POSIX, so build backends pip spawns (which share the
+    # output pipe) die with it and the read loop below sees EOF
+    own_group = os.name == "posix"
+
+    with subprocess.Popen(  # nosec B603 - Safe: fixed pip invocation, validated package specs
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, start_new_session=own_group
+    ) as proc:
+        def kill() -> None:
+            if own_group:
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.kill()
+
+        def watchdog() -> None:
+            # Poll often while pip is young (fast cached installs), then back off.
+            # Runs until pip has exited and its output has closed: a build
+            # backend left holding the pipe after pip exits is still timed out
+            delay = 0.1
+            while not finished.wait(delay):
+                if time.monotonic() > deadline:
+                    timed_out.set()
+                    kill()
+                    return
+                delay = min(delay * 5, 2.0)
+
+        monitor = threading.Thread(target=watchdog, daemon=True)
+        monitor.start()
+        try:
+            for line in proc.stdout:
+                output_tail.append(line)
+            returncode = proc.wait()
+        except BaseException:
+            # Ctrl+C no longer reaches pip through the terminal's process group
+            kill()
+            raise
+        finally:
+            finished.set()
+        monitor.join()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="".join(output_tail))
+    return returncode, "".join(output_tail).rstrip()
+
+
+def which_all(names: Iterable[str]) -> Dict[str, str]:
+    """
+    Locate several executables with a single pass over PATH.
+
+    shutil.which() walks every PATH directory for each name; this lists
+    each directory once and matches all names against it. As with
+    shutil.which(), the first executable match in PATH order wins.
 
-    except FileNotFoundError as e:
-        console.print(f"[red]✗ File not found: {e}[/red]")
-        raise typer.Exit(1)
-    except json.JSONDecodeError as e:
-        console.print(f"[red]✗ Invalid JSON in results file: {e}[/red]")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to generate report: {str(e)}[/red]")
-        import traceback
-        console.print(f"[dim]{traceback.format_exc()}[/dim]")
-        raise typer.Exit(1)
+    Args:
+        names: Executable names (without extension on Windows)
+
+    Returns:
+        Dictionary mapping each name found to its full path; missing names are absent
+    """
+    pending = set(names)
+    found = {}
 
+    suffixes = [""]
+    if sys.platform == "win32":
+        pathext = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+        suffixes += [ext.lower() for ext in pathext.split(os.pathsep) if ext]
 
-# Create tools subcommand group
-tools_app = typer.Typer(help="Manage scanner tools (install, check, upgrade, pin versions)")
-app.add_typer(tools_app, name="tools")
+    for directory in os.get_exec_path():
+        if not pending:
+            break
+        try:
+            entries = set(os.listdir(directory or os.curdir))
+        except OSError:
+            continue
+        if sys.platform == "win32":
+            entries = {entry.lower() for entry in entries}
+
+        for name in list(pending):
+            for suffix in suffixes:
+                candidate = name + suffix
+                if candidate not in entries:
+                    continue
+                path = os.path.join(directory, candidate)
+                if os.access(path, os.X_OK) and not os.path.isdir(path):
+                    found[name] = path
+                    pending.discard(name)
+                    break
+
+    return found
 
 
 @tools_app.command("install")
@@ -1717,20 +2098,17 @@ def tools_install(
 
             try:
                 console.print(f"[cyan]Running: pip install {package_spec}...[/cyan]")
-                result = subprocess.run(  # nosec B603 - Safe: validated input
-                    [sys.executable, "-m", "pip", "install", package_spec],
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                if result.returncode == 0:
+                returncode, pip_output = _run_pip_install(package_spec, timeout=300)
+                if returncode == 0:
                     console.print(f"[green]✓ {tool} installed successfully[/green]")
                 else:
                     console.print(f"[red]✗ Failed to install {tool}[/red]")
-                    console.print(f"  [dim]{result.stderr}[/dim]")
+                    console.print(f"  [dim]{pip_output}[/dim]")
                     raise typer.Exit(1)
-            except subprocess.TimeoutExpired:
+            except subprocess.TimeoutExpired as e:
                 console.print(f"[red]✗ Installation timed out[/red]")
+                if e.output:
+                    console.print(f"  [dim]{e.output.rstrip()}[/dim]")
                 raise typer.Exit(1)
             except Exception as e:
                 console.print(f"[red]✗ Installation error: {str(e)}[/red]")
@@ -1785,7 +2163,7 @@ def tools_install(
         try:
             returncode, stdout, stderr = run_command(f"{trivy_path} --version", check=False, timeout=10)
             if returncode == 0:
-                version_line = stdout.strip().split('\n')[0]
+                version_line = stdout.lstrip().partition('\n')[0].rstrip()
                 console.print(f"  [dim]{version_line}[/dim]")
         except Exception:  # nosec B110 - Safe: hardcoded command, no user input
             pass
@@ -1793,7 +2171,6 @@ def tools_install(
         console.print("[yellow]⚠ Trivy not found[/yellow]")
 
     # Check and install Python scanners
-    import shutil
     import subprocess  # nosec B404 - Safe: hardcoded command, no user input
 
     python_tools = {
@@ -1803,9 +2180,10 @@ def tools_install(
     }
 
     missing_tools = []
+    tool_paths = which_all([*(tool_info["check"] for tool_info in python_tools.values()), "binskim"])
 
     for tool_name, tool_info in python_tools.items():
-        tool_path = shutil.which(tool_info["check"])
+        tool_path = tool_paths.get(tool_info["check"])
         if tool_path:
             console.print(f"[green]✓ {tool_name.capitalize()}:[/green] {tool_path}")
         else:
@@ -1817,38 +2195,58 @@ def tools_install(
     if missing_tools and install_python_tools:
         from .utils.tool_versions import get_pip_version_specifier
         console.print(f"\n[bold]Installing {len(missing_tools)} missing Python scanner(s) (tested versions)...[/bold]")
-        for package in missing_tools:
+
+        # One pip run resolves all packages together, sharing resolver startup and metadata fetches
+        batch_ok = False
+        if len(missing_tools) > 1:
+            package_specs = [get_pip_version_specifier(package) for package in missing_tools]
+            console.print(f"[cyan]Installing {' '.join(package_specs)}...[/cyan]")
+            try:
+                returncode, _ = _run_pip_install(
+                    *package_specs,
+                    timeout=300 * len(package_specs)  # 5 minutes per package
+                )
+                batch_ok = returncode == 0
+            except (subprocess.TimeoutExpired, OSError):
+                pass
+
+            if batch_ok:
+                for package in missing_tools:
+                    console.print(f"[green]✓ {package} installed successfully[/green]")
+            else:
+                console.print("[yellow]⚠ Combined installation failed, retrying one package at a time...[/yellow]")
+
+        # Fall back to per-package installs so one bad package doesn't block the others
+        for package in ([] if batch_ok else missing_tools):
             try:
                 # Use tested version specification
                 package_spec = get_pip_version_specifier(package)
                 console.print(f"[cyan]Installing {package_spec}...[/cyan]")
-                result = subprocess.run(  # nosec B603 - Safe: hardcoded command, no user input
-                    [sys.executable, "-m", "pip", "install", package_spec],
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                if result.returncode == 0:
+                returncode, pip_output = _run_pip_install(package_spec, timeout=300)  # 5 minute timeout
+                if returncode == 0:
                     console.print(f"[green]✓ {package} installed successfully[/green]")
                 else:
                     console.print(f"[red]✗ Failed to install {package}[/red]")
-                    console.print(f"  [dim]{result.stderr}[/dim]")
-            except subprocess.TimeoutExpired:
+                    console.print(f"  [dim]{pip_output}[/dim]")
+            except subprocess.TimeoutExpired as e:
                 console.print(f"[red]✗ Installation of {package} timed out[/red]")
+                if e.output:
+                    console.print(f"  [dim]{e.output.rstrip()}[/dim]")
             except Exception as e:
                 console.print(f"[red]✗ Error installing {package}: {str(e)}[/red]")
 
         # Re-check after installation
         console.print("\n[bold]Verifying Python scanners...[/bold]")
+        tool_paths.update(which_all(tool_info["check"] for tool_info in python_tools.values()))
         for tool_name, tool_info in python_tools.items():
-            tool_path = shutil.which(tool_info["check"])
+            tool_path = tool_paths.get(tool_info["check"])
             if tool_path:
                 console.print(f"[green]✓ {tool_name.capitalize()}:[/green] {tool_path}")
             else:
                 console.print(f"[red]✗ {tool_name.capitalize()} still not found[/red]")
 
     # Check BinSkim (optional)
-    binskim_path = shutil.which("binskim")
+    binskim_path = tool_paths.get("binskim")
     if binskim_path:
         console.print(f"[green]✓ BinSkim:[/green] {binskim_path}")
     else:
@@ -1875,8 +2273,9 @@ def tools_status():
         yavs tools status
     """
     import subprocess  # nosec B404 - Safe: hardcoded command, no user input
-    from rich.table import Table
+    from concurrent.futures import ThreadPoolExecutor
     from .utils.scanner_installer import find_trivy_binary
+    from .utils.tool_versions import get_installed_version, parse_version_field
 
     print_banner("Scanner Tool Versions")
     console.print()
@@ -1886,18 +2285,50 @@ def tools_status():
     table.add_column("Version", width=30)
     table.add_column("Status", width=15)
 
-    # Check Trivy using find_trivy_binary()
+    python_tools = [
+        ("Semgrep", ["semgrep", "--version"]),
+        ("Bandit", ["bandit", "--version"]),
+        ("Checkov", ["checkov", "--version"]),
+    ]
+
+    # Python scanners installed alongside yavs report their version from package
+    # metadata, sparing a full interpreter start (and the scanner's imports) each
+    installed_versions = {
+        tool_name: get_installed_version(tool_name.lower()) for tool_name, _ in python_tools
+    }
+
+    # The remaining version probes are independent subprocesses, so start them all at
+    # once; the table then waits about as long as the slowest probe instead of their sum
     trivy_path = find_trivy_binary()
+    probe_cmds = {
+        tool_name: cmd for tool_name, cmd in python_tools if not installed_versions[tool_name]
+    }
+    probe_cmds["BinSkim"] = ["binskim", "--version"]
+
+    # Only launch what is on PATH (one scan for all); spawning a missing binary just fails
+    on_path = which_all(cmd[0] for cmd in probe_cmds.values())
+    probe_cmds = {
+        tool_name: [on_path[cmd[0]], *cmd[1:]]
+        for tool_name, cmd in probe_cmds.items()
+        if cmd[0] in on_path
+    }
+    if trivy_path:
+        probe_cmds["Trivy"] = [trivy_path, "--version"]
+
+    probes = {}
+    if probe_cmds:
+        with ThreadPoolExecutor(max_workers=len(probe_cmds)) as executor:
+            probes = {
+                tool_name: executor.submit(subprocess.run, cmd, capture_output=True, text=True, timeout=5)  # nosec B603 - Safe: hardcoded command
+                for tool_name, cmd in probe_cmds.items()
+            }
+
+    # Check Trivy using find_trivy_binary()
     if trivy_path:
         try:
-            result = subprocess.run([trivy_path, "--version"], capture_output=True, text=True, timeout=5)  # nosec B603 - Safe: hardcoded command
+            result = probes["Trivy"].result()
             if result.returncode == 0:
-                output = result.stdout.strip()
-                version = None
-                for line in output.split('\n'):
-                    if line.startswith('Version:'):
-                        version = line.split(':', 1)[1].strip()
-                        break
+                version = parse_version_field(result.stdout)
                 if version:
                     table.add_row("Trivy", version, "[green]✓ Installed[/green]")
                 else:
@@ -1910,19 +2341,20 @@ def tools_status():
         table.add_row("Trivy", "[dim]—[/dim]", "[red]✗ Not installed[/red]")
 
     # Check Python tools
-    python_tools = [
-        ("Semgrep", ["semgrep", "--version"]),
-        ("Bandit", ["bandit", "--version"]),
-        ("Checkov", ["checkov", "--version"]),
-    ]
-
-    for tool_name, cmd in python_tools:
+    for tool_name, _ in python_tools:
+        if installed_versions[tool_name]:
+            table.add_row(tool_name, installed_versions[tool_name], "[green]✓ Installed[/green]")
+            continue
+        # Not in this environment; it may still be on PATH (e.g. installed with pipx)
+        if tool_name not in probes:
+            table.add_row(tool_name, "[dim]—[/dim]", "[red]✗ Not installed[/red]")
+            continue
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)  # nosec B603 - Safe: hardcoded command, no user input
+            result = probes[tool_name].result()
             if result.returncode == 0:
                 # Extract version from output (first line)
                 output = result.stdout.strip() or result.stderr.strip()
-                version = output.split('\n')[0]
+                version = output.partition('\n')[0]
                 table.add_row(tool_name, version, "[green]✓ Installed[/green]")
             else:
                 table.add_row(tool_name, "[dim]—[/dim]", "[red]✗ Not found[/red]")
@@ -1930,16 +2362,19 @@ def tools_status():
             table.add_row(tool_name, "[dim]—[/dim]", "[red]✗ Not installed[/red]")
 
     # Check BinSkim (optional)
-    try:
-        result = subprocess.run(["binskim", "--version"], capture_output=True, text=True, timeout=5)  # nosec B603 - Safe: hardcoded command
-        if result.returncode == 0:
-            output = result.stdout.strip() or result.stderr.strip()
-            version = output.split('\n')[0]
-            table.add_row("BinSkim", version, "[green]✓ Installed[/green]")
-        else:
-            table.add_row("BinSkim", "[dim]—[/dim]", "[red]✗ Not installed[/red]")
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+    if "BinSkim" not in probes:
         table.add_row("BinSkim", "[dim]—[/dim]", "[red]✗ Not installed[/red]")
+    else:
+        try:
+            result = probes["BinSkim"].result()
+            if result.returncode == 0:
+                output = result.stdout.strip() or result.stderr.strip()
+                version = output.partition('\n')[0]
+                table.add_row("BinSkim", version, "[green]✓ Installed[/green]")
+            else:
+                table.add_row("BinSkim", "[dim]—[/dim]", "[red]✗ Not installed[/red]")
+        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+            table.add_row("BinSkim", "[dim]—[/dim]", "[red]✗ Not installed[/red]")
 
     console.print(table)
     console.print()
@@ -2010,27 +2445,22 @@ def tools_upgrade(
                     raise typer.Exit(0)
 
                 package_spec = f"{tool} --upgrade"
-                upgrade_cmd = [sys.executable, "-m", "pip", "install", "--upgrade", tool]
+                upgrade_args = ["--upgrade", tool]
             else:
                 # Upgrade within safe range
                 tested_ver = get_tested_version(tool)
                 package_spec = get_pip_version_specifier(tool)
                 console.print(f"[bold]Upgrading {tool} to tested version {tested_ver}...[/bold]")
-                upgrade_cmd = [sys.executable, "-m", "pip", "install", package_spec]
+                upgrade_args = [package_spec]
 
             try:
                 console.print(f"[cyan]Running: pip install {package_spec}...[/cyan]")
-                result = subprocess.run(  # nosec B603 - Safe: validated input
-                    upgrade_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=120
-                )
-                if result.returncode == 0:
+                returncode, pip_output = _run_pip_install(*upgrade_args, timeout=120)
+                if returncode == 0:
                     console.print(f"[green]✓ {tool} upgraded successfully[/green]")
                 else:
                     console.print(f"[red]✗ Failed to upgrade {tool}[/red]")
-                    console.print(f"[dim]{result.stderr}[/dim]")
+                    console.print(f"[dim]{pip_output}[/dim]")
                     raise typer.Exit(1)
             except Exception as e:
                 console.print(f"[red]✗ Error upgrading {tool}: {e}[/red]")
@@ -2076,29 +2506,47 @@ def tools_upgrade(
     tools_to_upgrade = ["semgrep", "bandit", "checkov"]
     console.print("\n[bold]Upgrading Python scanners...[/bold]\n")
 
-    for tool_name in tools_to_upgrade:
+    # One pip run resolves all three together, sharing resolver startup and metadata fetches
+    if latest:
+        console.print(f"[cyan]Upgrading {', '.join(tools_to_upgrade)} to latest...[/cyan]")
+        batch_args = ["--upgrade", *tools_to_upgrade]
+    else:
+        console.print(f"[cyan]Upgrading {', '.join(tools_to_upgrade)} to tested versions...[/cyan]")
+        batch_args = [get_pip_version_specifier(tool_name) for tool_name in tools_to_upgrade]
+
+    try:
+        returncode, _ = _run_pip_install(*batch_args, timeout=120 * len(tools_to_upgrade))
+        batch_ok = returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        batch_ok = False
+
+    if batch_ok:
+        for tool_name in tools_to_upgrade:
+            console.print(f"[green]✓ {tool_name} upgraded successfully[/green]")
+        console.print()
+    else:
+        console.print("[yellow]⚠ Combined upgrade failed, retrying one package at a time...[/yellow]\n")
+
+    # Fall back to per-package upgrades so one bad package doesn't block the others;
+    # they stay sequential since concurrent pip runs would race on site-packages
+    for tool_name in ([] if batch_ok else tools_to_upgrade):
         if latest:
             console.print(f"[cyan]Upgrading {tool_name} to latest...[/cyan]")
-            upgrade_cmd = [sys.executable, "-m", "pip", "install", "--upgrade", tool_name]
+            upgrade_args = ["--upgrade", tool_name]
         else:
             tested_ver = get_tested_version(tool_name)
             package_spec = get_pip_version_specifier(tool_name)
             console.print(f"[cyan]Upgrading {tool_name} to {tested_ver}...[/cyan]")
-            upgrade_cmd = [sys.executable, "-m", "pip", "install", package_spec]
+            upgrade_args = [package_spec]
 
         try:
-            result = subprocess.run(  # nosec B603 - Safe: validated input
-                upgrade_cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            if result.returncode == 0:
+            returncode, pip_output = _run_pip_install(*upgrade_args, timeout=120)
+            if returncode == 0:
                 console.print(f"[green]✓ {tool_name} upgraded successfully[/green]")
             else:
                 console.print(f"[red]✗ Failed to upgrade {tool_name}[/red]")
-                if result.stderr:
-                    console.print(f"[dim]{result.stderr}[/dim]")
+                if pip_output:
+                    console.print(f"[dim]{pip_output}[/dim]")
         except Exception as e:
             console.print(f"[red]✗ Error upgrading {tool_name}: {e}[/red]")
         console.print()
@@ -2136,11 +2584,9 @@ def tools_pin(
         yavs tools pin --format requirements     # Create requirements-scanners.txt
         yavs tools pin -o my-lock.yaml          # Custom output file
     """
-    import subprocess  # nosec B404 - Safe: hardcoded command, no user input
-    from datetime import datetime
     import yaml
     from .utils.scanner_installer import find_trivy_binary
-    from .utils.tool_versions import get_tested_version, is_version_compatible
+    from .utils.tool_versions import get_installed_version, get_tested_version, is_version_compatible, parse_version_field
 
     print_banner("Pin Scanner Tool Versions")
     console.print()
@@ -2164,11 +2610,7 @@ def tools_pin(
             returncode, stdout, stderr = run_command(f"{trivy_path} --version", check=False, timeout=5)
             if returncode == 0:
                 # Parse version from output - look for first line starting with "Version:"
-                trivy_version = None
-                for line in stdout.strip().split('\n'):
-                    if line.startswith('Version:'):
-                        trivy_version = line.split(':', 1)[1].strip()
-                        break
+                trivy_version = parse_version_field(stdout)
 
                 if trivy_version:
                     tested = get_tested_version("trivy")
@@ -2188,24 +2630,17 @@ def tools_pin(
     python_tools = ["semgrep", "bandit", "checkov"]
     for tool in python_tools:
         try:
-            result = subprocess.run(  # nosec B603 - Safe: hardcoded command
-                ["pip", "show", tool],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Version:'):
-                        version = line.split(':', 1)[1].strip()
-                        tested_ver = get_tested_version(tool)
-                        is_tested = (version == tested_ver)
-                        tool_versions[tool] = {
-                            "version": version,
-                            "tested": is_tested
-                        }
-                        console.print(f"[green]✓ {tool}: {version}{' (tested)' if is_tested else ''}[/green]")
-                        break
+            version = get_installed_version(tool)
+            if version:
+                tested_ver = get_tested_version(tool)
+                is_tested = (version == tested_ver)
+                tool_versions[tool] = {
+                    "version": version,
+                    "tested": is_tested
+                }
+                console.print(f"[green]✓ {tool}: {version}{' (tested)' if is_tested else ''}[/green]")
+            else:
+                console.print(f"[yellow]⚠ {tool} not found[/yellow]")
         except Exception as e:
             console.print(f"[yellow]⚠ Could not determine version for {tool}[/yellow]")
 
@@ -2235,33 +2670,39 @@ def tools_pin(
             if "path" in info:
                 lock_data["tools"][tool_name]["path"] = info["path"]
 
-        with open(output_file, 'w') as f:
-            f.write(f"# YAVS Scanner Tools Lock File\n")
-            f.write(f"# Generated: {timestamp}\n")
-            f.write(f"#\n")
-            f.write(f"# This file locks scanner tool versions for reproducible builds.\n")
-            f.write(f"# Commit this file to ensure consistent scanning across environments.\n")
-            f.write(f"#\n")
-            f.write(f"# To install these versions:\n")
-            f.write(f"#   yavs tools install --tool trivy --version <version>\n")
-            f.write(f"#   pip install semgrep==<version> bandit==<version> checkov==<version>\n")
-            f.write(f"\n")
-            yaml.dump(lock_data, f, default_flow_style=False, sort_keys=False)
+        # Assemble the whole file and write it in one call
+        content = "\n".join([
+            "# YAVS Scanner Tools Lock File",
+            f"# Generated: {timestamp}",
+            "#",
+            "# This file locks scanner tool versions for reproducible builds.",
+            "# Commit this file to ensure consistent scanning across environments.",
+            "#",
+            "# To install these versions:",
+            "#   yavs tools install --tool trivy --version <version>",
+            "#   pip install semgrep==<version> bandit==<version> checkov==<version>",
+            "",
+            yaml.dump(lock_data, default_flow_style=False, sort_keys=False),
+        ])
+        output_file.write_text(content, encoding="utf-8")
 
         console.print(f"[bold green]✓ Lock file saved to {output_file}[/bold green]")
 
     else:
         # Write requirements.txt format
-        with open(output_file, 'w') as f:
-            f.write(f"# Scanner tool versions - Generated on {timestamp}\n")
-            f.write(f"# Install with: pip install -r {output_file}\n")
-            f.write(f"\n")
-
-            for tool_name, info in tool_versions.items():
-                if tool_name == "trivy":
-                    f.write(f"# Trivy {info['version']} - Install via: yavs tools install --tool trivy --version {info['version']}\n")
-                else:
-                    f.write(f"{tool_name}=={info['version']}\n")
+        lines = [
+            f"# Scanner tool versions - Generated on {timestamp}",
+            f"# Install with: pip install -r {output_file}",
+            "",
+        ]
+        for tool_name, info in tool_versions.items():
+            if tool_name == "trivy":
+                lines.append(f"# Trivy {info['version']} - Install via: yavs tools install --tool trivy --version {info['version']}")
+            else:
+                lines.append(f"{tool_name}=={info['version']}")
+        lines.append("")
+
+        output_file.write_text("\n".join(lines), encoding="utf-8")
 
         console.print(f"[bold green]✓ Requirements file saved to {output_file}[/bold green]")
 
@@ -2287,10 +2728,8 @@ def tools_check():
 
         yavs tools check
     """
-    import subprocess  # nosec B404 - Safe: hardcoded command
-    from rich.table import Table
     from .utils.scanner_installer import find_trivy_binary
-    from .utils.tool_versions import get_tested_version, get_version_range, is_version_compatible
+    from .utils.tool_versions import get_installed_version, get_tested_version, get_version_range, is_version_compatible, parse_version_field
 
     print_banner("Validate Scanner Tool Versions")
     console.print()
@@ -2311,11 +2750,7 @@ def tools_check():
             returncode, stdout, stderr = run_command(f"{trivy_path} --version", check=False, timeout=5)
             if returncode == 0:
                 # Parse version - look for first line starting with "Version:"
-                trivy_version = None
-                for line in stdout.strip().split('\n'):
-                    if line.startswith('Version:'):
-                        trivy_version = line.split(':', 1)[1].strip()
-                        break
+                trivy_version = parse_version_field(stdout)
 
                 if trivy_version:
                     tested_ver = get_tested_version("trivy")
@@ -2343,34 +2778,20 @@ def tools_check():
     python_tools = ["semgrep", "bandit", "checkov"]
     for tool in python_tools:
         try:
-            result = subprocess.run(  # nosec B603 - Safe: hardcoded command
-                ["pip", "show", tool],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                installed_version = None
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Version:'):
-                        installed_version = line.split(':', 1)[1].strip()
-                        break
-
-                if installed_version:
-                    tested_ver = get_tested_version(tool)
-                    is_compat, message = is_version_compatible(tool, installed_version)
-
-                    if installed_version == tested_ver:
-                        status = "[green]✓ Tested version[/green]"
-                    elif is_compat:
-                        status = "[yellow]⚠ Compatible (not tested)[/yellow]"
-                    else:
-                        status = "[red]✗ Outside tested range[/red]"
-                        all_compatible = False
+            installed_version = get_installed_version(tool)
+            if installed_version:
+                tested_ver = get_tested_version(tool)
+                is_compat, message = is_version_compatible(tool, installed_version)
 
-                    table.add_row(tool.capitalize(), installed_version, tested_ver, status)
+                if installed_version == tested_ver:
+                    status = "[green]✓ Tested version[/green]"
+                elif is_compat:
+                    status = "[yellow]⚠ Compatible (not tested)[/yellow]"
                 else:
-                    table.add_row(tool.capitalize(), "[dim]Unknown[/dim]", get_tested_version(tool), "[yellow]⚠ Version unknown[/yellow]")
+                    status = "[red]✗ Outside tested range[/red]"
+                    all_compatible = False
+
+                table.add_row(tool.capitalize(), installed_version, tested_ver, status)
             else:
                 table.add_row(tool.capitalize(), "[dim]Not installed[/dim]", get_tested_version(tool), "[red]✗ Not found[/red]")
                 all_compatible = False
@@ -2402,6 +2823,59 @@ def tools_check():
 config_app = typer.Typer(help="Manage YAVS configuration files")
 app.add_typer(config_app, name="config")
 
+
+# Allowed values checked by 'config validate'. Tuples rather than frozensets:
+# YAML values may be unhashable (lists), and messages list them in this order
+_VALID_SCANNERS = ('trivy', 'semgrep', 'bandit', 'binskim', 'checkov')
+_VALID_SEVERITIES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO')
+_VALID_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+_VALID_AI_PROVIDERS = (None, 'anthropic', 'openai')
+
+# Scanner sections of the full 'config init' template:
+# (name, comment after flags, extra lines)
+_CONFIG_TEMPLATE_SCANNERS = (
+    ("trivy", "  # Additional CLI flags", (
+        "parallel: 4  # Docker images to scan at once (--image-parallel overrides)",
+        "# Native config: ~/.trivy/trivy.yaml (takes precedence)",
+    )),
+    ("semgrep", "", ("# Native config: .semgrep.yaml or .semgrepignore",)),
+    ("bandit", "", ("# Native config: .bandit or bandit.yaml",)),
+    ("binskim", "", ("# Windows only - binary analysis",)),
+    ("checkov", "", ("# Native config: .checkov.yaml",)),
+)
+
+
+def config_search_paths() -> List[Path]:
+    """
+    Get the config file locations the config commands search, highest priority first.
+
+    Returns:
+        Candidate config file paths
+    """
+    return [
+        Path("yavs.yaml"),
+        Path("config.yaml"),
+        Path.home() / ".yavs" / "config.yaml"
+    ]
+
+
+def find_config_file() -> Optional[Path]:
+    """
+    Find the first existing config file in the search order.
+
+    Stops at the first hit, so at most one stat per candidate. Listing the
+    current directory instead would cost more than the two stats it saves
+    in large repositories.
+
+    Returns:
+        Path to the config file, or None if none exists
+    """
+    for candidate in config_search_paths():
+        if candidate.exists():
+            return candidate
+    return None
+
+
 @config_app.command("init")
 def config_init(
     output: Optional[Path] = typer.Option(None, "-o", "--output", help="Output path (default: ./yavs.yaml)"),
@@ -2421,6 +2895,8 @@ def config_init(
         yavs config init -o my-config.yaml  # Custom path
         yavs config init --minimal          # Only essential settings
     """
+    import yaml
+
     print_banner("Initialize Configuration")
 
     # Determine output path
@@ -2441,6 +2917,8 @@ def config_init(
 
     # Load default config
     default_config = load_config()
+    # LibYAML emitter when available; identical output for these plain structures
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
     if minimal:
         # Create minimal config with only essentials
@@ -2489,100 +2967,105 @@ output:
   sarif: "yavs-results.sarif"
 """
     else:
-        # Create full config with all options and documentation
-        config_content = f"""# YAVS Configuration File
-# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-# Documentation: https://github.com/YAVS-OSS/yavs
-
-# Scan Configuration
-scan:
-  # Directories to scan (relative to config file or absolute paths)
-  directories:
-{yaml.dump(default_config['scan']['directories'], default_flow_style=False, indent=4)}
-
-  # Patterns to ignore during scanning (glob patterns and regex supported)
-  ignore_paths:
-{yaml.dump(default_config['scan']['ignore_paths'], default_flow_style=False, indent=4)}
-
-# Project Metadata (used in reports and SARIF output)
-metadata:
-  project: {default_config['metadata']['project'] or 'null  # e.g., "my-awesome-project"'}
-  branch: {default_config['metadata']['branch'] or 'null  # e.g., "main"'}
-  commit_hash: {default_config['metadata']['commit_hash'] or 'null  # e.g., "abc123..."'}
-
-# Scanner Configuration
-# Each scanner can be enabled/disabled and have custom timeouts and flags
-scanners:
-  trivy:
-    enabled: {default_config['scanners']['trivy']['enabled']}
-    timeout: {default_config['scanners']['trivy']['timeout']}
-    flags: "{default_config['scanners']['trivy']['flags']}"  # Additional CLI flags
-    # Native config: ~/.trivy/trivy.yaml (takes precedence)
-
-  semgrep:
-    enabled: {default_config['scanners']['semgrep']['enabled']}
-    timeout: {default_config['scanners']['semgrep']['timeout']}
-    flags: "{default_config['scanners']['semgrep']['flags']}"
-    # Native config: .semgrep.yaml or .semgrepignore
-
-  bandit:
-    enabled: {default_config['scanners']['bandit']['enabled']}
-    timeout: {default_config['scanners']['bandit']['timeout']}
-    flags: "{default_config['scanners']['bandit']['flags']}"
-    # Native config: .bandit or bandit.yaml
-
-  binskim:
-    enabled: {default_config['scanners']['binskim']['enabled']}
-    timeout: {default_config['scanners']['binskim']['timeout']}
-    flags: "{default_config['scanners']['binskim']['flags']}"
-    # Windows only - binary analysis
-
-  checkov:
-    enabled: {default_config['scanners']['checkov']['enabled']}
-    timeout: {default_config['scanners']['checkov']['timeout']}
-    flags: "{default_config['scanners']['checkov']['flags']}"
-    # Native config: .checkov.yaml
-
-# Output Configuration
-output:
-  directory: "{default_config['output']['directory']}"  # Output directory
-  json: "{default_config['output']['json']}"  # JSON results file
-  sarif: "{default_config['output']['sarif']}"  # SARIF 2.1.0 output
-
-# AI Features (requires API keys)
-# Set ANTHROPIC_API_KEY or OPENAI_API_KEY environment variable
-ai:
-  enabled: {default_config['ai']['enabled']}
-  provider: {default_config['ai']['provider'] or 'null  # "anthropic" or "openai" (auto-detected)'}
-  model: {default_config['ai']['model'] or 'null  # Custom model (default: provider default)'}
-  max_tokens: {default_config['ai']['max_tokens']}
-  temperature: {default_config['ai']['temperature']}
-
-  features:
-    fix_suggestions: {default_config['ai']['features']['fix_suggestions']}  # Generate fix suggestions
-    summarize: {default_config['ai']['features']['summarize']}  # Executive summaries
-    triage: {default_config['ai']['features']['triage']}  # Intelligent clustering
-
-# Severity Mapping
-# Map tool-specific severities to standard levels
-severity_mapping:
-{yaml.dump(default_config['severity_mapping'], default_flow_style=False, indent=2)}
-
-# Logging Configuration
-logging:
-  level: "{default_config['logging']['level']}"  # DEBUG, INFO, WARNING, ERROR
-  format: "{default_config['logging']['format']}"  # "rich" or "plain"
-
-  file:
-    enabled: {default_config['logging']['file']['enabled']}
-    path: "{default_config['logging']['file']['path']}"
-    max_bytes: {default_config['logging']['file']['max_bytes']}  # 10MB
-    backup_count: {default_config['logging']['file']['backup_count']}
-"""
+        # Create full config with all options and documentation; look up each
+        # section once and render the repetitive scanner blocks from a table
+        scan_cfg = default_config['scan']
+        metadata_cfg = default_config['metadata']
+        scanners_cfg = default_config['scanners']
+        output_cfg = default_config['output']
+        ai_cfg = default_config['ai']
+        ai_features = ai_cfg['features']
+        ai_cache = ai_cfg['cache']
+        logging_cfg = default_config['logging']
+        log_file = logging_cfg['file']
+
+        scanner_blocks = []
+        for name, flags_note, notes in _CONFIG_TEMPLATE_SCANNERS:
+            scanner_cfg = scanners_cfg[name]
+            scanner_blocks.append("\n".join([
+                f"  {name}:",
+                f"    enabled: {scanner_cfg['enabled']}",
+                f"    timeout: {scanner_cfg['timeout']}",
+                f"""    flags: "{scanner_cfg['flags']}"{flags_note}""",
+                *(f"    {note}" for note in notes),
+            ]))
+
+        config_content = "\n".join([
+            "# YAVS Configuration File",
+            f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "# Documentation: https://github.com/YAVS-OSS/yavs",
+            "",
+            "# Scan Configuration",
+            "scan:",
+            "  # Directories to scan (relative to config file or absolute paths)",
+            "  directories:",
+            yaml.dump(scan_cfg['directories'], Dumper=dumper, default_flow_style=False, indent=4),
+            "",
+            "  # Patterns to ignore during scanning (glob patterns and regex supported)",
+            "  ignore_paths:",
+            yaml.dump(scan_cfg['ignore_paths'], Dumper=dumper, default_flow_style=False, indent=4),
+            "",
+            "  # Maximum scanners to run at once (null = number of CPUs, 1 = sequential)",
+            "  max_workers: null",
+            "",
+            "# Project Metadata (used in reports and SARIF output)",
+            "metadata:",
+            f"""  project: {metadata_cfg['project'] or 'null  # e.g., "my-awesome-project"'}""",
+            f"""  branch: {metadata_cfg['branch'] or 'null  # e.g., "main"'}""",
+            f"""  commit_hash: {metadata_cfg['commit_hash'] or 'null  # e.g., "abc123..."'}""",
+            "",
+            "# Scanner Configuration",
+            "# Each scanner can be enabled/disabled and have custom timeouts and flags",
+            "scanners:",
+            "\n\n".join(scanner_blocks),
+            "",
+            "# Output Configuration",
+            "output:",
+            f"  directory: \"{output_cfg['directory']}\"  # Output directory",
+            f"  json: \"{output_cfg['json']}\"  # JSON results file",
+            f"  sarif: \"{output_cfg['sarif']}\"  # SARIF 2.1.0 output",
+            "",
+            "# AI Features (requires API keys)",
+            "# Set ANTHROPIC_API_KEY or OPENAI_API_KEY environment variable",
+            "ai:",
+            f"  enabled: {ai_cfg['enabled']}",
+            f"""  provider: {ai_cfg['provider'] or 'null  # "anthropic" or "openai" (auto-detected)'}""",
+            f"  model: {ai_cfg['model'] or 'null  # Custom model (default: provider default)'}",
+            f"  max_tokens: {ai_cfg['max_tokens']}",
+            f"  temperature: {ai_cfg['temperature']}",
+            "",
+            "  features:",
+            f"    fix_suggestions: {ai_features['fix_suggestions']}  # Generate fix suggestions",
+            f"    summarize: {ai_features['summarize']}  # Executive summaries",
+            f"    triage: {ai_features['triage']}  # Intelligent clustering",
+            "",
+            "  # Cache deterministic (temperature 0) responses so repeat scans skip the API",
+            "  cache:",
+            f"    enabled: {ai_cache['enabled']}",
+            f"    path: {ai_cache['path'] or 'null  # Default: ~/.yavs/cache/ai-responses.sqlite3'}",
+            f"    ttl: {ai_cache['ttl']}  # Seconds",
+            f"    max_entries: {ai_cache['max_entries']}  # Pruned when the cache is opened; delete the file to clear it",
+            "",
+            "# Severity Mapping",
+            "# Map tool-specific severities to standard levels",
+            "severity_mapping:",
+            yaml.dump(default_config['severity_mapping'], Dumper=dumper, default_flow_style=False, indent=2),
+            "",
+            "# Logging Configuration",
+            "logging:",
+            f"  level: \"{logging_cfg['level']}\"  # DEBUG, INFO, WARNING, ERROR",
+            f"  format: \"{logging_cfg['format']}\"  # \"rich\" or \"plain\"",
+            "",
+            "  file:",
+            f"    enabled: {log_file['enabled']}",
+            f"    path: \"{log_file['path']}\"",
+            f"    max_bytes: {log_file['max_bytes']}  # 10MB",
+            f"    backup_count: {log_file['backup_count']}",
+            "",
+        ])
 
     # Write config file
-    with open(config_path, 'w') as f:
-        f.write(config_content)
+    config_path.write_text(config_content, encoding="utf-8")
 
     console.print()
     console.print(f"[bold green]✓ Configuration file created: {config_path}[/bold green]")
@@ -2616,6 +3099,8 @@ def config_validate(
         yavs config validate yavs.yaml        # Validate specific file
         yavs config validate ~/.yavs/config.yaml
     """
+    import yaml
+
     print_banner("Validate Configuration")
 
     # Determine which config to validate
@@ -2626,21 +3111,11 @@ def config_validate(
         config_path = config_file
     else:
         # Auto-detect config
-        candidates = [
-            Path("yavs.yaml"),
-            Path("config.yaml"),
-            Path.home() / ".yavs" / "config.yaml"
-        ]
-
-        config_path = None
-        for candidate in candidates:
-            if candidate.exists():
-                config_path = candidate
-                break
+        config_path = find_config_file()
 
         if not config_path:
             console.print("[yellow]No config file found in:[/yellow]")
-            for candidate in candidates:
+            for candidate in config_search_paths():
                 console.print(f"  • {candidate}")
             console.print()
             console.print("[cyan]Create a config with: yavs config init[/cyan]")
@@ -2654,8 +3129,7 @@ def config_validate(
 
     try:
         # Load and parse YAML
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = yaml.load(config_path.read_bytes(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
         if not isinstance(config, dict):
             errors.append("Config file must contain a YAML dictionary")
@@ -2671,9 +3145,8 @@ def config_validate(
 
             # Validate scanners section
             if 'scanners' in config:
-                valid_scanners = ['trivy', 'semgrep', 'bandit', 'binskim', 'checkov']
                 for scanner in config['scanners']:
-                    if scanner not in valid_scanners:
+                    if scanner not in _VALID_SCANNERS:
                         warnings.append(f"Unknown scanner: {scanner}")
 
                     scanner_config = config['scanners'][scanner]
@@ -2686,7 +3159,7 @@ def config_validate(
             # Validate AI section
             if 'ai' in config:
                 ai_config = config['ai']
-                if 'provider' in ai_config and ai_config['provider'] not in [None, 'anthropic', 'openai']:
+                if 'provider' in ai_config and ai_config['provider'] not in _VALID_AI_PROVIDERS:
                     errors.append(f"Invalid AI provider: {ai_config['provider']} (must be 'anthropic' or 'openai')")
 
                 if 'temperature' in ai_config:
@@ -2696,15 +3169,14 @@ def config_validate(
 
             # Validate severity mapping
             if 'severity_mapping' in config:
-                valid_severities = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO']
                 for key, value in config['severity_mapping'].items():
-                    if value not in valid_severities:
-                        errors.append(f"Invalid severity mapping '{key}' -> '{value}' (must be one of {valid_severities})")
+                    if value not in _VALID_SEVERITIES:
+                        errors.append(f"Invalid severity mapping '{key}' -> '{value}' (must be one of {list(_VALID_SEVERITIES)})")
 
             # Validate logging
             if 'logging' in config:
                 log_config = config['logging']
-                if 'level' in log_config and log_config['level'] not in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
+                if 'level' in log_config and log_config['level'] not in _VALID_LOG_LEVELS:
                     errors.append(f"Invalid log level: {log_config['level']}")
 
     except yaml.YAMLError as e:
@@ -2754,6 +3226,8 @@ def config_show(
         yavs config show --section ai       # Show only AI config
         yavs config show --config yavs.yaml # Show specific file
     """
+    import yaml
+
     print_banner("Current Configuration")
 
     # Load config (will merge defaults + file)
@@ -2764,17 +3238,8 @@ def config_show(
         console.print(f"[cyan]Config source: {config_file}[/cyan]")
     else:
         # Try to detect which config was loaded
-        candidates = [
-            Path("yavs.yaml"),
-            Path("config.yaml"),
-            Path.home() / ".yavs" / "config.yaml"
-        ]
-
-        config_source = "defaults (no file found)"
-        for candidate in candidates:
-            if candidate.exists():
-                config_source = str(candidate)
-                break
+        detected = find_config_file()
+        config_source = str(detected) if detected else "defaults (no file found)"
 
         console.print(f"[cyan]Config source: {config_source}[/cyan]")
     console.print()
@@ -2789,11 +3254,18 @@ def config_show(
         config = {section: config[section]}
 
     # Display config as formatted YAML
-    yaml_output = yaml.dump(config, default_flow_style=False, sort_keys=False, indent=2)
-    console.print(yaml_output)
+    yaml_output = yaml.dump(
+        config,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+        indent=2
+    )
+    with console:
+        console.print(yaml_output)
 
-    # Show helpful tips
-    console.print("[dim]Tip: Create custom config with: yavs config init[/dim]")
+        # Show helpful tips
+        console.print("[dim]Tip: Create custom config with: yavs config init[/dim]")
 
 
 @config_app.command("path")
@@ -2811,9 +3283,7 @@ def config_path():
     table.add_column("Status", width=15)
 
     search_paths = [
-        ("1", Path("yavs.yaml"), "Highest"),
-        ("2", Path("config.yaml"), "High"),
-        ("3", Path.home() / ".yavs" / "config.yaml", "Medium"),
+        *zip(("1", "2", "3"), config_search_paths(), ("Highest", "High", "Medium")),
         ("4", "Built-in defaults", "Fallback")
     ]
 
@@ -2871,17 +3341,7 @@ def config_edit(
         target_file = config_file
     else:
         # Auto-detect config
-        candidates = [
-            Path("yavs.yaml"),
-            Path("config.yaml"),
-            Path.home() / ".yavs" / "config.yaml"
-        ]
-
-        target_file = None
-        for candidate in candidates:
-            if candidate.exists():
-                target_file = candidate
-                break
+        target_file = find_config_file()
 
         if not target_file:
             console.print("[yellow]No config file found.[/yellow]")
@@ -2896,14 +3356,10 @@ def config_edit(
     editor = os.environ.get('EDITOR') or os.environ.get('VISUAL')
 
     if not editor:
-        # Try common editors
-        for candidate_editor in ['nano', 'vim', 'vi', 'emacs', 'code']:
-            try:
-                subprocess.run(['which', candidate_editor], check=True, capture_output=True)  # nosec B603 B607 - Safe: hardcoded command, no user input
-                editor = candidate_editor
-                break
-            except subprocess.CalledProcessError:
-                continue
+        # Try common editors (one PATH scan, no 'which' child processes)
+        candidate_editors = ('nano', 'vim', 'vi', 'emacs', 'code')
+        available = which_all(candidate_editors)
+        editor = next((candidate for candidate in candidate_editors if candidate in available), None)
 
     if not editor:
         console.print(f"[yellow]No editor found. Please edit manually:[/yellow]")
@@ -2930,6 +3386,40 @@ def config_edit(
 # Statistics Command
 # ============================================================================
 
+def iter_result_findings(data: Any) -> Iterator[Dict]:
+    """
+    Yield the findings of a results document without copying them into a new list.
+
+    Supports the flat format (a list), documents with a 'findings' key,
+    and the structured format, whose categories hold either a list or a
+    dict of subcategory lists.
+
+    Args:
+        data: Parsed results JSON
+
+    Yields:
+        Finding dictionaries
+    """
+    if isinstance(data, list):
+        # Flat format
+        yield from data
+    elif isinstance(data, dict):
+        # Could be structured format or have findings key
+        if 'findings' in data:
+            yield from data['findings']
+        elif 'sbom' in data or 'sast' in data or 'compliance' in data:
+            # Structured format
+            for category in ('sbom', 'sast', 'compliance', 'secrets', 'licenses'):
+                section = data.get(category)
+                if isinstance(section, dict):
+                    # Has subcategories
+                    for items in section.values():
+                        if isinstance(items, list):
+                            yield from items
+                elif isinstance(section, list):
+                    yield from section
+
+
 @app.command()
 def stats(
     results_file: Path = typer.Argument(
@@ -2960,180 +3450,133 @@ def stats(
 
     # Load results
     try:
-        with open(results_file, 'r') as f:
-            data = json.load(f)
+        data = read_json(results_file)
     except Exception as e:
         console.print(f"[red]✗ Failed to load results: {e}[/red]")
         raise typer.Exit(1)
 
-    # Extract findings (support both flat and structured formats)
-    findings = []
-    if isinstance(data, list):
-        # Flat format
-        findings = data
-    elif isinstance(data, dict):
-        # Could be structured format or have findings key
-        if 'findings' in data:
-            findings = data['findings']
-        elif 'sbom' in data or 'sast' in data or 'compliance' in data:
-            # Structured format
-            for category in ['sbom', 'sast', 'compliance', 'secrets', 'licenses']:
-                if category in data:
-                    if isinstance(data[category], dict):
-                        # Has subcategories
-                        for subcat, items in data[category].items():
-                            if isinstance(items, list):
-                                findings.extend(items)
-                    elif isinstance(data[category], list):
-                        findings.extend(data[category])
-
-    if not findings:
+    # Count by severity, scanner and category in one pass straight over the
+    # document (flat or structured), without gathering findings into a list
+    severity_counts = Counter()
+    scanner_counts = Counter()
+    category_counts = Counter()
+    for finding in iter_result_findings(data):
+        severity_counts[finding.get('severity', 'UNKNOWN')] += 1
+        scanner_counts[finding.get('tool', 'unknown')] += 1
+        category_counts[finding.get('category', 'other')] += 1
+
+    total_findings = sum(severity_counts.values())
+    if not total_findings:
         console.print("[yellow]No findings in results file[/yellow]")
         return
 
-    total_findings = len(findings)
-
-    # Count by severity
-    severity_counts = {}
-    for finding in findings:
-        severity = finding.get('severity', 'UNKNOWN')
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-    # Count by scanner
-    scanner_counts = {}
-    for finding in findings:
-        tool = finding.get('tool', 'unknown')
-        scanner_counts[tool] = scanner_counts.get(tool, 0) + 1
+    # Render the report in one write rather than a flush per line
+    with console:
+        # Summary mode - one line
+        if summary:
+            console.print(f"Total: {total_findings} findings | "
+                         f"Critical: {severity_counts.get('CRITICAL', 0)} | "
+                         f"High: {severity_counts.get('HIGH', 0)} | "
+                         f"Medium: {severity_counts.get('MEDIUM', 0)} | "
+                         f"Low: {severity_counts.get('LOW', 0)}")
+            return
 
-    # Count by category
-    category_counts = {}
-    for finding in findings:
-        category = finding.get('category', 'other')
-        category_counts[category] = category_counts.get(category, 0) + 1
-
-    # Summary mode - one line
-    if summary:
-        console.print(f"Total: {total_findings} findings | "
-                     f"Critical: {severity_counts.get('CRITICAL', 0)} | "
-                     f"High: {severity_counts.get('HIGH', 0)} | "
-                     f"Medium: {severity_counts.get('MEDIUM', 0)} | "
-                     f"Low: {severity_counts.get('LOW', 0)}")
-        return
+        # JSON output
+        if json_output:
+            stats_data = {
+                "total": total_findings,
+                "by_severity": severity_counts,
+                "by_scanner": scanner_counts,
+                "by_category": category_counts
+            }
+            console.print(json.dumps(stats_data, indent=2))
+            return
 
-    # JSON output
-    if json_output:
-        stats_data = {
-            "total": total_findings,
-            "by_severity": severity_counts,
-            "by_scanner": scanner_counts,
-            "by_category": category_counts
-        }
-        console.print(json.dumps(stats_data, indent=2))
-        return
+        # Default: Show overview table
+        if not by_severity and not by_scanner and not by_category:
+            table = Table(title=f"Scan Results Overview: {results_file.name}", show_header=True, header_style="bold cyan")
+            table.add_column("Metric", style="bold", width=20)
+            table.add_column("Count", justify="right", width=15)
 
-    # Default: Show overview table
-    if not by_severity and not by_scanner and not by_category:
-        table = Table(title=f"Scan Results Overview: {results_file.name}", show_header=True, header_style="bold cyan")
-        table.add_column("Metric", style="bold", width=20)
-        table.add_column("Count", justify="right", width=15)
-
-        table.add_row("Total Findings", str(total_findings))
-        table.add_row("", "")  # Spacer
-
-        # Severity breakdown
-        severity_order = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO', 'UNKNOWN']
-        for sev in severity_order:
-            if sev in severity_counts:
-                color = {
-                    'CRITICAL': 'red',
-                    'HIGH': 'orange1',
-                    'MEDIUM': 'yellow',
-                    'LOW': 'blue',
-                    'INFO': 'dim',
-                    'UNKNOWN': 'dim'
-                }.get(sev, 'white')
-                table.add_row(f"[{color}]{sev}[/{color}]", f"[{color}]{severity_counts[sev]}[/{color}]")
+            table.add_row("Total Findings", str(total_findings))
+            table.add_row("", "")  # Spacer
 
-        console.print()
-        console.print(table)
-        console.print()
+            # Severity breakdown
+            for sev, color in _SEVERITY_COLORS:
+                if sev in severity_counts:
+                    table.add_row(f"[{color}]{sev}[/{color}]", f"[{color}]{severity_counts[sev]}[/{color}]")
 
-        # Top scanners
-        if scanner_counts:
-            console.print("[cyan]Top Scanners:[/cyan]")
-            for scanner, count in sorted(scanner_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                console.print(f"  • {scanner}: {count}")
             console.print()
-
-        # Top categories
-        if category_counts:
-            console.print("[cyan]Top Categories:[/cyan]")
-            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-                console.print(f"  • {category}: {count}")
+            console.print(table)
             console.print()
 
-    # By severity
-    elif by_severity:
-        table = Table(title="Findings by Severity", show_header=True, header_style="bold cyan")
-        table.add_column("Severity", style="bold", width=15)
-        table.add_column("Count", justify="right", width=10)
-        table.add_column("Percentage", justify="right", width=12)
-
-        severity_order = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO', 'UNKNOWN']
-        for sev in severity_order:
-            if sev in severity_counts:
-                count = severity_counts[sev]
-                percentage = (count / total_findings) * 100
-                color = {
-                    'CRITICAL': 'red',
-                    'HIGH': 'orange1',
-                    'MEDIUM': 'yellow',
-                    'LOW': 'blue',
-                    'INFO': 'dim',
-                    'UNKNOWN': 'dim'
-                }.get(sev, 'white')
-                table.add_row(
-                    f"[{color}]{sev}[/{color}]",
-                    f"[{color}]{count}[/{color}]",
-                    f"[{color}]{percentage:.1f}%[/{color}]"
-                )
+            # Top scanners
+            if scanner_counts:
+                console.print("[cyan]Top Scanners:[/cyan]")
+                for scanner, count in scanner_counts.most_common(5):
+                    console.print(f"  • {scanner}: {count}")
+                console.print()
+
+            # Top categories
+            if category_counts:
+                console.print("[cyan]Top Categories:[/cyan]")
+                for category, count in category_counts.most_common(5):
+                    console.print(f"  • {category}: {count}")
+                console.print()
+
+        # By severity
+        elif by_severity:
+            table = Table(title="Findings by Severity", show_header=True, header_style="bold cyan")
+            table.add_column("Severity", style="bold", width=15)
+            table.add_column("Count", justify="right", width=10)
+            table.add_column("Percentage", justify="right", width=12)
+
+            for sev, color in _SEVERITY_COLORS:
+                if sev in severity_counts:
+                    count = severity_counts[sev]
+                    percentage = (count / total_findings) * 100
+                    table.add_row(
+                        f"[{color}]{sev}[/{color}]",
+                        f"[{color}]{count}[/{color}]",
+                        f"[{color}]{percentage:.1f}%[/{color}]"
+                    )
 
-        console.print()
-        console.print(table)
-        console.print()
-        console.print(f"[dim]Total: {total_findings} findings[/dim]")
+            console.print()
+            console.print(table)
+            console.print()
+            console.print(f"[dim]Total: {total_findings} findings[/dim]")
 
-    # By scanner
-    elif by_scanner:
-        table = Table(title="Findings by Scanner", show_header=True, header_style="bold cyan")
-        table.add_column("Scanner", style="bold", width=15)
-        table.add_column("Count", justify="right", width=10)
-        table.add_column("Percentage", justify="right", width=12)
+        # By scanner
+        elif by_scanner:
+            table = Table(title="Findings by Scanner", show_header=True, header_style="bold cyan")
+            table.add_column("Scanner", style="bold", width=15)
+            table.add_column("Count", justify="right", width=10)
+            table.add_column("Percentage", justify="right", width=12)
 
-        for scanner, count in sorted(scanner_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_findings) * 100
-            table.add_row(scanner, str(count), f"{percentage:.1f}%")
+            for scanner, count in scanner_counts.most_common():
+                percentage = (count / total_findings) * 100
+                table.add_row(scanner, str(count), f"{percentage:.1f}%")
 
-        console.print()
-        console.print(table)
-        console.print()
-        console.print(f"[dim]Total: {total_findings} findings[/dim]")
+            console.print()
+            console.print(table)
+            console.print()
+            console.print(f"[dim]Total: {total_findings} findings[/dim]")
 
-    # By category
-    elif by_category:
-        table = Table(title="Findings by Category", show_header=True, header_style="bold cyan")
-        table.add_column("Category", style="bold", width=20)
-        table.add_column("Count", justify="right", width=10)
-        table.add_column("Percentage", justify="right", width=12)
+        # By category
+        elif by_category:
+            table = Table(title="Findings by Category", show_header=True, header_style="bold cyan")
+            table.add_column("Category", style="bold", width=20)
+            table.add_column("Count", justify="right", width=10)
+            table.add_column("Percentage", justify="right", width=12)
 
-        for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_findings) * 100
-            table.add_row(category, str(count), f"{percentage:.1f}%")
+            for category, count in category_counts.most_common():
+                percentage = (count / total_findings) * 100
+                table.add_row(category, str(count), f"{percentage:.1f}%")
 
-        console.print()
-        console.print(table)
-        console.print()
-        console.print(f"[dim]Total: {total_findings} findings[/dim]")
+            console.print()
+            console.print(table)
+            console.print()
+            console.print(f"[dim]Total: {total_findings} findings[/dim]")
 
 
 # ============================================================================
@@ -3164,6 +3607,8 @@ def ignore_add(
         yavs ignore add semgrep.rule-123 -r "Accepted risk" --expires 2025-12-31
         yavs ignore add bandit.B201 --expires 2025-03-01 --owner john --reason "Fix planned for Q1"
     """
+    import yaml
+
     print_banner("Add to Baseline")
 
     # Validate expiration date if provided
@@ -3245,6 +3690,8 @@ def ignore_remove(
         yavs ignore remove CVE-2023-1234
         yavs ignore remove CWE-89 --baseline custom-baseline.yaml
     """
+    import yaml
+
     print_banner("Remove from Baseline")
 
     if not baseline.exists():
@@ -3293,6 +3740,8 @@ def ignore_list(
         yavs ignore list --details
         yavs ignore list --baseline custom-baseline.yaml
     """
+    import yaml
+
     print_banner("Suppression Baseline")
 
     if not baseline.exists():
@@ -3397,6 +3846,8 @@ def ignore_clear(
         yavs ignore clear
         yavs ignore clear -y  # Skip confirmation
     """
+    import yaml
+
     print_banner("Clear Baseline")
 
     if not baseline.exists():
@@ -3455,6 +3906,8 @@ def ignore_export(
         yavs ignore export results.json --ids CVE-123,CVE-456
         yavs ignore export results.json --severity LOW
     """
+    import yaml
+
     print_banner("Export to Baseline")
 
     # Load results
@@ -3613,8 +4066,7 @@ def diff(
 
         # Save to file if requested
         if output:
-            with open(output, 'w') as f:
-                json.dump(comparison, f, indent=2)
+            write_json(comparison, output)
             console.print(f"\n[green]✓ Comparison saved to:[/green] {output}")
 
         # Exit with code 1 if new findings
@@ -3698,7 +4150,6 @@ def show_man_menu():
         ("q", "Quit", "Exit documentation"),
     ]
 
-    from rich.table import Table
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold cyan", width=3)
     table.add_column("Section", style="bold white", width=20)
@@ -4865,6 +5316,7 @@ scan:
     - "\\\\.git/"
     - "dist/"
     - "build/"
+  max_workers: null  # Parallel scanners (null = CPU count, 1 = sequential)
 
 metadata:
   project: null      # Auto-detect from directory name
@@ -4877,6 +5329,7 @@ scanners:
     timeout: 300
     flags: ""                    # Additional CLI flags
     native_config: null          # Path to trivy.yaml
+    parallel: 4                  # Concurrent image scans (--image-parallel)
 
   semgrep:
     enabled: true
@@ -4923,6 +5376,7 @@ ai:
 
   max_fixes_per_scan: 50
   parallel_requests: 5
+  fix_batch_size: 1
 
   rate_limits:
     anthropic:
@@ -4932,6 +5386,12 @@ ai:
       requests_per_minute: 500
       tokens_per_minute: 30000
 
+  cache:
+    enabled: true                # Reuse responses when temperature is 0
+    path: null                   # Default: ~/.yavs/cache/ai-responses.sqlite3
+    ttl: 86400                   # Seconds
+    max_entries: 10000           # Pruned when the cache is opened
+
   summary:
     output_file: "yavs-ai-summary.json"
     enrich_scan_results: false
@@ -5417,6 +5877,7 @@ ai:
 
   max_fixes_per_scan: 50
   parallel_requests: 5
+  fix_batch_size: 1
 
   rate_limits:
     anthropic:
@@ -5424,6 +5885,19 @@ ai:
       tokens_per_minute: 40000
 ```
 
+### Batched Fixes
+By default each finding gets its own fix request. Setting `fix_batch_size`
+above 1 answers that many findings per request; each batched request may use
+`max_tokens` per finding (capped at 16384), so it is billed and rate-limited
+as one larger request.
+
+### Response Cache
+With `temperature: 0` responses are deterministic, so YAVS caches them on disk
+(`~/.yavs/cache/ai-responses.sqlite3` by default) and skips the API call for
+findings it has already seen. Configure or disable it under `ai.cache`.
+Expired entries, and the oldest beyond `max_entries` (default 10000), are
+pruned each time the cache is opened. To clear it, delete the file.
+
 ### Rate Limiting
 YAVS automatically respects API rate limits:
 - Queues requests when limit approached
@@ -5696,8 +6170,9 @@ def display_statistics(stats: dict):
     for category, count in stats["by_category"].items():
         table.add_row(f"  {category.title()}", str(count))
 
-    console.print()
-    console.print(table)
+    with console:
+        console.print()
+        console.print(table)
 
 
 def main():
@@ -5705,7 +6180,6 @@ def main():
     Main entry point for YAVS CLI.
     Shows banner before displaying help or running commands.
     """
-    import sys
 
     # Check if help is requested or no arguments provided
     args = sys.argv[1:]
@@ -1,11 +1,11 @@
 """Aggregator for combining results from multiple scanners."""
 
-import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
 from pathlib import Path
 from collections import defaultdict
 
 from ..utils.logging import LoggerMixin
+from ..utils.json_io import read_json, write_json
 
 
 class Aggregator(LoggerMixin):
@@ -18,10 +18,20 @@ class Aggregator(LoggerMixin):
     - JSON output generation
     """
 
-    def __init__(self):
-        """Initialize aggregator."""
+    def __init__(self, deduplicate_on_add: bool = False):
+        """
+        Initialize aggregator.
+
+        Args:
+            deduplicate_on_add: Drop duplicate findings as they are added, so
+                they are never held in memory and deduplicate() has no work left
+        """
         self.findings: List[Dict[str, Any]] = []
+        # Dedup keys of the findings kept so far (only when deduplicating on add)
+        self._seen_keys: Optional[Set[Tuple]] = set() if deduplicate_on_add else None
         self.executed_scanners: Dict[str, Dict[str, Any]] = {}
+        # Document parsed by the last read_json call, left as it was on disk
+        self.raw_document: Any = None
 
     def register_scanner(self, tool_name: str, category: str, findings_count: int = 0, status: str = "success", error: str = None):
         """
@@ -51,17 +61,38 @@ class Aggregator(LoggerMixin):
                 if error:
                     self.executed_scanners[tool_name]["error"] = error
 
-    def add_findings(self, findings: List[Dict[str, Any]], tool_name: str = None, category: str = None):
+    def add_findings(self, findings: Iterable[Dict[str, Any]], tool_name: str = None, category: str = None):
         """
         Add findings from a scanner.
 
         Args:
-            findings: List of normalized findings
+            findings: Normalized findings; any iterable, including a generator,
+                is consumed once without an intermediate list
             tool_name: Name of the scanner tool (optional, for backward compatibility)
             category: Category of findings (optional, for backward compatibility)
         """
-        self.findings.extend(findings)
-        self.logger.debug(f"Added {len(findings)} findings to aggregator")
+        count = len(self.findings)
+        if self._seen_keys is None:
+            self.findings.extend(findings)
+        else:
+            seen = self._seen_keys
+            append = self.findings.append
+            for finding in findings:
+                key = self._dedup_key(finding)
+                if key not in seen:
+                    seen.add(key)
+                    append(finding)
+        self.logger.debug(f"Added {len(self.findings) - count} findings to aggregator")
+
+    @staticmethod
+    def _dedup_key(finding: Dict[str, Any]) -> Tuple:
+        """Build the deduplication key (file, line, rule_id, message) for a finding."""
+        return (
+            finding.get("file", ""),
+            finding.get("line", ""),
+            finding.get("rule_id", ""),
+            finding.get("message", "")
+        )
 
     def deduplicate(self):
         """
@@ -69,17 +100,15 @@ class Aggregator(LoggerMixin):
 
         Deduplication key: (file, line, rule_id, message)
         """
+        # Findings deduplicated on add are already unique, unless the list was replaced
+        if self._seen_keys is not None and len(self._seen_keys) == len(self.findings):
+            return
+
         seen = set()
         deduplicated = []
 
         for finding in self.findings:
-            # Create deduplication key
-            key = (
-                finding.get("file", ""),
-                finding.get("line", ""),
-                finding.get("rule_id", ""),
-                finding.get("message", "")
-            )
+            key = self._dedup_key(finding)
 
             if key not in seen:
                 seen.add(key)
@@ -90,6 +119,8 @@ class Aggregator(LoggerMixin):
             self.logger.info(f"Removed {removed} duplicate finding(s)")
 
         self.findings = deduplicated
+        if self._seen_keys is not None:
+            self._seen_keys = seen
 
     def sort_by_severity(self):
         """Sort findings by severity (highest first)."""
@@ -160,8 +191,7 @@ class Aggregator(LoggerMixin):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            json.dump(self.findings, f, indent=2)
+        write_json(self.findings, output_path)
 
         self.logger.info(f"Wrote {len(self.findings)} findings to {output_path}")
 
@@ -178,8 +208,8 @@ class Aggregator(LoggerMixin):
         """
         input_path = Path(input_path)
 
-        with open(input_path, 'r') as f:
-            data = json.load(f)
+        data = read_json(input_path)
+        self.raw_document = data
 
         # Detect format
         if isinstance(data, list):
@@ -193,31 +223,15 @@ class Aggregator(LoggerMixin):
 
                 # Extract from compliance section
                 for tool_result in data.get('compliance', []):
+                    tool = tool_result.get('tool', 'Unknown')
                     for violation in tool_result.get('violations', []):
-                        # Add tool name if not present
-                        if 'tool' not in violation:
-                            violation['tool'] = tool_result.get('tool', 'Unknown')
-                        # Add category if not present
-                        if 'category' not in violation:
-                            violation['category'] = 'compliance'
-                        # Map description to message if needed
-                        if 'message' not in violation and 'description' in violation:
-                            violation['message'] = violation['description']
-                        findings.append(violation)
+                        findings.append(self._with_finding_defaults(violation, tool, 'compliance'))
 
                 # Extract from SAST section
                 for tool_result in data.get('sast', []):
+                    tool = tool_result.get('tool', 'Unknown')
                     for issue in tool_result.get('issues', []):
-                        # Add tool name if not present
-                        if 'tool' not in issue:
-                            issue['tool'] = tool_result.get('tool', 'Unknown')
-                        # Add category if not present
-                        if 'category' not in issue:
-                            issue['category'] = 'sast'
-                        # Map description to message if needed
-                        if 'message' not in issue and 'description' in issue:
-                            issue['message'] = issue['description']
-                        findings.append(issue)
+                        findings.append(self._with_finding_defaults(issue, tool, 'sast'))
 
                 self.findings = findings
             elif 'data' in data:
@@ -233,6 +247,39 @@ class Aggregator(LoggerMixin):
 
         self.logger.info(f"Loaded {len(self.findings)} findings from {input_path}")
 
+    @staticmethod
+    def _with_finding_defaults(entry: Dict[str, Any], tool: str, category: str) -> Dict[str, Any]:
+        """
+        Fill in the tool, category and message of a structured-format entry.
+
+        Entries that need defaults are copied, so the parsed document in
+        raw_document is never modified.
+
+        Args:
+            entry: Violation or issue from a structured results file
+            tool: Tool name of the section the entry came from
+            category: Category of that section
+
+        Returns:
+            The entry itself, or a copy with the missing fields added
+        """
+        needs_message = 'message' not in entry and 'description' in entry
+        if 'tool' in entry and 'category' in entry and not needs_message:
+            return entry
+
+        finding = dict(entry)
+        # Add tool name if not present
+        finding.setdefault('tool', tool)
+        # Add category if not present
+        finding.setdefault('category', category)
+        # Map description to message if needed
+        if needs_message:
+            finding['message'] = finding['description']
+        return finding
+
     def clear(self):
         """Clear all findings."""
         self.findings = []
+        self.raw_document = None
+        if self._seen_keys is not None:
+            self._seen_keys.clear()
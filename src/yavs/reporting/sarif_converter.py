@@ -7,9 +7,16 @@ from datetime import datetime
 
 from ..utils.path_utils import make_relative
 from ..utils.logging import LoggerMixin
+from ..utils.json_io import atomic_open
 from .. import __version__
 
 
+# The results array as rendered with indent=2 in an empty document, and the
+# indentation of each result inside it (document > runs > run > results)
+_RESULTS_PLACEHOLDER = '"results": []'
+_RESULT_INDENT = " " * 8
+
+
 class SARIFConverter(LoggerMixin):
     """
     Converts normalized YAVS findings to SARIF 2.1.0 format.
@@ -54,7 +61,26 @@ class SARIFConverter(LoggerMixin):
         """
         self.logger.info(f"Converting {len(findings)} findings to SARIF format")
 
-        # Build SARIF structure
+        return self._build_document(
+            self._build_rules(findings),
+            self._convert_findings(findings, include_ai_summary)
+        )
+
+    def _build_document(
+        self,
+        rules: List[Dict[str, Any]],
+        results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build the SARIF document around already-converted rules and results.
+
+        Args:
+            rules: SARIF rule definitions
+            results: SARIF result objects
+
+        Returns:
+            SARIF 2.1.0 compliant dictionary
+        """
         sarif = {
             "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
             "version": "2.1.0",
@@ -65,10 +91,10 @@ class SARIFConverter(LoggerMixin):
                             "name": "YAVS",
                             "version": __version__,
                             "informationUri": "https://github.com/YAVS-OSS/yavs",
-                            "rules": self._build_rules(findings)
+                            "rules": rules
                         }
                     },
-                    "results": self._convert_findings(findings, include_ai_summary),
+                    "results": results,
                     "invocations": [
                         {
                             "executionSuccessful": True,
@@ -260,7 +286,7 @@ class SARIFConverter(LoggerMixin):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with atomic_open(output_path, 'w', encoding='utf-8') as f:
             json.dump(sarif_data, f, indent=2, ensure_ascii=False)
 
         self.logger.info(f"Wrote SARIF output to {output_path}")
@@ -272,12 +298,44 @@ class SARIFConverter(LoggerMixin):
         include_ai_summary: bool = True
     ):
         """
-        Convert findings and write to SARIF file.
+        Convert findings and stream them to a SARIF file.
+
+        Only one converted result is held in memory at a time, rather than
+        the whole results array. The document goes to a temporary file that
+        replaces output_path once complete (atomic_open), so a failed write
+        never leaves a truncated SARIF file behind.
 
         Args:
             findings: List of normalized findings
             output_path: Output file path
             include_ai_summary: Include AI summaries
         """
-        sarif_data = self.convert(findings, include_ai_summary)
-        self.write_sarif(sarif_data, output_path)
+        self.logger.info(f"Converting {len(findings)} findings to SARIF format")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Render everything but the results, then split where they belong.
+        # Keys inside JSON strings have escaped quotes, so only the real key matches.
+        skeleton = json.dumps(
+            self._build_document(self._build_rules(findings), []), indent=2, ensure_ascii=False
+        )
+        head, marker, tail = skeleton.partition(_RESULTS_PLACEHOLDER)
+
+        with atomic_open(output_path, 'w', encoding='utf-8') as f:
+            f.write(head)
+            if not findings:
+                f.write(marker)
+            else:
+                f.write('"results": [')
+                separator = "\n" + _RESULT_INDENT
+                for finding in findings:
+                    result = self._convert_single_finding(finding, include_ai_summary)
+                    # Raw newlines only occur between JSON tokens, never inside strings
+                    f.write(separator)
+                    f.write(json.dumps(result, indent=2, ensure_ascii=False).replace("\n", "\n" + _RESULT_INDENT))
+                    separator = ",\n" + _RESULT_INDENT
+                f.write("\n" + _RESULT_INDENT[:-2] + "]")
+            f.write(tail)
+
+        self.logger.info(f"Wrote SARIF output to {output_path}")
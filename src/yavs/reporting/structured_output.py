@@ -1,11 +1,11 @@
 """Structured output formatter for YAVS results."""
 
-import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from collections import defaultdict
 
 from ..utils.logging import LoggerMixin
+from ..utils.json_io import write_json
 
 
 class StructuredOutputFormatter(LoggerMixin):
@@ -277,7 +277,6 @@ class StructuredOutputFormatter(LoggerMixin):
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, 'w') as f:
-            json.dump(output, f, indent=2)
+        write_json(output, file_path)
 
         self.logger.info(f"Wrote structured output to {file_path}")
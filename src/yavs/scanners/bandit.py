@@ -98,6 +98,9 @@ class BanditScanner(BaseScanner):
 
         results = data.get("results", [])
 
+        tool_name = self.tool_name
+        category = self.category
+
         for result in results:
             # Get severity
             severity = result.get("issue_severity", "INFO").upper()
@@ -136,8 +139,8 @@ class BanditScanner(BaseScanner):
             description = " | ".join(description_parts) if description_parts else None
 
             finding = {
-                "tool": self.tool_name,
-                "category": self.category,
+                "tool": tool_name,
+                "category": category,
                 "severity": severity,
                 "file": file_path,
                 "line": line,
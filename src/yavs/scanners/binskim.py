@@ -126,6 +126,9 @@ class BinSkimScanner(BaseScanner):
         findings = []
 
         runs = data.get("runs", [])
+        tool_name = self.tool_name
+        category = self.category
+
         for run in runs:
             results = run.get("results", [])
 
@@ -173,8 +176,8 @@ class BinSkimScanner(BaseScanner):
                         description = f"Help: {help_text}"
 
                 finding = {
-                    "tool": self.tool_name,
-                    "category": self.category,
+                    "tool": tool_name,
+                    "category": category,
                     "severity": severity,
                     "file": file_path,
                     "line": None,  # Binary analysis doesn't have line numbers
@@ -114,6 +114,8 @@ class CheckovScanner(BaseScanner):
             # Format 2: No results key, no findings
             failed_checks = []
 
+        tool_name = self.tool_name
+
         for check in failed_checks:
             # Skip if check is not a dict (defensive programming)
             if not isinstance(check, dict):
@@ -151,7 +153,7 @@ class CheckovScanner(BaseScanner):
             category = self._determine_category(check_id)
 
             finding = {
-                "tool": self.tool_name,
+                "tool": tool_name,
                 "category": category,
                 "severity": severity,
                 "file": file_path,
@@ -87,6 +87,9 @@ class SemgrepScanner(BaseScanner):
 
         results = data.get("results", [])
 
+        tool_name = self.tool_name
+        category = self.category
+
         for result in results:
             # Extract severity from extra metadata
             extra = result.get("extra", {})
@@ -113,8 +116,8 @@ class SemgrepScanner(BaseScanner):
             description = " | ".join(description_parts) if description_parts else None
 
             finding = {
-                "tool": self.tool_name,
-                "category": self.category,
+                "tool": tool_name,
+                "category": category,
                 "severity": normalized_severity,
                 "file": result.get("path"),
                 "line": result.get("start", {}).get("line"),
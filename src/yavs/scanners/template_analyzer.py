@@ -85,6 +85,9 @@ class TemplateAnalyzerScanner(BaseScanner):
         # Extract results array
         results = data.get("results", [])
 
+        tool_name = self.tool_name
+        category = self.category
+
         for result in results:
             file_path = result.get("filePath", "")
             violations = result.get("violations", [])
@@ -95,8 +98,8 @@ class TemplateAnalyzerScanner(BaseScanner):
 
                 # Build normalized finding
                 finding = {
-                    "tool": self.tool_name,
-                    "category": self.category,
+                    "tool": tool_name,
+                    "category": category,
                     "severity": severity,
                     "title": violation.get("ruleName", violation.get("ruleId", "Unknown Rule")),
                     "description": violation.get("message", ""),
@@ -92,14 +92,17 @@ class TerrascanScanner(BaseScanner):
         results = data.get("results", {})
         violations = results.get("violations", [])
 
+        tool_name = self.tool_name
+        category = self.category
+
         for violation in violations:
             # Normalize severity
             severity = self._normalize_severity(violation.get("severity", "MEDIUM"))
 
             # Build normalized finding
             finding = {
-                "tool": self.tool_name,
-                "category": self.category,
+                "tool": tool_name,
+                "category": category,
                 "severity": severity,
                 "title": violation.get("rule_name", "Unknown Rule"),
                 "description": violation.get("description", ""),
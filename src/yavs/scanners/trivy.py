@@ -140,6 +140,8 @@ class TrivyScanner(BaseScanner):
 
         results = data.get("Results", [])
 
+        tool_name = self.tool_name
+
         for result in results:
             target = result.get("Target", "unknown")
 
@@ -147,7 +149,7 @@ class TrivyScanner(BaseScanner):
             vulnerabilities = result.get("Vulnerabilities") or []
             for vuln in vulnerabilities:
                 finding = {
-                    "tool": self.tool_name,
+                    "tool": tool_name,
                     "category": "dependency",
                     "severity": vuln.get("Severity", "UNKNOWN").upper(),
                     "file": target,
@@ -164,7 +166,7 @@ class TrivyScanner(BaseScanner):
             secrets = result.get("Secrets") or []
             for secret in secrets:
                 finding = {
-                    "tool": self.tool_name,
+                    "tool": tool_name,
                     "category": "secret",
                     "severity": secret.get("Severity", "HIGH").upper(),
                     "file": target,
@@ -178,7 +180,7 @@ class TrivyScanner(BaseScanner):
             misconfigs = result.get("Misconfigurations") or []
             for misconfig in misconfigs:
                 finding = {
-                    "tool": self.tool_name,
+                    "tool": tool_name,
                     "category": "config",
                     "severity": misconfig.get("Severity", "MEDIUM").upper(),
                     "file": target,
@@ -196,7 +198,7 @@ class TrivyScanner(BaseScanner):
                 severity = license_finding.get("Severity", "LOW").upper()
                 if severity in ["CRITICAL", "HIGH", "MEDIUM", "LOW"]:
                     finding = {
-                        "tool": self.tool_name,
+                        "tool": tool_name,
                         "category": "license",
                         "severity": severity,
                         "file": target,
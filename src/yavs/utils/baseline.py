@@ -1,11 +1,12 @@
 """Baseline management for tracking security findings over time."""
 
-import json
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Any, Set, Tuple
 from datetime import datetime
 
+from .json_io import read_json, write_json
+
 
 class FindingFingerprint:
     """
@@ -71,8 +72,7 @@ class Baseline:
         Args:
             baseline_path: Path to baseline JSON file
         """
-        with open(baseline_path, 'r') as f:
-            self.baseline_data = json.load(f)
+        self.baseline_data = read_json(baseline_path)
 
         # Extract fingerprints
         self.fingerprints = set(self.baseline_data.get("fingerprints", []))
@@ -113,8 +113,7 @@ class Baseline:
         # Save if path provided
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(baseline, f, indent=2)
+            write_json(baseline, output_path)
 
         self.baseline_data = baseline
         self.fingerprints = set(fingerprints)
@@ -213,8 +212,7 @@ class Baseline:
             output_path: Path to save baseline
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(self.baseline_data, f, indent=2)
+        write_json(self.baseline_data, output_path)
 
     @staticmethod
     def _severity_rank(severity: str) -> int:
@@ -253,11 +251,8 @@ def diff_scans(
         Tuple of (new_findings, fixed_findings, existing_findings)
     """
     # Load both scan results
-    with open(baseline_path, 'r') as f:
-        baseline_data = json.load(f)
-
-    with open(current_path, 'r') as f:
-        current_data = json.load(f)
+    baseline_data = read_json(baseline_path)
+    current_data = read_json(current_path)
 
     # Extract findings from different formats
     baseline_findings = _extract_findings(baseline_data)
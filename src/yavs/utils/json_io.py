@@ -0,0 +1,108 @@
+"""JSON output helpers."""
+
+import json
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+
+@lru_cache(maxsize=None)
+def _load_orjson():
+    """
+    Import orjson on first use; it is an optional speedup (pip install yavs[fast]).
+
+    Importing it takes around 15ms, too much to pay on every CLI start.
+
+    Returns:
+        The orjson module, or None if it is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path], mode: str = 'w', **kwargs: Any) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces path only once it is fully written.
+
+    The temporary file sits next to path (so os.replace stays on one
+    filesystem) and is removed if the block raises, so readers never see
+    a truncated output file.
+
+    Args:
+        path: Final file path
+        mode: Write mode ('w' or 'wb')
+        **kwargs: Extra arguments for open (e.g. encoding)
+
+    Yields:
+        Open file object for the temporary file
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Atomically write an object to a file as indented JSON.
+
+    Uses orjson when it is installed, which serializes large findings
+    arrays several times faster than the stdlib encoder. Falls back to
+    json.dump for objects orjson rejects (e.g. integers over 64 bits).
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file path
+    """
+    orjson = _load_orjson()
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            with atomic_open(path, 'wb') as f:
+                f.write(data)
+            return
+
+    with atomic_open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Load a JSON file.
+
+    The file is read as bytes in one call and parsed with orjson when it
+    is installed, which builds large findings documents several times
+    faster than the stdlib decoder. Documents orjson rejects (e.g. NaN
+    values the stdlib accepts) are re-parsed with json.loads, which also
+    produces the usual error message for invalid JSON.
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Parsed JSON data
+    """
+    data = Path(path).read_bytes()
+
+    orjson = _load_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(data)
@@ -16,12 +16,14 @@ console = Console()
 _logging_initialized = False
 
 
-def configure_logging(config: Dict[str, Any]):
+def configure_logging(config: Dict[str, Any], quiet: bool = False):
     """
     Configure logging based on config settings.
 
     Args:
         config: Logging configuration dict from config.yaml
+        quiet: Only show warnings and errors on the console; the file log
+            keeps the configured level
     """
     global _logging_initialized
 
@@ -31,10 +33,16 @@ def configure_logging(config: Dict[str, Any]):
     level = config.get("level", "INFO").upper()
     log_format = config.get("format", "rich").lower()
     file_config = config.get("file", {})
+    file_enabled = bool(file_config) and file_config.get("enabled", False)
 
-    # Set root logger level
+    console_level = getattr(logging, level)
+    if quiet:
+        console_level = max(console_level, logging.WARNING)
+
+    # Set root logger level. Without a file log, quiet runs raise it too so
+    # suppressed records are dropped before any formatting work.
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level))
+    root_logger.setLevel(getattr(logging, level) if file_enabled else console_level)
 
     # Clear any existing handlers
     root_logger.handlers.clear()
@@ -58,11 +66,11 @@ def configure_logging(config: Dict[str, Any]):
         )
         console_handler.setFormatter(json_formatter)
 
-    console_handler.setLevel(getattr(logging, level))
+    console_handler.setLevel(console_level)
     root_logger.addHandler(console_handler)
 
     # Configure file handler if enabled
-    if file_config.get("enabled", False):
+    if file_enabled:
         file_path = Path(file_config.get("path", "yavs.log"))
         max_bytes = file_config.get("max_bytes", 10485760)  # 10MB default
         backup_count = file_config.get("backup_count", 3)
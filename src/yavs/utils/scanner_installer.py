@@ -7,7 +7,6 @@ import tarfile
 import zipfile
 from pathlib import Path
 from typing import Optional, Tuple
-import requests
 
 from .logging import get_logger
 from .tool_versions import get_tested_version
@@ -148,6 +147,9 @@ def download_file(url: str, destination: Path, show_progress: bool = True) -> bo
     Returns:
         True if successful, False otherwise
     """
+    # Imported here: requests is only needed for the rare download path
+    import requests
+
     try:
         from rich.progress import (
             Progress,
@@ -1,9 +1,21 @@
 """Subprocess execution utilities for running scanner commands."""
 
-import subprocess  # nosec B404 - Safe: hardcoded command, no user input
+import os
 import shlex
-from typing import Tuple, Optional
+import signal
+import subprocess  # nosec B404 - Safe: hardcoded command, no user input
+import threading
 from pathlib import Path
+from typing import Optional, Set, Tuple
+
+# Commands started by run_command that are still running, so an aborted
+# scan can stop the ones its worker threads are waiting on
+_running_processes: Set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+
+# Own process group on POSIX, so helpers a scanner spawns (which share its
+# output pipes) are killed with it
+_OWN_PROCESS_GROUP = os.name == "posix"
 
 
 class CommandExecutionError(Exception):
@@ -15,6 +27,34 @@ class CommandExecutionError(Exception):
         self.stderr = stderr
 
 
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill a command started by run_command, including its process group on POSIX."""
+    try:
+        if _OWN_PROCESS_GROUP:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass  # Already exited
+
+
+def terminate_running_commands() -> int:
+    """
+    Kill every command started by run_command that has not finished yet.
+
+    Worker threads blocked on those commands then return immediately, so
+    an early exit (fail-fast, failure, timeout) does not wait for them.
+
+    Returns:
+        Number of commands killed
+    """
+    with _running_lock:
+        processes = list(_running_processes)
+    for proc in processes:
+        _kill(proc)
+    return len(processes)
+
+
 def run_command(
     command: str,
     cwd: Optional[Path] = None,
@@ -42,24 +82,37 @@ def run_command(
     try:
         # Use shlex.split for safer command parsing
         cmd_parts = shlex.split(command)
+        pipe = subprocess.PIPE if capture_output else None
 
-        result = subprocess.run(  # nosec B603 - Safe: hardcoded command, no user input
+        with subprocess.Popen(  # nosec B603 - Safe: hardcoded command, no user input
             cmd_parts,
             cwd=cwd,
-            capture_output=capture_output,
+            stdout=pipe,
+            stderr=pipe,
             text=True,
-            timeout=timeout,
-            check=False  # We handle errors manually
-        )
-
-        if check and result.returncode != 0:
+            start_new_session=_OWN_PROCESS_GROUP
+        ) as proc:
+            with _running_lock:
+                _running_processes.add(proc)
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except BaseException:
+                # Timeout or Ctrl+C (which no longer reaches the command's own group)
+                _kill(proc)
+                proc.communicate()
+                raise
+            finally:
+                with _running_lock:
+                    _running_processes.discard(proc)
+
+        if check and proc.returncode != 0:
             raise CommandExecutionError(
-                f"Command failed with exit code {result.returncode}: {command}",
-                result.returncode,
-                result.stderr
+                f"Command failed with exit code {proc.returncode}: {command}",
+                proc.returncode,
+                stderr
             )
 
-        return result.returncode, result.stdout, result.stderr
+        return proc.returncode, stdout, stderr
 
     except subprocess.TimeoutExpired as e:
         raise CommandExecutionError(
@@ -16,6 +16,8 @@ Users can:
 - Override to specific versions: yavs tools install --tool <name> --version <ver>
 """
 
+import re
+from importlib import metadata
 from typing import Dict, Optional, Tuple
 from packaging import version as pkg_version
 
@@ -72,6 +74,47 @@ def get_tested_version(tool: str) -> Optional[str]:
     return tool_info.get("tested")
 
 
+def get_installed_version(package: str) -> Optional[str]:
+    """
+    Get the installed version of a Python package in the current environment.
+
+    Reads the package's dist-info metadata directly instead of running
+    `pip show`, so no subprocess (and no pip startup) is needed.
+
+    Args:
+        package: Distribution name (semgrep, bandit, checkov)
+
+    Returns:
+        Installed version string or None if the package is not installed
+    """
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+_VERSION_FIELD_RE = re.compile(r"^Version:(.*)$", re.MULTILINE)
+
+
+def parse_version_field(output: str) -> Optional[str]:
+    """
+    Extract the value of the first "Version:" line from command output.
+
+    Used for `trivy --version`, whose output also lists vulnerability DB
+    metadata; a single regex search avoids splitting it into lines.
+
+    Args:
+        output: Command output
+
+    Returns:
+        Version string or None if no non-empty "Version:" line is present
+    """
+    match = _VERSION_FIELD_RE.search(output)
+    if match is None:
+        return None
+    return match.group(1).strip() or None
+
+
 def get_version_range(tool: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Get the compatible version range for a tool.
@@ -9,13 +9,20 @@ Tests all command-line arguments, flags, and commands including:
 - Subcommands (diff, setup, summarize, report)
 """
 
+import os
+import sys
 import json
 import pytest
 from pathlib import Path
 from typer.testing import CliRunner
 from unittest.mock import Mock, patch, MagicMock
 
-from yavs.cli import app, filter_findings_by_ignore_patterns
+from yavs.cli import (
+    app, filter_findings_by_ignore_patterns, run_scanner_job,
+    resolve_active_scanners, should_run_scanner_in_mode, collapse_scan_targets,
+    load_baseline_suppressions, filter_findings_by_severity_and_baseline, should_fail_fast,
+    which_all, find_config_file, iter_result_findings, _run_pip_install
+)
 
 
 runner = CliRunner()
@@ -339,6 +346,220 @@ class TestProductionFeatures:
         # Should continue despite error
         assert isinstance(result.exit_code, int)
 
+    def test_run_scanner_job_tags_and_filters(self, tmp_path):
+        """Test that a scanner job tags findings with their source and drops ignored paths."""
+        mock_scanner = Mock()
+        mock_scanner.return_value.run.return_value = [
+            {"file": "src/app.py", "severity": "HIGH", "category": "sast"},
+            {"file": "node_modules/x/index.js", "severity": "HIGH", "category": "sast"},
+        ]
+
+        results, category_counts = run_scanner_job(mock_scanner, tmp_path, {"timeout": 60}, ["node_modules/"])
+
+        mock_scanner.assert_called_once_with(tmp_path, timeout=60)
+        assert [f["file"] for f in results] == ["src/app.py"]
+        assert category_counts["sast"] == 1
+        assert results[0]["source"] == f"filesystem:{tmp_path}"
+        assert results[0]["source_type"] == "filesystem"
+
+    def test_collapse_scan_targets(self, tmp_path):
+        """Test that duplicate and nested scan targets are dropped, keeping order."""
+        src = tmp_path / "src"
+        other = tmp_path.parent / "other"
+
+        targets = [src, other, tmp_path, (src / "..").resolve(), src / "pkg"]
+
+        assert collapse_scan_targets(targets) == [other, tmp_path]
+
+    @staticmethod
+    def _slow_scanner(started, finished):
+        """Build a scanner mock whose run() blocks on a real 30s command."""
+        from yavs.utils.subprocess_runner import run_command
+
+        def run():
+            started.set()
+            run_command("sleep 30", timeout=60, check=False)
+            finished.set()
+            return []
+
+        scanner = Mock()
+        scanner.check_available.return_value = True
+        scanner.run.side_effect = run
+        return scanner
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses the POSIX sleep command")
+    @patch('yavs.cli.os.cpu_count', return_value=4)
+    @patch('yavs.utils.preflight.run_preflight_checks')
+    @patch('yavs.cli.BanditScanner')
+    @patch('yavs.cli.SemgrepScanner')
+    def test_fail_fast_kills_running_scanners(self, mock_semgrep, mock_bandit, mock_preflight, mock_cpu_count, tmp_path):
+        """Test --fail-fast returns promptly and stops a scanner that is still running."""
+        import threading
+        import time
+
+        bandit_started, finished = threading.Event(), threading.Event()
+
+        def fast_run():
+            # Report only once the slow scanner is running, so fail-fast has something to stop
+            bandit_started.wait(5)
+            return [{
+                "tool": "semgrep", "category": "sast", "file": "app.py", "line": 1,
+                "severity": "HIGH", "rule_id": "eval-use", "message": "Use of eval"
+            }]
+
+        mock_semgrep.return_value.check_available.return_value = True
+        mock_semgrep.return_value.run.side_effect = fast_run
+        mock_bandit.return_value = self._slow_scanner(bandit_started, finished)
+
+        started = time.monotonic()
+        result = runner.invoke(app, [
+            "scan", str(tmp_path),
+            "--sast",
+            "--no-ai",
+            "--fail-on", "HIGH",
+            "--fail-fast",
+            "--output-dir", str(tmp_path / "output")
+        ])
+
+        assert result.exit_code == 1
+        assert time.monotonic() - started < 10
+        assert finished.wait(5)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses the POSIX sleep command")
+    @patch('yavs.cli.os.cpu_count', return_value=4)
+    @patch('yavs.utils.preflight.run_preflight_checks')
+    @patch('yavs.cli.BanditScanner')
+    @patch('yavs.cli.SemgrepScanner')
+    def test_timeout_kills_running_scanners(self, mock_semgrep, mock_bandit, mock_preflight, mock_cpu_count, tmp_path):
+        """Test --timeout bounds the scan while scanners are still running."""
+        import threading
+        import time
+
+        finished = threading.Event()
+        mock_semgrep.return_value = self._slow_scanner(threading.Event(), finished)
+        mock_bandit.return_value = self._slow_scanner(threading.Event(), threading.Event())
+
+        started = time.monotonic()
+        result = runner.invoke(app, [
+            "scan", str(tmp_path),
+            "--sast",
+            "--no-ai",
+            "--timeout", "1",
+            "--output-dir", str(tmp_path / "output")
+        ])
+
+        assert result.exit_code == 2
+        assert "Scan timeout" in result.output
+        assert time.monotonic() - started < 10
+        assert finished.wait(5)
+
+    @patch('yavs.utils.preflight.run_preflight_checks')
+    @patch('yavs.cli.BanditScanner')
+    @patch('yavs.cli.SemgrepScanner')
+    def test_identical_targets_keep_their_own_findings(self, mock_semgrep, mock_bandit, mock_preflight, tmp_path):
+        """Test that findings from every target reach the results, even when the targets match."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        for directory in (first, second):
+            directory.mkdir()
+            (directory / "app.py").write_text("eval(input())\n")
+
+        def make_scanner(target, **kwargs):
+            scanner = Mock()
+            scanner.check_available.return_value = True
+            scanner.run.return_value = [{
+                "tool": "semgrep",
+                "category": "sast",
+                "file": str(Path(target) / "app.py"),
+                "line": 1,
+                "severity": "HIGH",
+                "rule_id": "eval-use",
+                "message": "Use of eval"
+            }]
+            return scanner
+
+        mock_semgrep.side_effect = make_scanner
+        mock_bandit.return_value.check_available.return_value = True
+        mock_bandit.return_value.run.return_value = []
+        output_dir = tmp_path / "output"
+
+        result = runner.invoke(app, [
+            "scan", str(first), str(second),
+            "--sast",
+            "--no-ai",
+            "--output-dir", str(output_dir)
+        ])
+
+        assert result.exit_code == 0
+        data = json.loads((output_dir / "yavs-results.json").read_text())
+        files = sorted(issue["file"] for group in data["sast"] for issue in group["issues"])
+        assert files == [str(first / "app.py"), str(second / "app.py")]
+
+    def test_load_baseline_suppressions_json_and_yaml(self, tmp_path):
+        """Test that suppressions load from both JSON and YAML baselines."""
+        json_baseline = tmp_path / "baseline.json"
+        json_baseline.write_text(json.dumps({"suppressions": [{"id": "CVE-1"}]}))
+        yaml_baseline = tmp_path / ".yavs-baseline.yaml"
+        yaml_baseline.write_text("suppressions:\n  - id: CVE-2\n")
+        empty_baseline = tmp_path / "empty.yaml"
+        empty_baseline.write_text("")
+
+        assert load_baseline_suppressions(json_baseline) == [{"id": "CVE-1"}]
+        assert load_baseline_suppressions(yaml_baseline) == [{"id": "CVE-2"}]
+        assert load_baseline_suppressions(empty_baseline) == []
+
+    def test_should_fail_fast_threshold(self):
+        """Test that fail-fast triggers at or above the threshold and ignores unknown severities."""
+        findings = [{"severity": "medium"}, {"severity": "UNKNOWN"}]
+
+        assert should_fail_fast(findings, "MEDIUM")
+        assert should_fail_fast(findings, "low")
+        assert not should_fail_fast(findings, "HIGH")
+        assert not should_fail_fast(findings, "BOGUS")
+        assert not should_fail_fast(findings, None)
+
+    def test_filter_findings_by_severity_and_baseline(self):
+        """Test that severity and suppression filters apply in one pass with separate counts."""
+        findings = [
+            {"rule_id": "B101", "severity": "HIGH"},
+            {"vulnerability_id": "CVE-1", "severity": "CRITICAL"},
+            {"package": "lodash", "severity": "HIGH"},
+            {"rule_id": "B102", "severity": "high"},
+            {"rule_id": "B103", "severity": "LOW"},
+        ]
+
+        kept, severity_filtered, suppressed = filter_findings_by_severity_and_baseline(
+            findings, frozenset({"HIGH", "CRITICAL"}), {"B101", "CVE-1", "lodash:HIGH"}
+        )
+
+        assert kept == [{"rule_id": "B102", "severity": "high"}]
+        assert severity_filtered == 1
+        assert suppressed == 3
+
+        kept, severity_filtered, suppressed = filter_findings_by_severity_and_baseline(findings, None, None)
+        assert kept == findings
+        assert (severity_filtered, suppressed) == (0, 0)
+
+    def test_resolve_active_scanners_matches_per_scanner_check(self):
+        """Test that the resolved scanner set agrees with should_run_scanner_in_mode."""
+        config = {
+            "scanners": {
+                "trivy": {"enabled": True},
+                "semgrep": {"enabled": True},
+                "bandit": {"enabled": False},
+                "checkov": {"enabled": True},
+            },
+            "modes": {"compliance": {"scanners": ["checkov"]}},
+        }
+
+        for mode in ["sbom", "sast", "compliance", "all"]:
+            expected = {
+                name for name in config["scanners"]
+                if should_run_scanner_in_mode(config, mode, name)
+            }
+            assert resolve_active_scanners(config, mode) == expected
+
+        assert resolve_active_scanners(config, "compliance") == {"checkov"}
+
 
 class TestIgnorePatterns:
     """Tests for ignore pattern functionality."""
@@ -384,6 +605,48 @@ class TestIgnorePatterns:
         assert len(filtered) == 1
         assert filtered[0]["file"] == "src/main.py"
 
+    def test_ignore_invalid_pattern_skipped(self):
+        """Test that an invalid pattern is skipped and compiled patterns are reused."""
+        from yavs.cli import _compile_ignore_filter
+
+        findings = [
+            {"file": "src/main.py", "severity": "HIGH"},
+            {"file": "vendor/lib.py", "severity": "HIGH"},
+        ]
+
+        filtered = filter_findings_by_ignore_patterns(findings, ["(unclosed", "vendor/"])
+
+        assert [f["file"] for f in filtered] == ["src/main.py"]
+        compiled = _compile_ignore_filter(("(unclosed", "vendor/"))
+        assert [pattern.pattern for pattern in compiled] == ["vendor/"]
+        assert _compile_ignore_filter(("(unclosed", "vendor/")) is compiled
+
+    def test_ignore_patterns_with_inline_flags(self):
+        """Test patterns that cannot be fused into one regex still apply individually."""
+        findings = [
+            {"file": "src/Main.py", "severity": "HIGH"},
+            {"file": "node_modules/x.js", "severity": "HIGH"},
+            {"file": "src/util.py", "severity": "LOW"},
+        ]
+
+        filtered = filter_findings_by_ignore_patterns(findings, ["node_modules/", r"(?i)main\.py$"])
+
+        assert [f["file"] for f in filtered] == ["src/util.py"]
+
+    def test_ignore_literal_patterns_match_anywhere(self):
+        """Test plain directory patterns match like an unanchored regex search."""
+        findings = [
+            {"file": "node_modules/a.js", "severity": "HIGH"},
+            {"file": "web/node_modules/b.js", "severity": "HIGH"},
+            {"file": "tools/xgit/run.sh", "severity": "LOW"},
+            {"file": "src/app.py", "severity": "LOW"},
+        ]
+
+        filtered = filter_findings_by_ignore_patterns(findings, ["node_modules/", ".git/"])
+
+        # ".git/" keeps regex semantics: "." matches any character
+        assert [f["file"] for f in filtered] == ["src/app.py"]
+
     def test_ignore_no_patterns(self):
         """Test with no ignore patterns."""
         findings = [
@@ -418,6 +681,35 @@ class TestIgnorePatterns:
         assert isinstance(result.exit_code, int)
 
 
+class TestIterResultFindings:
+    """Tests for extracting findings from results documents."""
+
+    def test_flat_and_wrapped_formats(self):
+        """Test flat lists and documents with a findings key."""
+        findings = [{"severity": "HIGH"}, {"severity": "LOW"}]
+
+        assert list(iter_result_findings(findings)) == findings
+        assert list(iter_result_findings({"findings": findings})) == findings
+
+    def test_structured_format(self):
+        """Test structured categories with lists and subcategory dicts, in category order."""
+        data = {
+            "sast": [{"id": "sast-1"}],
+            "sbom": {"vulnerabilities": [{"id": "vuln-1"}], "summary": {"total": 1}},
+            "licenses": [{"id": "lic-1"}],
+            "metadata": [{"id": "ignored"}],
+        }
+
+        ids = [finding["id"] for finding in iter_result_findings(data)]
+
+        assert ids == ["vuln-1", "sast-1", "lic-1"]
+
+    def test_unrecognized_document(self):
+        """Test documents without findings yield nothing."""
+        assert list(iter_result_findings({"build_cycle": "x"})) == []
+        assert list(iter_result_findings("not a document")) == []
+
+
 class TestDiffCommand:
     """Tests for the diff subcommand."""
 
@@ -474,6 +766,81 @@ class TestToolsCommand:
         assert result.exit_code == 0
         assert "install" in result.stdout.lower() or "scanner" in result.stdout.lower()
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+    def test_which_all_single_path_pass(self, tmp_path, monkeypatch):
+        """Test which_all resolves several names in PATH order, skipping non-executables."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        for directory, name in [(first, "semgrep"), (second, "semgrep"), (second, "bandit")]:
+            executable = directory / name
+            executable.write_text("#!/bin/sh\n")
+            executable.chmod(0o755)
+        (first / "checkov").write_text("not executable")
+
+        monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)]))
+
+        found = which_all(["semgrep", "bandit", "checkov"])
+
+        assert found == {
+            "semgrep": str(first / "semgrep"),
+            "bandit": str(second / "bandit"),
+        }
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell script stands in for pip")
+    def test_run_pip_install_timeout_kills_and_keeps_output(self, tmp_path, monkeypatch):
+        """Test that a pip run past its timeout is killed and its buffered output is surfaced."""
+        import subprocess
+        import time
+
+        fake_python = tmp_path / "python"
+        fake_python.write_text("#!/bin/sh\necho 'Collecting checkov'\nsleep 30\n")
+        fake_python.chmod(0o755)
+        monkeypatch.setattr(sys, "executable", str(fake_python))
+
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+            _run_pip_install("checkov", timeout=1)
+
+        # The sleeping child shares pip's output pipe, so it must die too
+        assert time.monotonic() - started < 10
+        assert "Collecting checkov" in excinfo.value.output
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX shell script stands in for pip")
+    def test_run_pip_install_timeout_after_pip_exits(self, tmp_path, monkeypatch):
+        """Test that the timeout holds when a child keeps the output open after pip exits."""
+        import subprocess
+        import time
+
+        fake_python = tmp_path / "python"
+        fake_python.write_text("#!/bin/sh\necho 'Building wheel'\nsleep 30 &\nexit 0\n")
+        fake_python.chmod(0o755)
+        monkeypatch.setattr(sys, "executable", str(fake_python))
+
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+            _run_pip_install("checkov", timeout=1)
+
+        assert time.monotonic() - started < 10
+        assert "Building wheel" in excinfo.value.output
+
+    @patch('yavs.cli._run_pip_install')
+    def test_tools_install_timeout_shows_pip_output(self, mock_pip):
+        """Test that a timed-out install prints the tail of pip's output."""
+        import subprocess
+
+        mock_pip.side_effect = subprocess.TimeoutExpired(
+            ["pip", "install", "bandit"], 300, output="Building wheel for bandit\n"
+        )
+
+        result = runner.invoke(app, ["tools", "install", "--tool", "bandit"])
+
+        assert result.exit_code == 1
+        assert "Installation timed out" in result.output
+        assert "Building wheel for bandit" in result.output
+
 
 class TestSummarizeCommand:
     """Tests for the summarize subcommand."""
@@ -575,6 +942,27 @@ class TestConfigFile:
         # Should load config
         assert isinstance(result.exit_code, int)
 
+    def test_find_config_file_search_order(self, tmp_path, monkeypatch):
+        """Test config auto-detection prefers yavs.yaml, then config.yaml, then the global config."""
+        project = tmp_path / "project"
+        home = tmp_path / "home"
+        project.mkdir()
+        (home / ".yavs").mkdir(parents=True)
+        monkeypatch.chdir(project)
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("USERPROFILE", str(home))
+
+        assert find_config_file() is None
+
+        (home / ".yavs" / "config.yaml").write_text("scan: {}\n")
+        assert find_config_file() == home / ".yavs" / "config.yaml"
+
+        (project / "config.yaml").write_text("scan: {}\n")
+        assert find_config_file() == Path("config.yaml")
+
+        (project / "yavs.yaml").write_text("scan: {}\n")
+        assert find_config_file() == Path("yavs.yaml")
+
 
 class TestDockerImageScanning:
     """Tests for Docker image scanning features."""
@@ -616,6 +1004,82 @@ class TestDockerImageScanning:
         # Should attempt to scan both images
         assert mock_trivy.called
 
+    @patch('yavs.utils.preflight.run_preflight_checks')
+    @patch('yavs.cli.TrivyScanner')
+    def test_scan_images_checks_trivy_once(self, mock_trivy, mock_preflight, tmp_path):
+        """Test Trivy is checked once before image scans fan out, and not run if missing."""
+        mock_instance = Mock()
+        mock_instance.run.return_value = []
+        mock_instance.check_available.return_value = False
+        mock_instance.tool_name = "trivy"
+        mock_trivy.return_value = mock_instance
+
+        result = runner.invoke(app, [
+            "scan",
+            str(tmp_path),
+            "--sbom",
+            "--no-ai",
+            "--continue-on-error",
+            "--images", "nginx:latest",
+            "--images", "python:3.11",
+            "--output-dir", str(tmp_path)
+        ])
+
+        assert result.exit_code == 0
+        assert not mock_instance.run.called
+        assert "nginx:latest failed: trivy is not installed" in result.output
+        assert "python:3.11 failed: trivy is not installed" in result.output
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses the POSIX sleep command")
+    @patch('yavs.utils.preflight.run_preflight_checks')
+    @patch('yavs.cli.TrivyScanner')
+    def test_scan_images_fail_fast_kills_running_scans(self, mock_trivy, mock_preflight, tmp_path):
+        """Test --fail-fast returns promptly while another image scan is still running."""
+        import threading
+        import time
+        from yavs.utils.subprocess_runner import run_command
+
+        slow_started, finished = threading.Event(), threading.Event()
+
+        def make_scanner(target, scan_type="fs", **kwargs):
+            def run():
+                if scan_type != "image":
+                    return []
+                if str(target) == "python:3.11":
+                    slow_started.set()
+                    run_command("sleep 30", timeout=60, check=False)
+                    finished.set()
+                    return []
+                # Report only once the slow scan is running, so fail-fast has something to stop
+                slow_started.wait(5)
+                return [{
+                    "tool": "trivy", "category": "dependency", "file": "Dockerfile",
+                    "severity": "CRITICAL", "rule_id": "CVE-2024-0001", "message": "Vulnerable package"
+                }]
+
+            scanner = Mock()
+            scanner.check_available.return_value = True
+            scanner.run.side_effect = run
+            return scanner
+
+        mock_trivy.side_effect = make_scanner
+
+        started = time.monotonic()
+        result = runner.invoke(app, [
+            "scan", str(tmp_path),
+            "--sbom",
+            "--no-ai",
+            "--fail-on", "HIGH",
+            "--fail-fast",
+            "--images", "nginx:latest",
+            "--images", "python:3.11",
+            "--output-dir", str(tmp_path / "output")
+        ])
+
+        assert result.exit_code == 1
+        assert time.monotonic() - started < 10
+        assert finished.wait(5)
+
     def test_scan_images_from_file(self, tmp_path):
         """Test scanning images from file."""
         images_file = tmp_path / "images.txt"
@@ -25,6 +25,15 @@ def test_aggregator_add_findings():
     assert len(agg.get_findings()) == 2
 
 
+def test_aggregator_add_findings_from_generator():
+    """Test that add_findings consumes any iterable of findings."""
+    agg = Aggregator()
+
+    agg.add_findings({"tool": "bandit", "severity": "LOW", "line": i} for i in range(3))
+
+    assert [f["line"] for f in agg.get_findings()] == [0, 1, 2]
+
+
 def test_aggregator_deduplication():
     """Test finding deduplication."""
     agg = Aggregator()
@@ -58,6 +67,20 @@ def test_aggregator_deduplication():
     assert len(agg.get_findings()) == 2
 
 
+def test_aggregator_deduplicate_on_add():
+    """Test that duplicates are dropped as they are added, across calls."""
+    agg = Aggregator(deduplicate_on_add=True)
+
+    finding = {"file": "test.py", "line": 10, "rule_id": "TEST-001", "message": "Test finding"}
+    agg.add_findings([finding, dict(finding), dict(finding, line=20)])
+    agg.add_findings([dict(finding)])
+
+    assert [f["line"] for f in agg.get_findings()] == [10, 20]
+
+    agg.deduplicate()
+    assert len(agg.get_findings()) == 2
+
+
 def test_aggregator_sort_by_severity():
     """Test sorting by severity."""
     agg = Aggregator()
@@ -218,6 +241,8 @@ def test_aggregator_read_json_structured_format():
         categories = [f['category'] for f in findings]
         assert 'compliance' in categories
         assert 'sast' in categories
+        # The parsed document is kept as it was on disk
+        assert agg.raw_document == structured_data
     finally:
         temp_path.unlink()
 
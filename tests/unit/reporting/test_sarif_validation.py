@@ -161,3 +161,35 @@ def test_sarif_rules_generation():
     # Should deduplicate rules
     assert len(rules) == 1
     assert rules[0]["id"] == "SQLI-001"
+
+
+@pytest.mark.parametrize("findings", [
+    [],
+    [
+        {
+            "tool": "test",
+            "category": "test",
+            "severity": "HIGH",
+            "file": "test.py",
+            "line": 3,
+            "message": 'Quoted "results": [] and\na newline',
+            "rule_id": "TEST-001",
+            "metadata": {"nested": [1, {"key": "ü"}]}
+        },
+        {"tool": "test", "severity": "LOW", "message": "No location"}
+    ]
+])
+def test_convert_and_write_streams_same_document(tmp_path, findings):
+    """Test that the streamed SARIF file matches the in-memory conversion."""
+    converter = SARIFConverter(base_path=tmp_path)
+    output = tmp_path / "results.sarif"
+
+    converter.convert_and_write(findings, output)
+
+    written = json.loads(output.read_text(encoding="utf-8"))
+    expected = converter.convert(findings)
+    for document in (written, expected):
+        document["runs"][0]["invocations"][0].pop("endTimeUtc")
+
+    assert written == expected
+    assert list(tmp_path.iterdir()) == [output]
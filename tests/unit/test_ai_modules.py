@@ -1,8 +1,13 @@
 """Comprehensive tests for AI modules (fixer, summarizer, triage)."""
-import pytest
+import asyncio
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from yavs.ai.fixer import Fixer
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from yavs.ai.cache import LLMCache, create_cache
+from yavs.ai.fixer import Fixer, _TokenBucket
+from yavs.ai.provider import AIProvider
 from yavs.ai.summarizer import Summarizer
 from yavs.ai.triage import TriageEngine
 
@@ -151,10 +156,11 @@ class TestFixer:
         mock_provider = Mock()
         mock_provider.provider_name = "anthropic"
         mock_provider.model_name = "claude-3-5-sonnet-20241022"
-        mock_provider.create_completion = Mock(return_value="Fix suggestion")
+        mock_provider.acreate_completion = AsyncMock(return_value="Fix suggestion")
+        mock_provider.aclose = AsyncMock()
         mock_create_provider.return_value = mock_provider
 
-        fixer = Fixer(parallel_requests=2)
+        fixer = Fixer(parallel_requests=2, batch_size=1)
         findings = [
             {"severity": "CRITICAL", "message": "Issue 1", "file": "a.py"},
             {"severity": "HIGH", "message": "Issue 2", "file": "b.py"},
@@ -170,6 +176,182 @@ class TestFixer:
             if f.get("severity") in ["CRITICAL", "HIGH"] and "ai_fix" in f
         ]
         assert len(critical_high_with_fix) == 2
+        assert all(f["ai_fix"] == "Fix suggestion" for f in critical_high_with_fix)
+        assert mock_provider.acreate_completion.await_count == 2
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_preserves_order(self, mock_create_provider):
+        """Test that batch processing returns findings in their original order."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(side_effect=["Fix A", Exception("API Error")])
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(parallel_requests=1, batch_size=1)
+        findings = [
+            {"severity": "LOW", "message": "Issue 0", "file": "z.py"},
+            {"severity": "HIGH", "message": "Issue 1", "file": "a.py"},
+            {"severity": "CRITICAL", "message": "Issue 2", "file": "b.py"},
+        ]
+
+        result = fixer.generate_fixes_batch(findings)
+
+        assert result is findings
+        assert [f["message"] for f in result] == ["Issue 0", "Issue 1", "Issue 2"]
+        assert result[1]["ai_fix"] == "Fix A"
+        assert "Unable to generate fix" in result[2]["ai_fix"]
+        mock_provider.aclose.assert_awaited_once()
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_deduplicates_prompts(self, mock_create_provider):
+        """Test that findings with identical prompts share one API request."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(return_value="Upgrade lodash")
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer()
+        duplicate = {
+            "severity": "CRITICAL", "message": "Vulnerable package", "file": "package.json",
+            "rule_id": "CVE-2021-1234", "category": "dependency",
+            "package": "lodash", "version": "4.17.20", "fixed_version": "4.17.21",
+        }
+        findings = [dict(duplicate, tool="trivy"), dict(duplicate, tool="other")]
+
+        fixer.generate_fixes_batch(findings)
+
+        assert mock_provider.acreate_completion.await_count == 1
+        assert all(f["ai_fix"] == "Upgrade lodash" for f in findings)
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_bounds_concurrency(self, mock_create_provider):
+        """Test that no more than parallel_requests calls are in flight at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_completion(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Fix suggestion"
+
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = fake_completion
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(parallel_requests=2, batch_size=1)
+        findings = [
+            {"severity": "HIGH", "message": f"Issue {i}", "file": f"{i}.py"}
+            for i in range(6)
+        ]
+
+        fixer.generate_fixes_batch(findings)
+
+        assert max_in_flight == 2
+        assert all(f["ai_fix"] == "Fix suggestion" for f in findings)
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_sends_one_request_per_batch(self, mock_create_provider):
+        """Test that several findings are answered by one JSON array response."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(return_value=(
+            '```json\n[{"id": 2, "fix": "Fix B"}, {"id": 1, "fix": "Fix A"}, {"id": 3, "fix": "Fix C"}]\n```'
+        ))
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(batch_size=10)
+        findings = [
+            {"severity": "HIGH", "message": f"Issue {i}", "file": f"{i}.py"}
+            for i in range(3)
+        ]
+
+        fixer.generate_fixes_batch(findings)
+
+        assert mock_provider.acreate_completion.await_count == 1
+        prompt = mock_provider.acreate_completion.await_args.kwargs["prompt"]
+        assert "## Finding 3" in prompt and "JSON array" in prompt
+        assert [f["ai_fix"] for f in findings] == ["Fix A", "Fix B", "Fix C"]
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_retries_uncovered_findings(self, mock_create_provider):
+        """Test that findings missing from a truncated batch response fall back to single requests."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(side_effect=[
+            '[{"id": 1, "fix": "Fix A"}]',  # Only the first finding answered
+            "Fix B",
+        ])
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(batch_size=2)
+        findings = [
+            {"severity": "HIGH", "message": "Issue A", "file": "a.py"},
+            {"severity": "HIGH", "message": "Issue B", "file": "b.py"},
+        ]
+
+        fixer.generate_fixes_batch(findings)
+
+        assert mock_provider.acreate_completion.await_count == 2
+        retry_prompt = mock_provider.acreate_completion.await_args.kwargs["prompt"]
+        assert retry_prompt == fixer._build_fix_prompt(findings[1])
+        assert [f["ai_fix"] for f in findings] == ["Fix A", "Fix B"]
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_does_not_split_failed_requests(self, mock_create_provider):
+        """Test that a provider error fails the batch once instead of fanning out into smaller batches."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(side_effect=Exception("401 invalid x-api-key"))
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(batch_size=4, max_tokens=1000)
+        findings = [
+            {"severity": "HIGH", "message": f"Issue {i}", "file": f"{i}.py"}
+            for i in range(4)
+        ]
+
+        fixer.generate_fixes_batch(findings)
+
+        assert mock_provider.acreate_completion.await_count == 1
+        assert mock_provider.acreate_completion.await_args.kwargs["max_tokens"] == 4000
+        assert all(f["ai_fix"].startswith("Unable to generate fix: 401") for f in findings)
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_generate_fixes_batch_respects_limit(self, mock_create_provider):
+        """Test that only the first `limit` findings are considered for fixes."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.acreate_completion = AsyncMock(return_value="Fix suggestion")
+        mock_provider.aclose = AsyncMock()
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer()
+        findings = [
+            {"severity": "high", "message": "Issue 1", "file": "a.py"},
+            {"severity": "CRITICAL", "message": "Issue 2", "file": "b.py"},
+        ]
+
+        result = fixer.generate_fixes_batch(findings, limit=1)
+
+        assert "ai_fix" in result[0]
+        assert "ai_fix" not in result[1]
 
     @patch('yavs.ai.fixer.create_provider')
     def test_generate_fixes_batch_empty_list(self, mock_create_provider):
@@ -197,6 +379,294 @@ class TestFixer:
         assert info["model"] == "claude-3-5-sonnet-20241022"
 
 
+class TestTokenBucket:
+    """Tests for the Fixer rate-limit token bucket."""
+
+    def test_reserve_within_capacity_does_not_wait(self):
+        """Test that requests under the limit are granted immediately."""
+        bucket = _TokenBucket(60)
+        assert all(bucket.reserve() == 0.0 for _ in range(60))
+
+    def test_reserve_over_capacity_spaces_callers(self):
+        """Test that each request past the limit waits one refill interval longer."""
+        bucket = _TokenBucket(60)  # 1 token per second
+        for _ in range(60):
+            bucket.reserve()
+
+        first_wait = bucket.reserve()
+        second_wait = bucket.reserve()
+        assert first_wait == pytest.approx(1.0, abs=0.05)
+        assert second_wait == pytest.approx(2.0, abs=0.05)
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_fixer_enforces_tokens_per_minute(self, mock_create_provider):
+        """Test that large requests wait on the TPM budget even under the RPM limit."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(max_tokens=1000, rate_limit_rpm=50, rate_limit_tpm=1200)
+
+        with patch('yavs.ai.fixer.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            asyncio.run(fixer._wait_for_rate_limit(1000))
+            mock_sleep.assert_not_awaited()
+
+            asyncio.run(fixer._wait_for_rate_limit(1000))
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.await_args.args[0] == pytest.approx(40.0, abs=0.5)
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_fixer_zero_rate_limits_are_unlimited(self, mock_create_provider):
+        """Test that a rate limit of 0 or None disables throttling."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(rate_limit_rpm=0, rate_limit_tpm=None)
+
+        with patch('yavs.ai.fixer.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            for _ in range(3):
+                asyncio.run(fixer._wait_for_rate_limit(100000))
+            mock_sleep.assert_not_awaited()
+
+
+class TestLLMCache:
+    """Tests for the AI response cache."""
+
+    def test_cache_roundtrip(self, tmp_path):
+        """Test storing and retrieving a cached response."""
+        cache = LLMCache(path=tmp_path / "cache.sqlite3")
+        key = LLMCache.make_key("anthropic", "claude", "prompt", 2048)
+
+        assert cache.get(key) is None
+        cache.set(key, "Cached fix")
+        assert cache.get(key) == "Cached fix"
+
+    def test_cache_key_depends_on_request(self):
+        """Test that keys differ when model, prompt or max_tokens differ."""
+        base = LLMCache.make_key("anthropic", "claude", "prompt", 2048)
+        assert base == LLMCache.make_key("anthropic", "claude", "prompt", 2048)
+        assert base != LLMCache.make_key("anthropic", "other-model", "prompt", 2048)
+        assert base != LLMCache.make_key("anthropic", "claude", "other prompt", 2048)
+        assert base != LLMCache.make_key("anthropic", "claude", "prompt", 1024)
+
+    def test_cache_expired_entry_is_miss(self, tmp_path):
+        """Test that expired entries are not returned."""
+        cache = LLMCache(path=tmp_path / "cache.sqlite3")
+        cache.set("key", "stale", ttl=-1)
+        assert cache.get("key") is None
+
+    def test_cache_prunes_on_open(self, tmp_path):
+        """Test that expired entries and entries beyond max_entries are deleted when reopened."""
+        path = tmp_path / "cache.sqlite3"
+        cache = LLMCache(path=path)
+        cache.set("stale", "old", ttl=-1)
+        for i in range(4):
+            cache.set(f"key{i}", f"fix {i}", ttl=100 + i)
+
+        reopened = LLMCache(path=path, max_entries=2)
+        rows = reopened._connect().execute("SELECT key FROM responses ORDER BY key").fetchall()
+
+        assert [row[0] for row in rows] == ["key2", "key3"]
+
+    def test_create_cache_disabled(self):
+        """Test that a disabled cache config yields no cache."""
+        assert create_cache({"enabled": False}) is None
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_fixer_uses_cache_when_deterministic(self, mock_create_provider, tmp_path):
+        """Test that a cached fix skips the provider call at temperature 0."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.create_completion = Mock(return_value="Fresh fix")
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(cache=LLMCache(path=tmp_path / "cache.sqlite3"))
+        finding = {"severity": "HIGH", "message": "SQL Injection", "file": "app.py"}
+
+        assert fixer.generate_fix(finding) == "Fresh fix"
+        assert fixer.generate_fix(finding) == "Fresh fix"
+        assert mock_provider.create_completion.call_count == 1
+
+    @patch('yavs.ai.fixer.create_provider')
+    def test_fixer_skips_cache_when_not_deterministic(self, mock_create_provider, tmp_path):
+        """Test that non-zero temperature always calls the provider."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_provider.create_completion = Mock(return_value="Fresh fix")
+        mock_create_provider.return_value = mock_provider
+
+        fixer = Fixer(temperature=0.5, cache=LLMCache(path=tmp_path / "cache.sqlite3"))
+        finding = {"severity": "HIGH", "message": "SQL Injection", "file": "app.py"}
+
+        fixer.generate_fix(finding)
+        fixer.generate_fix(finding)
+        assert mock_provider.create_completion.call_count == 2
+
+
+class _StatusError(Exception):
+    """Stand-in for an SDK APIStatusError."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = Mock(headers=headers or {})
+
+
+class _FlakyProvider(AIProvider):
+    """Provider whose backend fails with the given errors before succeeding."""
+
+    def __init__(self, errors):
+        self.backend = Mock(side_effect=list(errors) + ["ok"])
+
+    def create_completion(self, prompt, max_tokens, temperature):
+        return self._call_with_retry(self.backend, prompt)
+
+    @property
+    def provider_name(self):
+        return "flaky"
+
+    @property
+    def model_name(self):
+        return "flaky-1"
+
+
+class TestProviderRetry:
+    """Tests for provider-level retry with backoff."""
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_retries_rate_limit_then_succeeds(self, mock_sleep):
+        """Test that 429/529 responses are retried."""
+        provider = _FlakyProvider([_StatusError(429), _StatusError(529)])
+
+        assert provider.create_completion("p", 10, 0.0) == "ok"
+        assert provider.backend.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_honors_retry_after_header(self, mock_sleep):
+        """Test that Retry-After overrides the backoff delay."""
+        provider = _FlakyProvider([_StatusError(429, {"retry-after": "7"})])
+
+        provider.create_completion("p", 10, 0.0)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_honors_long_retry_after_headers(self, mock_sleep):
+        """Test that Retry-After and retry-after-ms beyond the backoff cap are still honoured."""
+        provider = _FlakyProvider([
+            _StatusError(429, {"retry-after": "30"}),
+            _StatusError(429, {"retry-after-ms": "45000", "retry-after": "1"}),
+        ])
+
+        provider.create_completion("p", 10, 0.0)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [30.0, 45.0]
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_ignores_excessive_retry_after(self, mock_sleep):
+        """Test that a Retry-After over 60s falls back to capped backoff."""
+        from yavs.ai.provider import RETRY_MAX_DELAY_SECONDS
+
+        provider = _FlakyProvider([_StatusError(429, {"retry-after": "600"})])
+
+        provider.create_completion("p", 10, 0.0)
+        assert 0 <= mock_sleep.call_args.args[0] <= RETRY_MAX_DELAY_SECONDS
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_does_not_retry_client_errors(self, mock_sleep):
+        """Test that non-transient errors are raised immediately."""
+        provider = _FlakyProvider([_StatusError(400)])
+
+        with pytest.raises(_StatusError):
+            provider.create_completion("p", 10, 0.0)
+        mock_sleep.assert_not_called()
+
+    @patch('yavs.ai.provider.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        """Test that retries stop after RETRY_MAX_ATTEMPTS."""
+        from yavs.ai.provider import RETRY_MAX_ATTEMPTS
+
+        provider = _FlakyProvider([_StatusError(503)] * RETRY_MAX_ATTEMPTS)
+
+        with pytest.raises(_StatusError):
+            provider.create_completion("p", 10, 0.0)
+        assert provider.backend.call_count == RETRY_MAX_ATTEMPTS
+
+
+class TestCreateProvider:
+    """Tests for provider instance reuse."""
+
+    @patch('yavs.ai.provider._provider_instances', {})
+    @patch('yavs.ai.provider.AnthropicProvider')
+    def test_reuses_instance_for_same_config(self, mock_anthropic):
+        """Test that repeated calls share one provider until the API key changes."""
+        from yavs.ai.provider import create_provider
+
+        mock_anthropic.side_effect = lambda **kwargs: Mock()
+        with patch.dict('os.environ', {"ANTHROPIC_API_KEY": "key-1"}, clear=True):
+            first = create_provider("anthropic")
+            assert create_provider("anthropic") is first
+        with patch.dict('os.environ', {"ANTHROPIC_API_KEY": "key-2"}, clear=True):
+            assert create_provider("anthropic") is not first
+        assert mock_anthropic.call_count == 2
+
+
+class TestStreamingCompletion:
+    """Tests for streamed provider completions."""
+
+    @patch.dict('os.environ', {"OPENAI_API_KEY": "test-key"})
+    def test_openai_accumulates_stream_chunks(self):
+        """Test that streamed deltas are joined, skipping empty and choice-less chunks."""
+        pytest.importorskip("openai")
+        from yavs.ai.provider import OpenAIProvider
+
+        def chunk(content):
+            return Mock(choices=[Mock(delta=Mock(content=content))])
+
+        stream = MagicMock()
+        stream.__enter__.return_value = iter([chunk("Upgrade "), chunk(None), Mock(choices=[]), chunk("lodash")])
+
+        provider = OpenAIProvider()
+        provider.client = Mock()
+        provider.client.chat.completions.create.return_value = stream
+
+        assert provider.create_completion("p", 10, 0.0) == "Upgrade lodash"
+        assert provider.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+class TestSharedHttpClient:
+    """Tests for the connection pool shared across AI providers."""
+
+    def test_sync_client_is_shared(self):
+        """Test that every caller gets the same pooled client."""
+        pytest.importorskip("httpx")
+        from yavs.ai.provider import get_shared_http_client
+
+        assert get_shared_http_client() is get_shared_http_client()
+
+    def test_async_client_is_per_event_loop(self):
+        """Test that the async client is reused within a loop and closed afterwards."""
+        pytest.importorskip("httpx")
+        from yavs.ai.provider import (
+            close_shared_async_http_client,
+            get_shared_async_http_client,
+        )
+
+        async def use_client():
+            first = get_shared_async_http_client()
+            assert get_shared_async_http_client() is first
+            await close_shared_async_http_client()
+            return first
+
+        first_loop_client = asyncio.run(use_client())
+        assert first_loop_client.is_closed
+        assert asyncio.run(use_client()) is not first_loop_client
+
+
 class TestSummarizer:
     """Tests for AI Summarizer module."""
 
@@ -432,6 +902,7 @@ class TestTriageEngine:
         priorities = triage.get_top_priorities(findings, limit=2)
         # Secret finding should be prioritized higher
         assert len(priorities) == 2
+        assert priorities[0]["category"] == "secret"
 
     @patch('yavs.ai.triage.create_provider')
     def test_build_triage_prompt(self, mock_create_provider):
@@ -453,6 +924,28 @@ class TestTriageEngine:
         assert "Critical: 1" in prompt
         assert "High: 1" in prompt
 
+    @patch('yavs.ai.triage.create_provider')
+    def test_build_triage_prompt_lists_most_important_clusters(self, mock_create_provider):
+        """Test that the prompt shows the most severe and largest clusters, not the first inserted."""
+        mock_provider = Mock()
+        mock_provider.provider_name = "anthropic"
+        mock_provider.model_name = "claude-3-5-sonnet-20241022"
+        mock_create_provider.return_value = mock_provider
+
+        triage = TriageEngine()
+        findings = [
+            {"rule_id": f"LOW-{i}", "severity": "LOW", "category": "sast"}
+            for i in range(25)
+        ]
+        findings += [{"rule_id": "BIG-HIGH", "severity": "HIGH", "category": "sast"}] * 3
+        findings.append({"rule_id": "CVE-CRIT", "severity": "CRITICAL", "category": "dependency"})
+        clusters = triage._basic_clustering(findings)
+        prompt = triage._build_triage_prompt(findings, clusters)
+
+        assert prompt.count(", Severity: ") == 20
+        assert prompt.index("- CVE-CRIT:") < prompt.index("- BIG-HIGH: 3 findings")
+        assert prompt.index("- BIG-HIGH:") < prompt.index("- LOW-0:")
+
     @patch('yavs.ai.triage.create_provider')
     def test_get_provider_info(self, mock_create_provider):
         """Test getting provider information."""
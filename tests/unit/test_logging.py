@@ -1,7 +1,9 @@
 """Tests for logging utilities."""
 import pytest
+
 from yavs.utils.logging import LoggerMixin, configure_logging, get_logger, set_log_level
 
+
 class TestLoggerMixin:
     """Test LoggerMixin class."""
 
@@ -42,6 +44,22 @@ class TestConfigureLogging:
         configure_logging(config)
         # Should not raise
 
+    def test_configure_logging_quiet(self, monkeypatch):
+        """Test quiet mode raises the console log level to WARNING."""
+        import logging
+
+        import yavs.utils.logging as yavs_logging
+
+        monkeypatch.setattr(yavs_logging, "_logging_initialized", False)
+        root_logger = logging.getLogger()
+        monkeypatch.setattr(root_logger, "handlers", [])
+        monkeypatch.setattr(root_logger, "level", root_logger.level)
+
+        configure_logging({"level": "INFO"}, quiet=True)
+
+        assert root_logger.level == logging.WARNING
+        assert root_logger.handlers[0].level == logging.WARNING
+
 
 class TestGetLogger:
     """Test get_logger function."""
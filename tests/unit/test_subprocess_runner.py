@@ -7,6 +7,7 @@ import tempfile
 from yavs.utils.subprocess_runner import (
     run_command,
     check_tool_available,
+    terminate_running_commands,
     CommandExecutionError
 )
 
@@ -206,6 +207,26 @@ class TestEdgeCases:
         assert "line1" in stdout
         assert "line2" in stdout
 
+    def test_terminate_running_commands(self):
+        """Test that a command blocked in another thread is killed and returns."""
+        import threading
+        import time
+
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(run_command("sleep 30", timeout=60, check=False))
+        )
+        worker.start()
+
+        deadline = time.monotonic() + 5
+        while terminate_running_commands() == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        worker.join(5)
+
+        assert not worker.is_alive()
+        assert results[0][0] != 0
+        assert terminate_running_commands() == 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
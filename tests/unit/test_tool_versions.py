@@ -2,10 +2,12 @@
 
 import pytest
 from yavs.utils.tool_versions import (
+    get_installed_version,
     get_tested_version,
     get_version_range,
     is_version_compatible,
     get_pip_version_specifier,
+    parse_version_field,
     get_all_tools,
     get_tool_description,
     TOOL_VERSIONS
@@ -58,6 +60,40 @@ class TestGetTestedVersion:
         assert version_lower == version_upper == version_mixed
 
 
+class TestGetInstalledVersion:
+    """Test get_installed_version function."""
+
+    def test_installed_package(self):
+        """Test version of an installed package is returned."""
+        from importlib import metadata
+
+        assert get_installed_version("pytest") == metadata.version("pytest")
+
+    def test_missing_package(self):
+        """Test missing package returns None."""
+        assert get_installed_version("yavs-no-such-package") is None
+
+
+class TestParseVersionField:
+    """Test parse_version_field function."""
+
+    def test_trivy_output(self):
+        """Test version is taken from the first Version: line."""
+        output = (
+            "Version: 0.67.2\n"
+            "Vulnerability DB:\n"
+            "  Version: 2\n"
+            "  UpdatedAt: 2025-11-01 00:00:00 +0000 UTC\n"
+        )
+        assert parse_version_field(output) == "0.67.2"
+
+    def test_missing_or_empty_version(self):
+        """Test output without a usable Version: line returns None."""
+        assert parse_version_field("trivy 0.67.2\n") is None
+        assert parse_version_field("Version:   \n") is None
+        assert parse_version_field("") is None
+
+
 class TestGetVersionRange:
     """Test get_version_range function."""
 
@@ -115,6 +115,34 @@ class TestConfigLoading:
         assert "output" in config
         assert config["scan"]["directories"] == ["."]
 
+    def test_load_config_returns_independent_copies(self, tmp_path):
+        """Test that cached configs can be mutated by callers without leaking."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("scan:\n  directories: [src]\n")
+
+        first = load_config(config_file)
+        first["scan"]["directories"].append("mutated")
+
+        assert load_config(config_file)["scan"]["directories"] == ["src"]
+
+        default = load_config(tmp_path / "missing.yaml")
+        default["scan"]["directories"].append("mutated")
+        assert load_config(tmp_path / "missing.yaml")["scan"]["directories"] == ["."]
+
+    def test_load_config_reloads_modified_file(self, tmp_path):
+        """Test that a changed config file is re-parsed."""
+        import os
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("scan:\n  directories: [src]\n")
+        assert load_config(config_file)["scan"]["directories"] == ["src"]
+
+        config_file.write_text("scan:\n  directories: [lib]\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_config(config_file)["scan"]["directories"] == ["lib"]
+
     def test_load_config_without_path_uses_defaults(self):
         """Test loading config without specifying path."""
         config = load_config(None)
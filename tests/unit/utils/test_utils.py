@@ -13,6 +13,7 @@ from src.yavs.utils.metadata import extract_project_metadata
 from src.yavs.utils.schema_validator import validate_sarif
 from src.yavs.utils.path_utils import normalize_path, make_relative, is_file_in_directory, ensure_directory
 from src.yavs.utils.rule_links import get_rule_documentation_url, format_rule_link_html
+from src.yavs.utils import json_io
 
 
 class TestMetadataExtraction:
@@ -275,35 +276,93 @@ class TestRuleLinks:
         assert html == "N/A"
 
 
+class TestJsonIO:
+    """Tests for JSON output helpers."""
+
+    def test_write_json_round_trips(self, tmp_path):
+        """Test that written JSON loads back unchanged, with or without orjson."""
+        data = {"data": [{"file": "src/文件.py", "line": 3, "severity": "HIGH"}], "sbom": None}
+        output = tmp_path / "out.json"
+
+        json_io.write_json(data, output)
+
+        assert json.loads(output.read_text(encoding="utf-8")) == data
+
+    def test_write_json_stdlib_fallback(self, tmp_path):
+        """Test that the stdlib encoder is used when orjson is not installed."""
+        output = tmp_path / "out.json"
+
+        with patch.object(json_io, "_load_orjson", return_value=None):
+            json_io.write_json({"a": [1, 2]}, output)
+
+        assert output.read_text() == '{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+    def test_read_json_round_trips(self, tmp_path):
+        """Test that read_json loads what write_json wrote."""
+        data = [{"file": "src/文件.py", "line": 3, "severity": "HIGH"}]
+        output = tmp_path / "out.json"
+
+        json_io.write_json(data, output)
+
+        assert json_io.read_json(output) == data
+
+    def test_read_json_stdlib_fallback(self, tmp_path):
+        """Test that the stdlib decoder is used when orjson is not installed."""
+        output = tmp_path / "out.json"
+        output.write_text('{"score": NaN}')
+
+        with patch.object(json_io, "_load_orjson", return_value=None):
+            data = json_io.read_json(output)
+
+        assert data["score"] != data["score"]
+
+    def test_read_json_invalid(self, tmp_path):
+        """Test that invalid JSON raises the stdlib JSONDecodeError."""
+        output = tmp_path / "out.json"
+        output.write_text("{truncated")
+
+        with pytest.raises(json.JSONDecodeError):
+            json_io.read_json(output)
+
+    def test_atomic_open_keeps_original_on_failure(self, tmp_path):
+        """Test that a failed write leaves the previous file and no temporary file."""
+        output = tmp_path / "out.json"
+        output.write_text("previous")
+
+        with pytest.raises(RuntimeError):
+            with json_io.atomic_open(output) as f:
+                f.write("partial")
+                raise RuntimeError("write failed")
+
+        assert output.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [output]
+
+
 class TestSubprocessRunner:
     """Tests for subprocess runner utility."""
 
-    @patch('subprocess.run')
-    def test_run_command_success(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_run_command_success(self, mock_popen):
         """Test successful command execution."""
         from src.yavs.utils.subprocess_runner import run_command
 
-        mock_run.return_value = Mock(
-            stdout="success output",
-            stderr="",
-            returncode=0
-        )
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.communicate.return_value = ("success output", "")
+        proc.returncode = 0
 
         returncode, stdout, stderr = run_command("echo hello", timeout=30)
 
         assert returncode == 0
         assert "success output" in stdout
 
-    @patch('subprocess.run')
-    def test_run_command_failure(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_run_command_failure(self, mock_popen):
         """Test failed command execution."""
         from src.yavs.utils.subprocess_runner import run_command
 
-        mock_run.return_value = Mock(
-            stdout="",
-            stderr="error message",
-            returncode=1
-        )
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.communicate.return_value = ("", "error message")
+        proc.returncode = 1
 
         returncode, stdout, stderr = run_command("false", timeout=30, check=False)
 